@@ -0,0 +1 @@
+"""Microbenchmarks for the integrator, fitting and linear-solver kernels."""
@@ -0,0 +1,46 @@
+"""Timing harness: warm-up runs, repeated measurements and summary statistics."""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+
+def measure(func, warmup=1, repeats=5, max_seconds=10.0):
+    """Time func() after ``warmup`` untimed calls.
+
+    Stops repeating early once the timed runs exceed max_seconds (at least one
+    timed run is always made), so the largest sizes stay affordable.
+    Returns a dict with the raw times and their mean, median, min, max, stdev
+    and coefficient of variation (stdev / mean).
+    """
+    warmups_done = 0
+    for _ in range(warmup):
+        start = time.perf_counter()
+        func()
+        warmups_done += 1
+        if time.perf_counter() - start > max_seconds / 2:
+            break
+
+    times = []
+    budget_start = time.perf_counter()
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        if time.perf_counter() - budget_start > max_seconds:
+            break
+
+    mean = statistics.fmean(times)
+    stdev = statistics.stdev(times) if len(times) > 1 else 0.0
+    return {
+        "warmup": warmups_done,
+        "repeats": len(times),
+        "mean_s": mean,
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "max_s": max(times),
+        "stdev_s": stdev,
+        "cv": stdev / mean if mean > 0 else 0.0,
+        "times_s": times,
+    }
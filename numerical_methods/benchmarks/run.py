@@ -0,0 +1,117 @@
+"""Run the microbenchmark suite and write a JSON report to out/reports.
+
+Usage:
+    python -m numerical_methods.benchmarks.run [quick|full] [integrators] [fitting] [solvers]
+"""
+
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from numerical_methods.benchmarks.harness import measure
+from numerical_methods.benchmarks.suite import GROUPS
+from numerical_methods.paths import report_path
+from numerical_methods.utils import print_table
+
+# Problem sizes per profile ('full' covers 1e2-1e7 steps, degrees 2-50, 8-1e6 elements)
+PROFILES = {
+    "quick": {
+        "num_steps": [100, 1_000, 10_000],
+        "degrees": [2, 5, 10, 20],
+        "elements": [8, 64, 512],
+        "max_dense_nodes": 2_048,
+        "warmup": 1,
+        "repeats": 5,
+        "max_seconds": 2.0,
+        "max_case_seconds": 10.0,
+    },
+    "full": {
+        "num_steps": [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+        "degrees": [2, 5, 10, 20, 30, 40, 50],
+        "elements": [8, 64, 512, 4_096, 32_768, 262_144, 1_000_000],
+        "max_dense_nodes": 8_192,
+        "warmup": 2,
+        "repeats": 10,
+        "max_seconds": 30.0,
+        "max_case_seconds": 600.0,
+    },
+}
+profile = 'quick'
+
+
+def _estimate(previous, size, complexity):
+    # Extrapolate the mean time of the previous size of the same kernel
+    if previous is None:
+        return 0.0
+    prev_size, prev_mean = previous
+    return prev_mean * (size / prev_size) ** complexity
+
+
+def run_cases(cases, settings):
+    results = []
+    last = {}
+    for case in cases:
+        record = {"group": case.group, "kernel": case.kernel, case.size_name: case.size}
+        estimate = _estimate(last.get(case.kernel), case.size, case.complexity)
+        if case.skip is not None:
+            record["skipped"] = case.skip
+        elif estimate > settings["max_case_seconds"]:
+            record["skipped"] = (
+                f"estimated {estimate:.0f} s per run exceeds max_case_seconds={settings['max_case_seconds']:g}"
+            )
+        else:
+            func = case.setup()
+            record.update(measure(func, settings["warmup"], settings["repeats"], settings["max_seconds"]))
+            last[case.kernel] = (case.size, record["mean_s"])
+        results.append(record)
+    return results
+
+
+def main():
+    args = [a.lower() for a in sys.argv[1:]]
+    chosen_profile = profile
+    if args and args[0] in PROFILES:
+        chosen_profile = args.pop(0)
+    groups = args or list(GROUPS)
+    unknown = [g for g in groups if g not in GROUPS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark group(s): {unknown}. Choose from: {', '.join(GROUPS)}")
+
+    settings = PROFILES[chosen_profile]
+    results = []
+    for group in groups:
+        print(f"Running {group} benchmarks ({chosen_profile})...")
+        results.extend(run_cases(GROUPS[group](settings), settings))
+
+    rows = []
+    for r in results:
+        size = next(r[key] for key in ("num_steps", "degree", "n", "elements") if key in r)
+        if "skipped" in r:
+            rows.append((r["kernel"], size, "-", "-", "-", "skipped"))
+        else:
+            rows.append((r["kernel"], size, f"{r['mean_s']:.3e}", f"{r['min_s']:.3e}",
+                         f"{100 * r['cv']:.1f}%", r["repeats"]))
+    print()
+    print_table(["kernel", "size", "mean (s)", "min (s)", "cv", "repeats"], rows)
+
+    report = {
+        "profile": chosen_profile,
+        "settings": settings,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    out_path = report_path(f"benchmarks_{chosen_profile}_{int(time.time())}.json")
+    with open(out_path, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nReport written: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
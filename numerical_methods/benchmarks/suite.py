@@ -0,0 +1,157 @@
+"""Benchmark cases for each kernel group, built per size.
+
+Every case has a ``setup`` that builds its inputs and returns the function
+to time, so inputs are never part of the measurement.  ``complexity`` is the
+exponent p in time ~ size**p, used by the runner to skip sizes whose
+extrapolated run time exceeds the budget.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from contextlib import contextmanager
+
+import numpy as np
+
+from numerical_methods.fd import FD
+from numerical_methods.fea import fea1d
+from numerical_methods.fitting.lagrange import solve_lagrange
+from numerical_methods.fitting.leastsquares import solve_least_squares
+from numerical_methods.fitting.vandermonde import build_vandermonde, solve_vandermonde
+from numerical_methods.matrix import factorize, matrixsolver
+
+
+Case = namedtuple("Case", ["group", "kernel", "size_name", "size", "setup", "complexity", "skip"])
+
+
+def _dense_skip(n, max_dense_nodes):
+    if n <= max_dense_nodes:
+        return None
+    return f"dense {n}x{n} matrix ({8 * n * n / 1e9:.1f} GB) exceeds max_dense_nodes={max_dense_nodes}"
+
+
+# ---------------------------------------------------------------------------
+# fd/FD.py compute_* (fixed-step integrators on the ivp.py problem)
+# ---------------------------------------------------------------------------
+@contextmanager
+def _fd_num_steps(num_steps):
+    # compute_* read the module-level step h of FD.py (imported from ivp.py)
+    saved = FD.h
+    FD.h = (FD.xn - FD.x0) / num_steps
+    try:
+        yield
+    finally:
+        FD.h = saved
+
+
+def compute_functions():
+    """All fixed-step compute_* functions of fd/FD.py, by name."""
+    return {
+        name: getattr(FD, name)
+        for name in sorted(dir(FD))
+        if name.startswith("compute_") and name != "compute_adaptive" and callable(getattr(FD, name))
+    }
+
+
+def integrator_cases(settings):
+    cases = []
+    for name, compute in compute_functions().items():
+        for num_steps in settings["num_steps"]:
+            def setup(compute=compute, num_steps=num_steps):
+                def run():
+                    with _fd_num_steps(num_steps):
+                        compute()
+                return run
+
+            cases.append(Case("integrators", name, "num_steps", num_steps, setup, 1, None))
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Polynomial fitting
+# ---------------------------------------------------------------------------
+def _samples(count):
+    xs = np.linspace(0.0, 2.4, count)
+    return xs.tolist(), np.sin(2 * xs).tolist()
+
+
+def fitting_cases(settings):
+    cases = []
+    for p in settings["degrees"]:
+        def vandermonde_setup(p=p):
+            xs, ys = _samples(p + 1)
+            return lambda: solve_vandermonde(build_vandermonde(xs, p), ys)
+
+        def lagrange_setup(p=p):
+            xs, ys = _samples(p + 1)
+            return lambda: solve_lagrange(xs, ys, p=p)
+
+        def least_squares_setup(p=p):
+            xs, ys = _samples(2 * (p + 1))
+            return lambda: solve_least_squares(xs, ys, p)
+
+        cases.append(Case("fitting", "solve_vandermonde", "degree", p, vandermonde_setup, 3, None))
+        cases.append(Case("fitting", "solve_lagrange", "degree", p, lagrange_setup, 3, None))
+        cases.append(Case("fitting", "solve_least_squares", "degree", p, least_squares_setup, 3, None))
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Linear solves and 1-D FEA
+# ---------------------------------------------------------------------------
+def _stiffness_like(n):
+    # SPD tridiagonal matrix shaped like a 1-D stiffness matrix
+    A = 2.0 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    return A, np.ones(n)
+
+
+def _fea_bcs():
+    return fea1d._parse_bc("left_bc", fea1d.problem.left_bc), fea1d._parse_bc("right_bc", fea1d.problem.right_bc)
+
+
+def solver_cases(settings):
+    max_dense = settings["max_dense_nodes"]
+    cases = []
+    for n_el in settings["elements"]:
+        n_nodes = n_el + 1
+        skip = _dense_skip(n_nodes, max_dense)
+
+        def matrix_setup(n=n_el, structure="auto"):
+            A, C = _stiffness_like(n)
+            return lambda: matrixsolver(A, C, structure=structure)
+
+        def factorized_setup(n=n_el):
+            # repeated right-hand sides: factorize once outside the timing, time one solve
+            A, C = _stiffness_like(n)
+            factorization = factorize(A)
+            return lambda: factorization.solve(C)
+
+        def assemble_setup(n_el=n_el, banded=False):
+            nodes = np.linspace(fea1d.problem.x0, fea1d.problem.xn, n_el + 1)
+            return lambda: fea1d._assemble_system(nodes, None, banded=banded)
+
+        def reduce_setup(n_el=n_el, banded=False):
+            nodes = np.linspace(fea1d.problem.x0, fea1d.problem.xn, n_el + 1)
+            K, F, _ = fea1d._assemble_system(nodes, None, banded=banded)
+            left_bc, right_bc = _fea_bcs()
+            return lambda: fea1d._reduce_and_solve(K, F, left_bc, right_bc, banded=banded)
+
+        cases.append(Case("solvers", "matrixsolver", "n", n_el, matrix_setup, 2, _dense_skip(n_el, max_dense)))
+        cases.append(Case("solvers", "matrixsolver[general]", "n", n_el,
+                          lambda n=n_el: matrix_setup(n, "general"), 3, _dense_skip(n_el, max_dense)))
+        cases.append(Case("solvers", "Factorization.solve", "n", n_el, factorized_setup, 1,
+                          _dense_skip(n_el, max_dense)))
+        cases.append(Case("solvers", "fea1d._assemble_system", "elements", n_el, assemble_setup, 2, skip))
+        cases.append(Case("solvers", "fea1d._assemble_system[banded]", "elements", n_el,
+                          lambda n_el=n_el: assemble_setup(n_el, True), 1, None))
+        cases.append(Case("solvers", "fea1d._reduce_and_solve", "elements", n_el, reduce_setup, 3, skip))
+        cases.append(Case("solvers", "fea1d._reduce_and_solve[banded]", "elements", n_el,
+                          lambda n_el=n_el: reduce_setup(n_el, True), 1, None))
+    return cases
+
+
+GROUPS = {
+    "integrators": integrator_cases,
+    "fitting": fitting_cases,
+    "solvers": solver_cases,
+}
@@ -0,0 +1,87 @@
+"""Convergence study: observed order (EOC) of every method over m-refinement levels.
+
+Each (method, m) run integrates the ivp.py problem with h = h_base / 2**m in a
+worker process.  The error at xn is measured against a tight-tolerance DP54
+reference, and consecutive levels give the observed order
+
+    p_m = log2(e_{m-1} / e_m)      and error constant  C_m = e_m / h_m**p_m
+"""
+
+import csv
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+from numerical_methods.integrators.adaptive import integrate_adaptive
+from numerical_methods.integrators.dispatch import integrate_fixed, method_names
+from numerical_methods.integrators.rk import step_count
+from numerical_methods.paths import report_path
+from numerical_methods.problems.ivp import f, jac, x0, xn, y0
+from numerical_methods.utils import print_table
+
+# Methods to study (any key from integrate_fixed) and refinement levels m
+methods = method_names(unique=True)  # one entry per tableau: 'ral' would repeat 'rk22'
+levels = list(range(0, 7))
+h_base = 0.3  # h = h_base / 2**m, as in problems/ivp.py
+max_workers = None  # process pool size (None = number of CPUs)
+
+
+def _reference():
+    result = integrate_adaptive(f, x0, y0, xn, "dp54", rtol=1e-13, atol=1e-15)
+    return float(result["ys"][-1])
+
+
+def _run(method, m):
+    h = h_base / 2 ** m
+    num_steps = step_count(x0, xn, h)
+    _, ys = integrate_fixed(f, x0, y0, h, num_steps, method, jac=jac)
+    return method, m, h, num_steps, float(ys[-1])
+
+
+def convergence_table(results, y_ref):
+    """Rows (method, m, h, steps, error, EOC, C) from {(method, m): (h, steps, y_end)}."""
+    rows = []
+    for method in methods:
+        prev_err = None
+        for m in levels:
+            h, num_steps, y_end = results[(method, m)]
+            err = abs(y_end - y_ref)
+            if prev_err and err > 0:
+                order = math.log2(prev_err / err)
+                rows.append((method, m, h, num_steps, f"{err:.3e}", f"{order:.3f}", f"{err / h ** order:.3e}"))
+            else:
+                rows.append((method, m, h, num_steps, f"{err:.3e}", "-", "-"))
+            prev_err = err
+    return rows
+
+
+def main():
+    for m in levels:
+        h = h_base / 2 ** m
+        if abs(step_count(x0, xn, h) * h - (xn - x0)) > 1e-9:
+            raise ValueError(f"h = {h} (m={m}) does not divide [{x0}, {xn}] into whole steps.")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        reference = pool.submit(_reference)
+        jobs = [pool.submit(_run, method, m) for method in methods for m in levels]
+        results = {}
+        for job in jobs:
+            method, m, h, num_steps, y_end = job.result()
+            results[(method, m)] = (h, num_steps, y_end)
+        y_ref = reference.result()
+
+    headers = ["method", "m", "h", "steps", f"|error| at x={xn}", "EOC", "C"]
+    rows = convergence_table(results, y_ref)
+    print(f"Convergence study on problems/ivp.py (reference y({xn}) = {y_ref:.12f})")
+    print_table(headers, rows)
+
+    out_path = report_path("convergence.csv")
+    with open(out_path, mode="w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(headers)
+        for row in rows:
+            writer.writerow([f"{v:.6g}" if isinstance(v, float) else v for v in row])
+    print(f"\nReport written: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
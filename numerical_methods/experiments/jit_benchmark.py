@@ -0,0 +1,68 @@
+"""Benchmark the pure-Python and Numba backends on the stock problem files."""
+
+import json
+import time
+
+import numpy as np
+
+from numerical_methods.integrators.jit import HAS_NUMBA, integrate_backend
+from numerical_methods.integrators.systems import component_system
+from numerical_methods.paths import report_path
+from numerical_methods.problems import ivp, ivpshooting, ivpsystems
+from numerical_methods.utils import print_table
+
+step_counts = [1_000, 10_000, 100_000]
+methods = ['euler', 'rk4']
+repeats = 3
+
+
+def _stock_problems():
+    return [
+        ("ivp.py", ivp.f, ivp.x0, ivp.xn, ivp.y0),
+        ("ivpsystems.py", component_system(ivpsystems.f, ivpsystems.g), ivpsystems.t0, ivpsystems.tn,
+         np.array([ivpsystems.x0, ivpsystems.y0], dtype=float)),
+        ("ivpshooting.py", component_system(ivpshooting.f, ivpshooting.g), ivpshooting.t0, ivpshooting.tn,
+         np.array([ivpshooting.x0, ivpshooting.y0], dtype=float)),
+    ]
+
+
+def _best_time(f, t0, y0, h, num_steps, method, backend):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        integrate_backend(f, t0, y0, h, num_steps, method, backend)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    if not HAS_NUMBA:
+        print("Numba is not installed; the 'numba' backend falls back to pure Python (pip install numba).")
+
+    rows = []
+    records = []
+    for name, f, t0, tn, y0 in _stock_problems():
+        for method in methods:
+            # warm-up: triggers JIT compilation outside the timed runs
+            integrate_backend(f, t0, y0, (tn - t0) / 10, 10, method, "numba")
+            for num_steps in step_counts:
+                h = (tn - t0) / num_steps
+                t_py = _best_time(f, t0, y0, h, num_steps, method, "python")
+                t_jit = _best_time(f, t0, y0, h, num_steps, method, "numba")
+                rows.append((name, method, num_steps, t_py, t_jit, f"x{t_py / t_jit:.1f}"))
+                records.append({
+                    "problem": name, "method": method, "num_steps": num_steps,
+                    "python_s": t_py, "numba_s": t_jit, "speedup": t_py / t_jit,
+                })
+
+    print(f"JIT backend benchmark (best of {repeats})")
+    print_table(["problem", "method", "steps", "python (s)", "numba (s)", "speedup"], rows)
+
+    out_path = report_path("jit_benchmark.json")
+    with open(out_path, "w") as handle:
+        json.dump({"numba_available": HAS_NUMBA, "results": records}, handle, indent=2)
+    print(f"\nReport written: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
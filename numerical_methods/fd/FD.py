@@ -6,75 +6,64 @@
 import sys
 import csv
 
+from numerical_methods.integrators.adaptive import integrate_adaptive
+from numerical_methods.integrators.dispatch import integrate_fixed, method_names
+from numerical_methods.integrators.rk import step_count
 from numerical_methods.paths import csv_path
-from numerical_methods.problems.ivp import f, h, x0, xn, y0
+from numerical_methods.problems.ivp import adaptive_method, atol, backend, f, h, jac, rtol, x0, xn, y0
 from numerical_methods.utils import print_table
 
+def _compute(method):
+	num_steps = step_count(x0, xn, h)
+	xs, ys = integrate_fixed(f, x0, y0, h, num_steps, method, jac=jac, backend=backend)
+	return xs.tolist(), ys.tolist()
+
+
 def compute_euler():
-	x = x0
-	y = y0
-	xs = [x]
-	ys = [y]
-	num_steps = int(round((xn - x0) / h))
-	for n in range(1, num_steps + 1):
-		y = y + h * f(x, y)
-		x = x0 + n * h
-		xs.append(x)
-		ys.append(y)
-	return xs, ys
+	return _compute('euler')
 
 
 def compute_heun():
-	x = x0
-	y = y0
-	xs = [x]
-	ys = [y]
-	num_steps = int(round((xn - x0) / h))
-	for n in range(1, num_steps + 1):
-		yp = y + h * f(x, y)
-		x_next = x0 + n * h
-		yc_next = y + (h / 2) * (f(x, y) + f(x_next, yp))
-		x = x_next
-		y = yc_next
-		xs.append(x)
-		ys.append(y)
-	return xs, ys
+	return _compute('heun')
 
 
 def compute_rk22():
-	x = x0
-	y = y0
-	a1 = 1/3
-	a2 = 2/3
-	xs = [x]
-	ys = [y]
-	num_steps = int(round((xn - x0) / h))
-	for n in range(1, num_steps + 1):
-		k1 = h * f(x, y)
-		k2 = h * f(x + (3/4) * h, y + (3/4) * k1)
-		y = y + a1 * k1 + a2 * k2
-		x = x0 + n * h
-		xs.append(x)
-		ys.append(y)
-	return xs, ys
+	return _compute('rk22')
+
+
+def compute_rk3():
+	return _compute('rk3')
 
 
 def compute_rk4():
-	x = x0
-	y = y0
-	xs = [x]
-	ys = [y]
-	num_steps = int(round((xn - x0) / h))
-	for n in range(1, num_steps + 1):
-		k1 = h * f(x, y)
-		k2 = h * f(x + 0.5 * h, y + 0.5 * k1)
-		k3 = h * f(x + 0.5 * h, y + 0.5 * k2)
-		k4 = h * f(x + h, y + k3)
-		y = y + (1/6) * (k1 + 2 * k2 + 2 * k3 + k4)
-		x = x0 + n * h
-		xs.append(x)
-		ys.append(y)
-	return xs, ys
+	return _compute('rk4')
+
+
+def compute_backward_euler():
+	return _compute('backward_euler')
+
+
+def compute_trapezoidal():
+	return _compute('trapezoidal')
+
+
+def compute_bdf2():
+	return _compute('bdf2')
+
+
+def compute_ab4():
+	return _compute('ab4')
+
+
+def compute_abm4():
+	return _compute('abm4')
+
+
+def compute_adaptive(method=adaptive_method, rtol=rtol, atol=atol):
+	# Error-controlled steps: xs is non-uniform, stats has accepted/rejected/nfev
+	result = integrate_adaptive(f, x0, y0, xn, method, rtol=rtol, atol=atol)
+	stats = {key: result[key] for key in ('method', 'accepted', 'rejected', 'nfev')}
+	return result['ts'].tolist(), result['ys'].tolist(), stats
 
 
 def finite_differences(xs, ys):
@@ -113,16 +102,9 @@ def main():
 	if len(sys.argv) > 1:
 		method = sys.argv[1].lower()
 
-	if method == 'euler':
-		xs, ys = compute_euler()
-	elif method == 'heun':
-		xs, ys = compute_heun()
-	elif method == 'rk22':
-		xs, ys = compute_rk22()
-	elif method == 'rk4':
-		xs, ys = compute_rk4()
-	else:
-		raise ValueError('Unknown method. Choose euler, heun, rk22, or rk4')
+	if method not in method_names():
+		raise ValueError(f"Unknown method. Choose one of: {', '.join(method_names())}")
+	xs, ys = _compute(method)
 
 	rows = finite_differences(xs, ys)
 	headers = ["n", "x", "y", "dy/dx", "d2y/dx2", "method"]
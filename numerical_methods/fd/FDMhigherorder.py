@@ -1,39 +1,22 @@
-from numerical_methods.matrix import matrixsolver
-from numerical_methods.problems.ivphigherorder import a0, a1, a2, a3, a4, d2y0, dy0, f2, h, x0, xn, y0, y_actual
-import math
+from numerical_methods.matrix import solve_banded
+from numerical_methods.problems.ivphigherorder import a0, a1, a2, a3, h, left_bc, right_bc, x0, xn, y_actual
 import numpy as np
 import pandas as pd
 
-print(f"GE: {a3}y'' + {a2}y' + {a1}y = {a0}")
+NEUMANN_OPTIONS = (1, 2, 3)
+MAX_PRINT_ROWS = 60  # longer tables print their first and last rows only
 
 # Discretization
 def discrete_domain():
-    x = x0
-    ystr = ""
-    x_i = []
-    y_i = []
-    i = 0
-    while x <= xn + 1e-9:
-        ystr = "y"+str(i)
-        y_i.append(ystr)
-        x_i.append(x)
-        i += 1
-        x += h
-    print(f'Domain discretized:')
-    print(f'x_i = {x_i}')
-    print(f'y_i = {y_i}')
-    return x_i, y_i
-
-# CD methods
-def centraldiff1(y_before, y_after):
-    y_b, y_a = y_before, y_after
-    dy = (y_b - y_a) / (2*h)
-    return dy
-
-def centraldiff2(y_before, y_current, y_after):
-    y_b, y_c, y_a = y_before, y_current, y_after
-    d2y = (y_a - 2*y_c + y_b) / (h**2)
-    return d2y
+    # counter-based grid: x_i = x0 + i*h, no accumulated rounding
+    n = int(round((xn - x0) / h)) + 1
+    if n < 3:
+        raise ValueError(f"The grid needs at least 3 points, got {n} (x0={x0}, xn={xn}, h={h}).")
+    x_i = x0 + h * np.arange(n)
+    print(f'Domain discretized: {n} points, h = {h}')
+    if n <= MAX_PRINT_ROWS:
+        print(f'x_i = {x_i.tolist()}')
+    return x_i
 
 #coefficients
 def discrete_ge():
@@ -59,37 +42,105 @@ def discrete_ge():
     print(f'{a_before}y_(i-1) + {a_current}y_i + {a_after}y_(i+1) = {c}')
     return a_before, a_current, a_after, c
 
-def option(x, constant): #requires the constant term
-    if x==3:
-        a_current = 4
-        a_after = -1
-        a_before = 0
-        c = constant * 2*h + (3*y0) + dy0
-        """
-        Equation: (-3*y0 + 4*y1 - y2) / 2*h = dy0
-        """
-        print(f'{a_before}y0 + {a_current}y1 + {a_after}y2 = {c}')
-        return a_current, a_after, c
-    else:
-        return None, None, None
+def parse_bcs(name, raw):
+    # None, one condition dict, or a list of them -> list of (type, value, option)
+    if raw is None:
+        return []
+    raw_list = [raw] if isinstance(raw, dict) else list(raw)
+    bcs = []
+    for bc in raw_list:
+        if not isinstance(bc, dict) or "type" not in bc or "value" not in bc:
+            raise ValueError(f"{name} conditions must be dictionaries with 'type' and 'value'.")
+        kind = str(bc["type"]).strip().lower()
+        if kind not in {"dirichlet", "neumann"}:
+            raise ValueError(f"{name} type must be 'dirichlet' or 'neumann', got '{kind}'.")
+        opt = int(bc.get("option", 3))
+        if kind == "neumann" and opt not in NEUMANN_OPTIONS:
+            raise ValueError(f"{name} neumann option must be one of {NEUMANN_OPTIONS}, got {opt}.")
+        bcs.append((kind, float(bc["value"]), opt))
+    return bcs
+
+def option(bc, end, n, coeffs):
+    """
+    Equation row for one boundary condition at end 'left' (x0) or 'right' (xn):
+    returns ({node: coefficient}, constant).
+    Option 2 uses the differential equation at the boundary node with the ghost
+    node eliminated; option 3 is reduced to two nodes with the first interior
+    equation, so one condition per end keeps the system tridiagonal.
+    """
+    kind, value, opt = bc
+    a_b, a_c, a_a, c = coeffs
+    # node k steps into the domain from the boundary; s flips one-sided differences at xn
+    node, s = (lambda k: k, 1) if end == "left" else (lambda k: n - 1 - k, -1)
+    if kind == "dirichlet":
+        return {node(0): 1.0}, value
+    if opt == 1:
+        # (y1 - y0)/h = dy0  |  (y_n - y_(n-1))/h = dyn
+        return {node(0): -s, node(1): s}, h * value
+    if opt == 2:
+        # y_(-1) = y1 - 2h*dy0  |  y_(n+1) = y_(n-1) + 2h*dyn
+        if end == "left":
+            return {node(0): a_c, node(1): a_b + a_a}, c + 2 * h * value * a_b
+        return {node(0): a_c, node(1): a_b + a_a}, c - 2 * h * value * a_a
+    # (-3y0 + 4y1 - y2)/(2h) = dy0, plus (1/a_a) * [a_b*y0 + a_c*y1 + a_a*y2 = c] to drop y2
+    # (3y_n - 4y_(n-1) + y_(n-2))/(2h) = dyn, minus (1/a_b) * [equation at node n-1] to drop y_(n-2)
+    far = a_a if end == "left" else a_b
+    if far == 0:
+        raise ValueError("Neumann option 3 needs a nonzero off-diagonal coefficient; use option 1 or 2.")
+    near = a_b if end == "left" else a_a
+    return {node(0): -3 * s + s * near / far, node(1): 4 * s + s * a_c / far}, 2 * h * value + s * c / far
+
+def assemble_system(n, coeffs, left, right):
+    """
+    Central-difference system for n grid points in LAPACK band storage.
+    Unknowns are y_0..y_(n-1); boundary rows come first/last, so one condition
+    per end gives a tridiagonal matrix and two at one end a lower (or upper)
+    band of width 2 that is solved by marching.
+    Returns (ab, lower, upper, C).
+    """
+    if sorted(len(bcs) for bcs in (left, right)) not in ([1, 1], [0, 2]):
+        raise ValueError("Give two boundary conditions: one at each end, or both at the same end.")
+    for bcs in (left, right):
+        if len(bcs) == 2 and sorted(kind for kind, _, _ in bcs) != ["dirichlet", "neumann"]:
+            raise ValueError("Two conditions at the same end must be one dirichlet and one neumann.")
+    a_b, a_c, a_a, c = coeffs
+
+    # row of the interior equation at node i: shifted by one when both conditions sit at one end
+    shift = 1 if len(left) == 2 else (-1 if len(right) == 2 else 0)
+    C = np.full(n, c, dtype=float)
+
+    # boundary rows: (first row, direction) for x0 and xn; Dirichlet goes on the outer row
+    boundary = []
+    for bcs, first_row, step in [(left, 0, 1), (right, n - 1, -1)]:
+        ordered = sorted(bcs, key=lambda bc: bc[0] != "dirichlet")
+        end = "left" if step == 1 else "right"
+        for k, bc in enumerate(ordered):
+            row = first_row + step * k
+            entries, constant = option(bc, end, n, coeffs)
+            C[row] = constant
+            boundary.extend((row, col, value) for col, value in entries.items())
+
+    lower = max([shift + 1] + [row - col for row, col, _ in boundary])
+    upper = max([1 - shift] + [col - row for row, col, _ in boundary])
+    ab = np.zeros((lower + upper + 1, n))
+    # interior equations fill whole band rows: A[i + shift, i + d] sits in ab[upper + shift - d]
+    ab[upper + shift + 1, :n - 2] = a_b
+    ab[upper + shift, 1:n - 1] = a_c
+    ab[upper + shift - 1, 2:] = a_a
+    for row, col, value in boundary:
+        ab[upper + row - col, col] = value
+    return ab, lower, upper, C
 
 def errors(y_list):
-    y = y_list
-    if len(y) == len(y_actual):
-        error_list = []
-        for i, y_val in enumerate(y):
-            if y_actual[i] == 0:
-                error_calc = 0
-            else:
-                error_calc = abs(y_val - y_actual[i]) / (y_actual[i])
-            error_list.append(error_calc)
-        return error_list
-    else: 
+    if y_actual is None or len(y_list) != len(y_actual):
         return None
+    actual = np.asarray(y_actual, dtype=float)
+    safe_actual = np.where(actual == 0, 1.0, actual)
+    return np.where(actual == 0, 0.0, np.abs(np.asarray(y_list) - actual) / safe_actual)
 
 
 def printtable(x_i, y_i, y_actual, error_i):
-    if y_actual is None:
+    if y_actual is None or len(y_actual) != len(y_i):
         y_actual = [None] * len(y_i)
     if error_i is None:
         error_i = [None] * len(y_i)
@@ -102,60 +153,33 @@ def printtable(x_i, y_i, y_actual, error_i):
             "error_i": error_i,
         }
     )
-    print(table.to_string(index=False))
-
-
-x_i = []
-y_i = []
-x_i, y_i = discrete_domain()
-y_i = [y0] #reinitializing after discretizing
-
-#getting constants
-a_b, a_c, a_a, c = discrete_ge()
-# a_c1, a_a1, c1 = option(1, c)
-# a_c2, a_a2, c2 = option(2, c)
-# print(f"constant: {c}")
-a_c3, a_a3, c3 = option(3, a0)
-
-#for matrix
-A = []
-row1 = []
-row2 = []
-row3 = []
-row4 = []       #for 4x4
-# row5 = []     #for 5x5
-
-#A y1, y2, y3, y4 = y0
-row1 = [a_c3, a_a3, 0, 0] #option3
-row2 = [a_c, a_a, 0, 0]
-row3 = [a_b, a_c, a_a, 0]
-row4 = [0, a_b, a_c, a_a]
-
-A = [
-    row1, 
-    row2, 
-    row3, 
-    row4
-    ]
-# row5 = [0, 0, a_b, a_c, a_a]
-
-#C constants vector
-C = [c3 + y0,
-    a_b * y0,
-    c,
-    c #add one more c for 5x5
-    ]
-
-print("[A] = ")
-A_np = np.array(A, dtype=float)
-print(f'\n {A_np}')
-
-print(C)
-
-y_coeffs = matrixsolver(A, C)
-
-y_i.extend(y_coeffs.tolist())
-error_i = errors(y_i)
-# print(f'y_values: {y_i}')
-# print(f'errors: {error_i}')
-printtable(x_i, y_i, y_actual, error_i)
+    print(table.to_string(index=False, max_rows=MAX_PRINT_ROWS))
+
+
+def main():
+    print(f"GE: {a3}y'' + {a2}y' + {a1}y = {a0}")
+    x_i = discrete_domain()
+    n = len(x_i)
+
+    #getting constants
+    coeffs = discrete_ge()
+    left = parse_bcs("left_bc", left_bc)
+    right = parse_bcs("right_bc", right_bc)
+
+    ab, lower, upper, C = assemble_system(n, coeffs, left, right)
+    print(f"\n[A]: {n}x{n} banded, {lower} sub- and {upper} super-diagonal(s)")
+    if n <= 10:
+        A = np.zeros((n, n))
+        for j in range(n):
+            for i in range(max(0, j - upper), min(n, j + lower + 1)):
+                A[i, j] = ab[upper + i - j, j]
+        print(f'\n {A}')
+        print(C.tolist())
+
+    y_i = solve_banded(ab, lower, upper, C)
+    error_i = errors(y_i)
+    printtable(x_i, y_i, y_actual, error_i)
+
+
+if __name__ == "__main__":
+    main()
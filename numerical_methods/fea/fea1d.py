@@ -165,74 +165,114 @@ def _print_vector(title, vector):
     print(_format_array(vector))
 
 
-def _assemble_system(nodes, print_level):
-    node_count = len(nodes)
-    K = np.zeros((node_count, node_count), dtype=float)
-    F = np.zeros(node_count, dtype=float)
-    gauss_points = _gauss_rule(problem.quadrature_order)
-    element_summaries = []
-
-    for e in range(node_count - 1):
-        x1 = nodes[e]
-        x2 = nodes[e + 1]
-        length = x2 - x1
-        if length <= 0:
-            raise ValueError(f"Element {e} has non-positive length.")
-
-        J = length / 2.0
-        dN_dx = _shape_function_gradients(length)
-        ke = np.zeros((2, 2), dtype=float)
-        fe = np.zeros(2, dtype=float)
-        gauss_rows = []
-
-        for xi, weight in gauss_points:
-            N = _shape_functions(xi)
-            x_gp = N[0] * x1 + N[1] * x2
-            k_val = float(problem.k(x_gp))
-            c_val = float(problem.c(x_gp))
-            s_val = float(problem.s(x_gp))
-
-            stiffness_part = k_val * np.outer(dN_dx, dN_dx)
-            reaction_part = c_val * np.outer(N, N)
-            source_part = N * s_val
-
-            ke += (stiffness_part + reaction_part) * J * weight
-            fe += source_part * J * weight
-
-            if print_level == "verbose":
-                gauss_rows.append(
-                    (
-                        xi,
-                        x_gp,
-                        k_val,
-                        c_val,
-                        s_val,
-                    )
-                )
+def _evaluate_coefficient(func, x):
+    # one call on the whole array; constants broadcast, and scalar-only callables
+    # (math.* functions, branches on x) fall back to one call per point
+    try:
+        values = np.asarray(func(x), dtype=float)
+    except (TypeError, ValueError):
+        values = None
+    if values is None or values.shape not in {(), x.shape}:
+        values = np.array([float(func(point)) for point in x.ravel()], dtype=float).reshape(x.shape)
+    return np.broadcast_to(values, x.shape)
+
+
+def _element_arrays(nodes):
+    """Local matrices of all elements at once: ke (n_el, 2, 2), fe (n_el, 2) and Gauss point data."""
+    nodes = np.asarray(nodes, dtype=float)
+    lengths = np.diff(nodes)
+    bad = np.flatnonzero(lengths <= 0)
+    if bad.size:
+        raise ValueError(f"Element {bad[0]} has non-positive length.")
+
+    xi, weights = np.array(_gauss_rule(problem.quadrature_order), dtype=float).T
+    N = _shape_functions(xi).T  # (n_gp, 2)
+    dN_dx = _shape_function_gradients(lengths).T  # (n_el, 2)
+    J = lengths / 2.0
+
+    x_gp = N[:, 0] * nodes[:-1, None] + N[:, 1] * nodes[1:, None]  # (n_el, n_gp)
+    k_val = _evaluate_coefficient(problem.k, x_gp)
+    c_val = _evaluate_coefficient(problem.c, x_gp)
+    s_val = _evaluate_coefficient(problem.s, x_gp)
+
+    k_int = (k_val * weights).sum(axis=1) * J
+    NN = (N[:, :, None] * N[:, None, :]).reshape(len(xi), 4)  # outer(N, N) per Gauss point
+    ke = (c_val * weights * J[:, None]) @ NN
+    ke = ke.reshape(-1, 2, 2) + k_int[:, None, None] * dN_dx[:, :, None] * dN_dx[:, None, :]
+    fe = (s_val * weights * J[:, None]) @ N
+    return {
+        "lengths": lengths,
+        "ke": ke,
+        "fe": fe,
+        "xi": xi,
+        "x_gp": x_gp,
+        "k": k_val,
+        "c": c_val,
+        "s": s_val,
+    }
 
-        dofs = [e, e + 1]
-        for local_i, global_i in enumerate(dofs):
-            F[global_i] += fe[local_i]
-            for local_j, global_j in enumerate(dofs):
-                K[global_i, global_j] += ke[local_i, local_j]
 
-        slope = 0.0
-        physical_flux = 0.0
-        element_summaries.append(
+def _element_summaries(nodes, elements, print_level):
+    x = np.asarray(nodes, dtype=float).tolist()
+    lengths = elements["lengths"].tolist()
+    summaries = []
+    for e, (ke, fe) in enumerate(zip(elements["ke"], elements["fe"])):
+        gauss_rows = []
+        if print_level == "verbose":
+            gauss_rows = list(
+                zip(
+                    elements["xi"].tolist(),
+                    elements["x_gp"][e].tolist(),
+                    elements["k"][e].tolist(),
+                    elements["c"][e].tolist(),
+                    elements["s"][e].tolist(),
+                )
+            )
+        summaries.append(
             {
                 "index": e,
-                "nodes": dofs,
-                "x1": x1,
-                "x2": x2,
-                "length": length,
-                "ke": ke.copy(),
-                "fe": fe.copy(),
+                "nodes": [e, e + 1],
+                "x1": x[e],
+                "x2": x[e + 1],
+                "length": lengths[e],
+                "ke": ke,
+                "fe": fe,
                 "gauss_rows": gauss_rows,
-                "slope": slope,
-                "physical_flux": physical_flux,
+                "slope": 0.0,
+                "physical_flux": 0.0,
             }
         )
+    return summaries
+
+
+def _assemble_system(nodes, print_level, banded=False):
+    """Global K and F from the batched element matrices.
 
+    print_level: None skips the per-element summaries (assembly only)
+    banded: return K in LAPACK band storage (3, n) with one sub- and one
+    super-diagonal (see matrix.solve_banded) instead of a dense n x n array,
+    which is what keeps meshes of 1e6 elements in memory
+    """
+    node_count = len(nodes)
+    elements = _element_arrays(nodes)
+
+    # COO triplets of every local entry, summed into K with a single bincount
+    first = np.arange(node_count - 1)
+    dofs = np.stack([first, first + 1], axis=1)
+    rows = np.repeat(dofs, 2, axis=1).ravel()
+    cols = np.tile(dofs, 2).ravel()
+    if banded:
+        # A[i, j] sits in ab[1 + i - j, j]
+        flat = (1 + rows - cols) * node_count + cols
+        K = np.bincount(flat, weights=elements["ke"].ravel(), minlength=3 * node_count)
+        K = K.reshape(3, node_count)
+    else:
+        flat = rows * node_count + cols
+        K = np.bincount(flat, weights=elements["ke"].ravel(), minlength=node_count * node_count)
+        K = K.reshape(node_count, node_count)
+    F = np.bincount(dofs.ravel(), weights=elements["fe"].ravel(), minlength=node_count)
+
+    element_summaries = [] if print_level is None else _element_summaries(nodes, elements, print_level)
     return K, F, element_summaries
 
 
@@ -245,7 +285,11 @@ def _apply_neumann_bc(force_vector, left_bc, right_bc):
     return adjusted
 
 
-def _reduce_and_solve(K, F, left_bc, right_bc):
+def _reduce_and_solve(K, F, left_bc, right_bc, cache=None, banded=False):
+    # cache: optional FactorizationCache (key="content", since Kuu is rebuilt on every
+    # call) so load cases that share K factorize it only once
+    # banded: K is the (3, n) band storage from _assemble_system(..., banded=True); Kuu is
+    # then returned in band storage too and solved in O(n)
     node_count = len(F)
     prescribed = {}
     if left_bc.kind == "dirichlet":
@@ -263,21 +307,27 @@ def _reduce_and_solve(K, F, left_bc, right_bc):
     free_dofs = [dof for dof in all_dofs if dof not in prescribed]
 
     u_known = np.array([prescribed[dof] for dof in known_dofs], dtype=float)
-    Kuu = K[np.ix_(free_dofs, free_dofs)] if free_dofs else np.zeros((0, 0))
-    Fu = F[free_dofs].copy() if free_dofs else np.zeros(0)
+    if banded:
+        Kuu, Fu = _reduce_banded(K, F, prescribed)
+    else:
+        Kuu = K[np.ix_(free_dofs, free_dofs)] if free_dofs else np.zeros((0, 0))
+        Fu = F[free_dofs].copy() if free_dofs else np.zeros(0)
 
-    if known_dofs and free_dofs:
-        Kuk = K[np.ix_(free_dofs, known_dofs)]
-        Fu = Fu - Kuk @ u_known
+        if known_dofs and free_dofs:
+            Kuk = K[np.ix_(free_dofs, known_dofs)]
+            Fu = Fu - Kuk @ u_known
 
     full_solution = np.zeros(node_count, dtype=float)
     for dof, value in prescribed.items():
         full_solution[dof] = value
 
     if free_dofs:
-        solved_unknowns = np.array(matrixsolver(Kuu, Fu), dtype=float)
-        for index, dof in enumerate(free_dofs):
-            full_solution[dof] = solved_unknowns[index]
+        if banded:
+            solved = matrixsolver(Kuu, Fu, structure="banded", bands=(1, 1), cache=cache)
+        else:
+            solved = matrixsolver(Kuu, Fu, cache=cache)
+        solved_unknowns = np.array(solved, dtype=float)
+        full_solution[free_dofs] = solved_unknowns
     else:
         solved_unknowns = np.zeros(0)
 
@@ -292,8 +342,34 @@ def _reduce_and_solve(K, F, left_bc, right_bc):
     }
 
 
-def _compute_reactions(K_full, F_full, solution):
-    return K_full @ solution - F_full
+def _reduce_banded(K, F, prescribed):
+    # Dirichlet DOFs can only be the end nodes, so the free DOFs are one contiguous
+    # range: Kuu is a column slice of the band storage, and Kuk @ u_known only
+    # touches the first and last free rows
+    node_count = len(F)
+    first = 1 if 0 in prescribed else 0
+    stop = node_count - 1 if node_count - 1 in prescribed else node_count
+    Kuu = K[:, first:stop].copy()
+    Fu = F[first:stop].copy()
+    if Kuu.shape[1]:
+        # unused corners of the band storage (rows outside the reduced matrix)
+        Kuu[0, 0] = 0.0
+        Kuu[2, -1] = 0.0
+        if first:
+            Fu[0] -= K[2, 0] * prescribed[0]  # K[1, 0]
+        if stop < node_count:
+            Fu[-1] -= K[0, node_count - 1] * prescribed[node_count - 1]  # K[n-2, n-1]
+    return Kuu, Fu
+
+
+def _compute_reactions(K_full, F_full, solution, banded=False):
+    if not banded:
+        return K_full @ solution - F_full
+    # tridiagonal product from band storage: K[i, j] = K_full[1 + i - j, j]
+    product = K_full[1] * solution
+    product[:-1] += K_full[0, 1:] * solution[1:]
+    product[1:] += K_full[2, :-1] * solution[:-1]
+    return product - F_full
 
 
 def _build_mesh_rows(nodes, left_bc, right_bc):
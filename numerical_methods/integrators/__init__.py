@@ -0,0 +1 @@
+"""Shared ODE integration kernels used by the method scripts and drivers."""
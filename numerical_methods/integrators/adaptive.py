@@ -0,0 +1,157 @@
+"""Adaptive step-size integration with embedded Runge-Kutta pairs.
+
+The step is accepted when the scaled error norm
+
+    err = rms( e_i / (atol + rtol * max(|y_i|, |y_new_i|)) )
+
+is at most 1, and the next step is h * safety * err**(-1/(q+1)) with q the
+lower order of the pair (clamped between ``min_factor`` and ``max_factor``).
+The higher-order solution is propagated (local extrapolation).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from numerical_methods.integrators.events import EventTracker
+from numerical_methods.integrators.rk import rk_error, rk_step
+from numerical_methods.integrators.tableaux import get_tableau
+
+
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 5.0
+
+
+def _error_norm(err, y, y_new, rtol, atol):
+    scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+    return float(np.sqrt(np.mean(np.square(np.asarray(err) / scale))))
+
+
+def initial_step(f, t0, y0, tn, order, rtol, atol):
+    """Starting step from the size of y0 and f(t0, y0) (Hairer, Norsett & Wanner II.4)."""
+    f0 = np.asarray(f(t0, y0), dtype=float)
+    scale = atol + rtol * np.abs(y0)
+    d0 = np.sqrt(np.mean(np.square(y0 / scale)))
+    d1 = np.sqrt(np.mean(np.square(f0 / scale)))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h0 = min(h0, abs(tn - t0))
+
+    f1 = np.asarray(f(t0 + h0, y0 + h0 * f0), dtype=float)
+    d2 = np.sqrt(np.mean(np.square((f1 - f0) / scale))) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1.0 / (order + 1))
+    return min(100 * h0, h1, abs(tn - t0))
+
+
+def integrate_adaptive(
+    f,
+    t0,
+    y0,
+    tn,
+    method="dp54",
+    rtol=1e-6,
+    atol=1e-9,
+    h0=None,
+    h_max=None,
+    h_min=1e-12,
+    max_steps=100000,
+    events=None,
+):
+    """Integrate y' = f(t, y) from t0 to tn with error-controlled steps.
+
+    method: an embedded pair key ('heun_euler', 'bs32', 'dp54') or tableau
+    rtol, atol: relative/absolute tolerances on the local error
+    h0: optional first trial step (estimated when None)
+    events: optional event function g(t, y) or list of them (see events.py);
+    a terminal event ends the run at its root instead of at tn
+
+    Returns a dict with ``ts``, ``ys`` (accepted points, including t0), the
+    ``accepted`` and ``rejected`` step counts and ``nfev`` (evaluations of f),
+    plus ``t_events``, ``y_events`` and ``terminated`` when events are given.
+    """
+    tableau = get_tableau(method)
+    if not tableau.is_embedded:
+        raise ValueError(f"Method '{tableau.name}' has no embedded pair; use heun_euler, bs32, or dp54.")
+    if tn <= t0:
+        raise ValueError("tn must be greater than t0.")
+    if rtol <= 0 and atol <= 0:
+        raise ValueError("At least one of rtol and atol must be positive.")
+
+    exponent = -1.0 / (min(tableau.order, tableau.embedded_order) + 1)
+    h_max = abs(tn - t0) if h_max is None else h_max
+
+    t = float(t0)
+    y = np.asarray(y0, dtype=float)
+    nfev = 0
+    if h0 is None:
+        h = initial_step(f, t, y, tn, tableau.order, rtol, atol)
+        nfev += 2
+    else:
+        h = float(h0)
+    h = min(h, h_max)
+
+    ts = [t]
+    ys = [y]
+    accepted = 0
+    rejected = 0
+    k1 = None  # f(t, y) when already known (FSAL or a rejected attempt from t)
+    tracker = EventTracker(events, t, y) if events is not None else None
+
+    while t < tn:
+        if accepted + rejected >= max_steps:
+            raise RuntimeError(f"Adaptive integration exceeded max_steps={max_steps} before reaching tn.")
+        # land exactly on tn instead of overshooting it
+        if t + h >= tn or tn - (t + h) < h_min:
+            h = tn - t
+
+        y_new, k = rk_step(f, tableau, t, y, h, k1)
+        nfev += tableau.stages if k1 is None else tableau.stages - 1
+        err = _error_norm(rk_error(tableau, k, h), y, y_new, rtol, atol)
+
+        if err <= 1.0:
+            t_stage = t + tableau.c[-1] * h
+            t_new = tn if h == tn - t else t + h
+            k1 = k[-1] if tableau.fsal and t_stage == t_new else None
+            if tracker is not None:
+                def slopes():
+                    nonlocal k1, nfev
+                    if k1 is None:
+                        k1 = f(t_new, y_new)
+                        nfev += 1
+                    return np.asarray(k[0], dtype=float), np.asarray(k1, dtype=float)
+
+                hit = tracker.check(t, y, t_new, y_new, slopes)
+                if hit is not None:
+                    ts.append(hit[0])
+                    ys.append(hit[1])
+                    accepted += 1
+                    break
+            t = t_new
+            y = y_new
+            ts.append(t)
+            ys.append(y)
+            accepted += 1
+            factor = MAX_FACTOR if err == 0.0 else min(MAX_FACTOR, SAFETY * err ** exponent)
+        else:
+            rejected += 1
+            k1 = k[0]
+            factor = max(MIN_FACTOR, SAFETY * err ** exponent)
+            if h <= h_min:
+                raise RuntimeError(f"Step size fell below h_min={h_min} at t={t}.")
+
+        h = min(h_max, max(h_min, h * factor))
+
+    result = {
+        "ts": np.array(ts, dtype=float),
+        "ys": np.array(ys, dtype=float),
+        "accepted": accepted,
+        "rejected": rejected,
+        "nfev": nfev,
+        "method": tableau.name,
+    }
+    if tracker is not None:
+        result.update(tracker.results())
+    return result
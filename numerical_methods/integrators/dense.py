@@ -0,0 +1,125 @@
+"""Dense output: evaluate a step-by-step solution at arbitrary x values.
+
+On each step [t_n, t_n + h] the solution is extended by the cubic Hermite
+polynomial through (y_n, f_n) and (y_{n+1}, f_{n+1}):
+
+    y(t_n + theta*h) = h00*y_n + h10*h*f_n + h01*y_{n+1} + h11*h*f_{n+1}
+
+    h00 = (1 + 2 theta)(1 - theta)^2    h10 = theta (1 - theta)^2
+    h01 = theta^2 (3 - 2 theta)         h11 = theta^2 (theta - 1)
+
+The interpolant is third-order accurate and reproduces the stored values
+exactly at the step points, so checkpoints no longer need to be aligned with
+the integration grid.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from numerical_methods.integrators.rk import rk_step
+from numerical_methods.integrators.tableaux import get_tableau
+
+
+def _hermite_weights(theta):
+    theta2 = theta * theta
+    one_minus = 1.0 - theta
+    h00 = (1.0 + 2.0 * theta) * one_minus * one_minus
+    h10 = theta * one_minus * one_minus
+    h01 = theta2 * (3.0 - 2.0 * theta)
+    h11 = theta2 * (theta - 1.0)
+    return h00, h10, h01, h11
+
+
+def hermite_step(t, h, y, f_start, y_next, f_end, t_query):
+    """Evaluate the cubic Hermite interpolant of a single step at t_query."""
+    theta = (t_query - t) / h
+    h00, h10, h01, h11 = _hermite_weights(theta)
+    return h00 * y + (h10 * h) * f_start + h01 * y_next + (h11 * h) * f_end
+
+
+class HermiteInterpolant:
+    """Piecewise cubic Hermite interpolant through stored points (ts, ys) with slopes fs.
+
+    Call it with a scalar or array of x values inside [ts[0], ts[-1]]; the
+    result has shape x.shape + y.shape.
+    """
+
+    def __init__(self, ts, ys, fs):
+        self.ts = np.asarray(ts, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        self.fs = np.asarray(fs, dtype=float)
+        if len(self.ts) < 2:
+            raise ValueError("Dense output needs at least two solution points.")
+        if self.ys.shape != self.fs.shape or self.ys.shape[0] != self.ts.shape[0]:
+            raise ValueError("ts, ys and fs must describe the same number of points.")
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        t_lo, t_hi = self.ts[0], self.ts[-1]
+        span_tol = 1e-9 * max(1.0, abs(t_hi - t_lo))
+        if np.any(x < t_lo - span_tol) or np.any(x > t_hi + span_tol):
+            raise ValueError(f"Dense output requested outside the solved interval [{t_lo}, {t_hi}].")
+
+        idx = np.clip(np.searchsorted(self.ts, x, side="right") - 1, 0, len(self.ts) - 2)
+        t = self.ts[idx]
+        h = self.ts[idx + 1] - t
+        theta = (x - t) / h
+        # broadcast the weights across the state dimensions of vector problems
+        theta = theta.reshape(theta.shape + (1,) * (self.ys.ndim - 1))
+        h = h.reshape(theta.shape)
+        h00, h10, h01, h11 = _hermite_weights(theta)
+        return (
+            h00 * self.ys[idx]
+            + (h10 * h) * self.fs[idx]
+            + h01 * self.ys[idx + 1]
+            + (h11 * h) * self.fs[idx + 1]
+        )
+
+
+def hermite_from_trajectory(f, ts, ys):
+    """Build a HermiteInterpolant for a stored trajectory, evaluating f at each point."""
+    ys = np.asarray(ys, dtype=float)
+    fs = np.array([f(t, y) for t, y in zip(ts, ys)], dtype=float).reshape(ys.shape)
+    return HermiteInterpolant(ts, ys, fs)
+
+
+def integrate_at(f, t0, y0, h, num_steps, t_eval, method="rk4"):
+    """Integrate with fixed steps and return the solution only at the points t_eval.
+
+    The trajectory is not stored: each step is interpolated on the fly for the
+    t_eval values it covers, so h can be much larger than the output spacing.
+    Only explicit tableau methods are supported (their first stage is f(t_n, y_n)).
+
+    Returns an array of shape (len(t_eval),) + shape(y0).
+    """
+    tableau = get_tableau(method)
+    t_eval = np.asarray(t_eval, dtype=float)
+    if np.any(np.diff(t_eval) < 0):
+        raise ValueError("t_eval must be sorted in increasing order.")
+    tn = t0 + num_steps * h
+    if t_eval.size and (t_eval[0] < t0 - 1e-12 or t_eval[-1] > tn + 1e-9 * max(1.0, abs(tn))):
+        raise ValueError(f"t_eval must lie inside [{t0}, {tn}].")
+
+    y = np.asarray(y0, dtype=float)
+    out = np.empty(t_eval.shape + y.shape, dtype=float)
+    j = 0
+    while j < t_eval.size and t_eval[j] <= t0:
+        out[j] = y
+        j += 1
+
+    for n in range(num_steps):
+        if j >= t_eval.size:
+            break
+        t = t0 + n * h
+        t_next = t0 + (n + 1) * h
+        y_next, k = rk_step(f, tableau, t, y, h)
+        last = n == num_steps - 1
+        if t_eval[j] <= t_next or last:
+            f_end = f(t_next, y_next)
+            while j < t_eval.size and (t_eval[j] <= t_next or last):
+                out[j] = hermite_step(t, h, y, k[0], y_next, f_end, t_eval[j])
+                j += 1
+        y = y_next
+
+    return out
@@ -0,0 +1,63 @@
+"""Single entry point for fixed-step integration with any registered method key."""
+
+from __future__ import annotations
+
+from numerical_methods.integrators.implicit import IMPLICIT_METHODS, IMPLICIT_ORDERS, integrate_implicit, iter_implicit
+from numerical_methods.integrators.jit import integrate_backend
+from numerical_methods.integrators.multistep import MULTISTEP_METHODS, integrate_multistep, iter_multistep
+from numerical_methods.integrators.rk import iter_steps
+from numerical_methods.integrators.tableaux import TABLEAUX, get_tableau
+
+
+def method_names(unique=False):
+    """All method keys accepted by integrate_fixed (explicit tableaux, implicit and multistep methods).
+
+    unique=True lists each tableau once, under its canonical name, dropping
+    aliases such as 'ral' for 'rk22'.
+    """
+    explicit = sorted({tableau.name for tableau in TABLEAUX.values()}) if unique else sorted(TABLEAUX)
+    return explicit + list(IMPLICIT_METHODS) + list(MULTISTEP_METHODS)
+
+
+def method_order(method):
+    """Nominal order of accuracy p of a method key (global error O(h**p))."""
+    key = str(method).strip().lower()
+    if key in IMPLICIT_METHODS:
+        return IMPLICIT_ORDERS[key]
+    if key in MULTISTEP_METHODS:
+        return int(key.lstrip("abm"))
+    return get_tableau(key).order
+
+
+def integrate_fixed(f, t0, y0, h, num_steps, method="rk4", jac=None, backend="python"):
+    """Integrate y' = f(t, y) for num_steps steps of size h with the named method.
+
+    Explicit methods use the Butcher-tableau engine, JIT-compiled when
+    backend='numba'; 'backward_euler', 'trapezoidal' and 'bdf2' use Newton
+    iterations with ``jac`` (or a finite-difference Jacobian); 'ab2'..'ab5'
+    and 'abm2'..'abm5' are Adams multistep methods.
+    Returns (ts, ys) as NumPy arrays.
+    """
+    key = str(method).strip().lower()
+    if key in IMPLICIT_METHODS:
+        return integrate_implicit(f, t0, y0, h, num_steps, key, jac=jac)
+    if key in MULTISTEP_METHODS:
+        return integrate_multistep(f, t0, y0, h, num_steps, key)
+    return integrate_backend(f, t0, y0, h, num_steps, key, backend)
+
+
+def iter_fixed(f, t0, y0, h, num_steps, method="rk4", jac=None):
+    """Stream Step(n, t, y, k) tuples for any method key with O(1) memory.
+
+    Example: stop as soon as y changes sign::
+
+        for step in iter_fixed(f, x0, y0, h, num_steps, 'rk4'):
+            if step.y < 0:
+                break
+    """
+    key = str(method).strip().lower()
+    if key in IMPLICIT_METHODS:
+        return iter_implicit(f, t0, y0, h, num_steps, key, jac=jac)
+    if key in MULTISTEP_METHODS:
+        return iter_multistep(f, t0, y0, h, num_steps, key)
+    return iter_steps(f, t0, y0, h, num_steps, key)
@@ -0,0 +1,64 @@
+"""Batched (ensemble) integration of many initial conditions in one step loop."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from numerical_methods.integrators.kernels import vectorize_math
+from numerical_methods.integrators.rk import integrate
+
+
+def _batched_rhs(f, params):
+    if params is None:
+        return f
+    params = np.asarray(params, dtype=float)
+
+    def rhs(t, y):
+        return f(t, y, params)
+
+    return rhs
+
+
+def integrate_ensemble(f, t0, y0s, h, num_steps, method="rk4", params=None):
+    """Integrate a whole batch of initial conditions with one fixed-step loop.
+
+    f: right-hand side f(t, Y) (or f(t, Y, params) when params is given) that
+       accepts a state array of shape (batch,) or (batch, dim) and returns the
+       same shape. Functions that call ``math.*`` on Y are rewritten to NumPy
+       with :func:`kernels.vectorize_math` when possible.
+    y0s: initial states, shape (batch,) for scalar IVPs or (batch, dim) for systems
+    params: optional per-member parameters, shape (batch,) or (batch, p), passed
+       through to f unchanged on every stage
+
+    Returns (ts, ys) with ys of shape (num_steps + 1, batch) or
+    (num_steps + 1, batch, dim).
+    """
+    Y0 = np.array(y0s, dtype=float)
+    if Y0.ndim not in (1, 2):
+        raise ValueError(f"y0s must have shape (batch,) or (batch, dim), got {Y0.shape}")
+    if params is not None and np.shape(params)[0] != Y0.shape[0]:
+        raise ValueError(
+            f"params must have one entry per ensemble member ({Y0.shape[0]}), "
+            f"got shape {np.shape(params)}"
+        )
+
+    rhs = _batched_rhs(f, params)
+    try:
+        probe = np.asarray(rhs(t0, Y0))
+    except TypeError as exc:
+        try:
+            rhs = _batched_rhs(vectorize_math(f), params)
+            probe = np.asarray(rhs(t0, Y0))
+        except (TypeError, ValueError, NameError):
+            raise TypeError(
+                "f must accept NumPy state arrays for ensemble integration "
+                "(replace math.* calls on the state with numpy equivalents)."
+            ) from exc
+    try:
+        out_shape = np.broadcast_shapes(probe.shape, Y0.shape)
+    except ValueError:
+        out_shape = None
+    if out_shape != Y0.shape:
+        raise ValueError(f"f returned shape {probe.shape} for a state of shape {Y0.shape}")
+
+    return integrate(rhs, t0, Y0, h, num_steps, method)
@@ -0,0 +1,143 @@
+"""Implicit one- and two-step integrators for stiff IVPs.
+
+Each step solves a nonlinear equation of the form
+
+    z = known + h*beta*f(t_next, z)
+
+for z = y_{n+1} with Newton's method.  The Jacobian df/dy is either supplied
+by the user (``jac(t, y)``) or approximated by forward differences, and is
+held fixed for all Newton iterations of a step (simplified Newton).
+
+    backward_euler: known = y_n,                        beta = 1
+    trapezoidal:    known = y_n + (h/2)*f(t_n, y_n),     beta = 1/2
+    bdf2:           known = (4/3)*y_n - (1/3)*y_{n-1},   beta = 2/3
+                    (first step bootstrapped with the trapezoidal rule)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from numerical_methods.integrators.rk import Step
+
+
+IMPLICIT_METHODS = ("backward_euler", "trapezoidal", "bdf2")
+IMPLICIT_ORDERS = {"backward_euler": 1, "trapezoidal": 2, "bdf2": 2}
+
+NEWTON_TOL = 1e-10
+NEWTON_MAX_ITER = 50
+
+
+def fd_jacobian(f, t, y, fy=None):
+    """Forward-difference approximation of df/dy at (t, y) for a 1-D state y."""
+    y = np.asarray(y, dtype=float)
+    if fy is None:
+        fy = np.asarray(f(t, y), dtype=float)
+    n = y.shape[0]
+    J = np.empty((n, n), dtype=float)
+    sqrt_eps = np.sqrt(np.finfo(float).eps)
+    for j in range(n):
+        delta = sqrt_eps * max(1.0, abs(y[j]))
+        y_pert = y.copy()
+        y_pert[j] += delta
+        J[:, j] = (np.asarray(f(t, y_pert), dtype=float) - fy) / delta
+    return J
+
+
+def newton_solve(f, jac, t_next, known, h_beta, z0, tol=NEWTON_TOL, max_iter=NEWTON_MAX_ITER):
+    """Solve z - known - h_beta*f(t_next, z) = 0 for z, starting from z0.
+
+    Returns (z, iterations).  Raises RuntimeError if Newton does not converge.
+    """
+    z = np.array(z0, dtype=float)
+    fz = np.asarray(f(t_next, z), dtype=float)
+    J = jac(t_next, z) if jac is not None else fd_jacobian(f, t_next, z, fz)
+    J = np.atleast_2d(np.asarray(J, dtype=float))
+    M = np.eye(z.shape[0]) - h_beta * J
+
+    for iteration in range(1, max_iter + 1):
+        residual = z - known - h_beta * fz
+        dz = np.linalg.solve(M, -residual)
+        z = z + dz
+        if np.linalg.norm(dz) <= tol * (1.0 + np.linalg.norm(z)):
+            return z, iteration
+        fz = np.asarray(f(t_next, z), dtype=float)
+
+    raise RuntimeError(f"Newton iteration did not converge at t={t_next} after {max_iter} iterations.")
+
+
+def _vector_form(f, jac, scalar):
+    # Scalar problems (ivp.py) are solved as 1-element vectors but f and jac
+    # still receive/return plain scalars.
+    if not scalar:
+        return f, jac
+
+    def f_vec(t, z):
+        return np.atleast_1d(np.asarray(f(t, z[0]), dtype=float))
+
+    jac_vec = None
+    if jac is not None:
+        def jac_vec(t, z):
+            return np.atleast_2d(np.asarray(jac(t, z[0]), dtype=float))
+
+    return f_vec, jac_vec
+
+
+def _check_method(method):
+    method = str(method).strip().lower()
+    if method not in IMPLICIT_METHODS:
+        raise ValueError(f"Unknown implicit method '{method}'. Choose one of: {', '.join(IMPLICIT_METHODS)}")
+    return method
+
+
+def iter_implicit(f, t0, y0, h, num_steps, method="backward_euler", jac=None,
+                  tol=NEWTON_TOL, max_iter=NEWTON_MAX_ITER):
+    """Yield Step(n, t, y, None) for an implicit method, keeping at most two states.
+
+    States are yielded with the shape of y0 (plain scalars stay 0-d).
+    """
+    method = _check_method(method)
+    y_start = np.asarray(y0, dtype=float)
+    scalar = y_start.ndim == 0
+    f_vec, jac_vec = _vector_form(f, jac, scalar)
+
+    def _out(z):
+        return z[0] if scalar else z.reshape(y_start.shape)
+
+    y = np.atleast_1d(y_start).astype(float).ravel()
+    y_prev = None
+    yield Step(0, t0, _out(y), None)
+
+    for n in range(num_steps):
+        t = t0 + n * h
+        t_next = t0 + (n + 1) * h
+        f_n = np.asarray(f_vec(t, y), dtype=float)
+        guess = y + h * f_n  # explicit Euler predictor
+
+        if method == "backward_euler":
+            known, beta = y, 1.0
+        elif method == "trapezoidal" or y_prev is None:
+            known, beta = y + (h / 2) * f_n, 0.5
+        else:
+            known, beta = (4 / 3) * y - (1 / 3) * y_prev, 2 / 3
+
+        y_next, _ = newton_solve(f_vec, jac_vec, t_next, known, h * beta, guess, tol, max_iter)
+        y_prev, y = y, y_next
+        yield Step(n + 1, t_next, _out(y), None)
+
+
+def integrate_implicit(f, t0, y0, h, num_steps, method="backward_euler", jac=None,
+                       tol=NEWTON_TOL, max_iter=NEWTON_MAX_ITER):
+    """Integrate y' = f(t, y) with an implicit method and fixed step h.
+
+    method: 'backward_euler', 'trapezoidal' or 'bdf2'
+    jac: optional Jacobian df/dy(t, y); a finite-difference Jacobian is used when None
+
+    Returns (ts, ys) with the same shapes as ``rk.integrate``.
+    """
+    y_start = np.asarray(y0, dtype=float)
+    ts = t0 + h * np.arange(num_steps + 1)
+    ys = np.empty((num_steps + 1,) + y_start.shape, dtype=float)
+    for step in iter_implicit(f, t0, y_start, h, num_steps, method, jac, tol, max_iter):
+        ys[step.n] = step.y
+    return ts, ys
@@ -0,0 +1,52 @@
+"""Call counting and timing for problem functions (f, g, F).
+
+Evaluating the user right-hand side is the dominant cost of every integrator,
+so the drivers wrap it in :class:`CountedFunction` and print the per-method
+totals next to their result tables.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+
+
+COST_HEADERS = ["method", "calls", "calls/step", "time in f (s)", "us/call"]
+
+
+class CountedFunction:
+    """Wrap a function, counting its calls and the cumulative time spent inside it."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+        self.seconds = 0.0
+        functools.update_wrapper(self, func)
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.func(*args)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.calls += 1
+
+    def reset(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+
+def cost_rows(counters, num_steps):
+    """Rows matching COST_HEADERS for {label: CountedFunction or list of them}.
+
+    A list (e.g. the f and g of a system) is reported as the sum of its members.
+    """
+    rows = []
+    for label, counted in counters.items():
+        members = counted if isinstance(counted, (list, tuple)) else [counted]
+        calls = sum(c.calls for c in members)
+        seconds = sum(c.seconds for c in members)
+        per_step = calls / num_steps if num_steps else 0.0
+        per_call = 1e6 * seconds / calls if calls else 0.0
+        rows.append((label, calls, f"{per_step:.2f}", f"{seconds:.6f}", f"{per_call:.2f}"))
+    return rows
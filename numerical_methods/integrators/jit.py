@@ -0,0 +1,160 @@
+"""Optional JIT-compiled backend for the fixed-step explicit RK loop.
+
+When Numba is installed, ``integrate_jit`` compiles both the user right-hand
+side and the tableau-driven step loop, removing the interpreter overhead of
+calling f once per stage.  Without Numba, or when f cannot be compiled (for
+example because it calls Python-only code), it falls back to the pure-Python
+engine in ``rk.integrate`` with a warning.  Right-hand sides written with the
+``math`` module, like the stock problem files, compile as-is.
+"""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+
+from numerical_methods.integrators.rk import integrate
+from numerical_methods.integrators.tableaux import get_tableau
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
+
+BACKENDS = ("python", "numba")
+
+_LOOPS = {}
+_COMPILED_RHS = {}
+
+
+def _tableau_arrays(tableau):
+    s = tableau.stages
+    A = np.zeros((s, s), dtype=float)
+    for i, row in enumerate(tableau.a):
+        A[i, :len(row)] = row
+    return np.array(tableau.c, dtype=float), A, np.array(tableau.b, dtype=float)
+
+
+def _build_loops():
+    # Compiled lazily so importing this module never pays the Numba start-up cost.
+    @numba.njit
+    def scalar_loop(f, t0, y0, h, num_steps, c, A, b, ys):
+        s = c.shape[0]
+        k = np.empty(s)
+        y = y0
+        ys[0] = y
+        for n in range(num_steps):
+            t = t0 + n * h
+            for i in range(s):
+                y_stage = y
+                for j in range(i):
+                    if A[i, j] != 0.0:
+                        y_stage += (h * A[i, j]) * k[j]
+                k[i] = f(t + c[i] * h, y_stage)
+            for i in range(s):
+                if b[i] != 0.0:
+                    y += (h * b[i]) * k[i]
+            ys[n + 1] = y
+
+    @numba.njit
+    def vector_loop(f, t0, y0, h, num_steps, c, A, b, ys):
+        s = c.shape[0]
+        dim = y0.shape[0]
+        k = np.empty((s, dim))
+        y = y0.copy()
+        ys[0] = y
+        for n in range(num_steps):
+            t = t0 + n * h
+            for i in range(s):
+                y_stage = y.copy()
+                for j in range(i):
+                    if A[i, j] != 0.0:
+                        y_stage += (h * A[i, j]) * k[j]
+                k[i] = f(t + c[i] * h, y_stage)
+            for i in range(s):
+                if b[i] != 0.0:
+                    y += (h * b[i]) * k[i]
+            ys[n + 1] = y
+
+    _LOOPS["scalar"] = scalar_loop
+    _LOOPS["vector"] = vector_loop
+
+
+def compile_rhs(f):
+    """Return a Numba-compiled version of f (cached per function object)."""
+    if not HAS_NUMBA:
+        raise ImportError("Numba is required for the 'numba' backend (pip install numba).")
+    if f not in _COMPILED_RHS:
+        _COMPILED_RHS[f] = f if isinstance(f, numba.core.registry.CPUDispatcher) else numba.njit(f)
+    return _COMPILED_RHS[f]
+
+
+def _compile_component_system(components):
+    # component_system(f, g, ...) closes over plain Python functions, which Numba
+    # cannot call; generate an equivalent F(t, Y) over the compiled components.
+    jitted = [compile_rhs(func) for func in components]
+    args = ", ".join(f"Y[{i}]" for i in range(len(jitted)))
+    lines = ["def F(t, Y):", f"    out = np.empty({len(jitted)})"]
+    lines += [f"    out[{i}] = c{i}({args}, t)" for i in range(len(jitted))]
+    lines.append("    return out")
+    namespace = {"np": np}
+    namespace.update({f"c{i}": func for i, func in enumerate(jitted)})
+    exec("\n".join(lines), namespace)
+    return numba.njit(namespace["F"])
+
+
+def integrate_jit(f, t0, y0, h, num_steps, method="rk4"):
+    """JIT-compiled equivalent of ``rk.integrate`` for explicit tableau methods.
+
+    Falls back to the pure-Python engine when Numba is missing or f does not compile.
+    Returns (ts, ys) exactly like ``rk.integrate``.
+    """
+    tableau = get_tableau(method)
+    if not HAS_NUMBA:
+        warnings.warn("Numba is not installed; using the pure-Python integrator.", RuntimeWarning, stacklevel=2)
+        return integrate(f, t0, y0, h, num_steps, tableau)
+
+    y_start = np.asarray(y0, dtype=float)
+    if y_start.ndim > 1:
+        return integrate(f, t0, y0, h, num_steps, tableau)
+    if not _LOOPS:
+        _build_loops()
+
+    c, A, b = _tableau_arrays(tableau)
+    ts = t0 + h * np.arange(num_steps + 1)
+    ys = np.empty((num_steps + 1,) + y_start.shape, dtype=float)
+    try:
+        components = getattr(f, "components", None)
+        if components is not None:
+            if f not in _COMPILED_RHS:
+                _COMPILED_RHS[f] = _compile_component_system(components)
+            f_jit = _COMPILED_RHS[f]
+        else:
+            f_jit = compile_rhs(f)
+        if y_start.ndim == 0:
+            _LOOPS["scalar"](f_jit, float(t0), float(y_start), float(h), int(num_steps), c, A, b, ys)
+        else:
+            _LOOPS["vector"](f_jit, float(t0), y_start, float(h), int(num_steps), c, A, b, ys)
+    except Exception as exc:  # any compile failure, not only NumbaError subclasses
+        warnings.warn(
+            f"Could not JIT-compile f ({type(exc).__name__}); using the pure-Python integrator.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        _COMPILED_RHS.pop(f, None)
+        return integrate(f, t0, y0, h, num_steps, tableau)
+    return ts, ys
+
+
+def integrate_backend(f, t0, y0, h, num_steps, method="rk4", backend="python"):
+    """Dispatch a fixed-step explicit integration to the selected backend."""
+    backend = str(backend).strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Choose one of: {', '.join(BACKENDS)}")
+    if backend == "numba":
+        return integrate_jit(f, t0, y0, h, num_steps, method)
+    return integrate(f, t0, y0, h, num_steps, method)
@@ -0,0 +1,397 @@
+"""Vectorized NumPy kernels for problem right-hand sides.
+
+The stock problem files write f with the ``math`` module, which only accepts
+Python scalars.  This module provides two ways to obtain array-valued kernels
+that ensemble, implicit and JIT paths can evaluate on whole arrays:
+
+* :func:`expression_rhs` / :func:`expression_system` compile expression strings
+  such as ``"sqrt(x)*sin(2*x) - 5*y"`` into NumPy ufunc kernels, together with
+  an analytic Jacobian obtained by symbolic differentiation of the expression.
+* :func:`vectorize_math` rewrites the ``math.*`` calls of an existing Python
+  function into their NumPy equivalents.
+
+Compiled kernels are cached per expression (or per function), so building the
+same problem twice costs nothing.
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import math
+import textwrap
+import types
+
+import numpy as np
+
+
+# Accepted function names (math and NumPy spellings) -> NumPy ufunc name
+FUNCTIONS = {
+    "sqrt": "sqrt", "exp": "exp", "log": "log", "log10": "log10", "log2": "log2",
+    "sin": "sin", "cos": "cos", "tan": "tan",
+    "asin": "arcsin", "acos": "arccos", "atan": "arctan",
+    "arcsin": "arcsin", "arccos": "arccos", "arctan": "arctan",
+    "sinh": "sinh", "cosh": "cosh", "tanh": "tanh",
+    "abs": "abs", "fabs": "abs", "sign": "sign",
+    "floor": "floor", "ceil": "ceil",
+    "atan2": "arctan2", "arctan2": "arctan2", "hypot": "hypot", "pow": "power", "power": "power",
+}
+
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+_KERNELS = {}
+_SYSTEMS = {}
+_VECTORIZED = {}
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+class _Canonicalize(ast.NodeTransformer):
+    # math.sin / np.sin / numpy.sin -> sin (NumPy spelling), so differentiation
+    # and code generation only deal with bare function names.
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        if isinstance(node.value, ast.Name) and node.value.id in ("math", "np", "numpy"):
+            if node.attr in FUNCTIONS:
+                return ast.copy_location(ast.Name(FUNCTIONS[node.attr], ast.Load()), node)
+            if node.attr in CONSTANTS:
+                return ast.copy_location(ast.Name(node.attr, ast.Load()), node)
+        return node
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS:
+            node.func = ast.copy_location(ast.Name(FUNCTIONS[node.func.id], ast.Load()), node.func)
+        return node
+
+
+def _parse(expr, variables):
+    try:
+        tree = ast.parse(str(expr).strip(), mode="eval").body
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid expression '{expr}': {exc.msg}") from exc
+    tree = ast.fix_missing_locations(_Canonicalize().visit(tree))
+
+    allowed = set(variables) | set(CONSTANTS) | set(FUNCTIONS.values())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id not in allowed:
+            raise ValueError(
+                f"Unknown name '{node.id}' in expression '{expr}'. "
+                f"Variables: {', '.join(variables)}"
+            )
+        if isinstance(node, (ast.Attribute, ast.Subscript, ast.Lambda, ast.NamedExpr)):
+            raise ValueError(f"Unsupported syntax in expression '{expr}'.")
+        if isinstance(node, ast.Call) and (node.keywords or not isinstance(node.func, ast.Name)):
+            raise ValueError(f"Unsupported function call in expression '{expr}'.")
+    return tree
+
+
+def _namespace():
+    namespace = {name: getattr(np, ufunc) for name, ufunc in FUNCTIONS.items() if name == ufunc}
+    namespace.update(CONSTANTS)
+    namespace["__builtins__"] = {}
+    return namespace
+
+
+def _compile_tree(tree, variables, source):
+    args = ", ".join(variables)
+    code = f"def kernel({args}):\n    return {ast.unparse(tree)}\n"
+    namespace = _namespace()
+    exec(compile(code, f"<kernel: {source}>", "exec"), namespace)
+    kernel = namespace["kernel"]
+    kernel.expression = ast.unparse(tree)
+    kernel.variables = tuple(variables)
+    return kernel
+
+
+def compile_expression(expr, variables=("x", "y")):
+    """Compile an expression string into a NumPy kernel kernel(*variables).
+
+    Function names may use either the math or the NumPy spelling (``asin`` or
+    ``arcsin``, ``math.sin`` or ``sin``); ``pi``, ``e`` and ``tau`` are constants.
+    The kernel accepts scalars or arrays and is cached per (expression, variables).
+    """
+    variables = tuple(variables)
+    key = (str(expr).strip(), variables)
+    if key not in _KERNELS:
+        _KERNELS[key] = _compile_tree(_parse(expr, variables), variables, key[0])
+    return _KERNELS[key]
+
+
+# ---------------------------------------------------------------------------
+# Symbolic differentiation
+# ---------------------------------------------------------------------------
+def _const(value):
+    return ast.Constant(value)
+
+
+def _is_const(node, value):
+    return isinstance(node, ast.Constant) and node.value == value
+
+
+def _both_numbers(a, b):
+    return all(isinstance(n, ast.Constant) and isinstance(n.value, (int, float)) for n in (a, b))
+
+
+def _add(a, b):
+    if _both_numbers(a, b):
+        return _const(a.value + b.value)
+    if _is_const(a, 0):
+        return b
+    if _is_const(b, 0):
+        return a
+    return ast.BinOp(a, ast.Add(), b)
+
+
+def _sub(a, b):
+    if _both_numbers(a, b):
+        return _const(a.value - b.value)
+    if _is_const(b, 0):
+        return a
+    if _is_const(a, 0):
+        return _neg(b)
+    return ast.BinOp(a, ast.Sub(), b)
+
+
+def _mul(a, b):
+    if _both_numbers(a, b):
+        return _const(a.value * b.value)
+    if _is_const(a, 0) or _is_const(b, 0):
+        return _const(0)
+    if _is_const(a, 1):
+        return b
+    if _is_const(b, 1):
+        return a
+    return ast.BinOp(a, ast.Mult(), b)
+
+
+def _div(a, b):
+    if _is_const(a, 0):
+        return _const(0)
+    if _is_const(b, 1):
+        return a
+    return ast.BinOp(a, ast.Div(), b)
+
+
+def _pow(a, b):
+    if _is_const(b, 1):
+        return a
+    if _is_const(b, 0):
+        return _const(1)
+    return ast.BinOp(a, ast.Pow(), b)
+
+
+def _neg(a):
+    if _is_const(a, 0):
+        return a
+    return ast.UnaryOp(ast.USub(), a)
+
+
+def _call(name, *args):
+    return ast.Call(ast.Name(name, ast.Load()), list(args), [])
+
+
+# d/du of each single-argument function, as a builder of the outer derivative
+_CHAIN_RULES = {
+    "sin": lambda u: _call("cos", u),
+    "cos": lambda u: _neg(_call("sin", u)),
+    "tan": lambda u: _div(_const(1), _pow(_call("cos", u), _const(2))),
+    "exp": lambda u: _call("exp", u),
+    "log": lambda u: _div(_const(1), u),
+    "log10": lambda u: _div(_const(1), _mul(u, _const(math.log(10)))),
+    "log2": lambda u: _div(_const(1), _mul(u, _const(math.log(2)))),
+    "sqrt": lambda u: _div(_const(1), _mul(_const(2), _call("sqrt", u))),
+    "arcsin": lambda u: _div(_const(1), _call("sqrt", _sub(_const(1), _pow(u, _const(2))))),
+    "arccos": lambda u: _neg(_div(_const(1), _call("sqrt", _sub(_const(1), _pow(u, _const(2)))))),
+    "arctan": lambda u: _div(_const(1), _add(_const(1), _pow(u, _const(2)))),
+    "sinh": lambda u: _call("cosh", u),
+    "cosh": lambda u: _call("sinh", u),
+    "tanh": lambda u: _sub(_const(1), _pow(_call("tanh", u), _const(2))),
+    "abs": lambda u: _call("sign", u),
+    "sign": lambda u: _const(0),
+    "floor": lambda u: _const(0),
+    "ceil": lambda u: _const(0),
+}
+
+
+def _diff(node, var):
+    if isinstance(node, ast.Constant):
+        return _const(0)
+    if isinstance(node, ast.Name):
+        return _const(1) if node.id == var else _const(0)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        d = _diff(node.operand, var)
+        return _neg(d) if isinstance(node.op, ast.USub) else d
+    if isinstance(node, ast.BinOp):
+        a, b = node.left, node.right
+        da, db = _diff(a, var), _diff(b, var)
+        if isinstance(node.op, ast.Add):
+            return _add(da, db)
+        if isinstance(node.op, ast.Sub):
+            return _sub(da, db)
+        if isinstance(node.op, ast.Mult):
+            return _add(_mul(da, b), _mul(a, db))
+        if isinstance(node.op, ast.Div):
+            return _div(_sub(_mul(da, b), _mul(a, db)), _pow(b, _const(2)))
+        if isinstance(node.op, ast.Pow):
+            if _is_const(db, 0):
+                return _mul(_mul(b, _pow(a, _sub(b, _const(1)))), da)
+            # a**b = exp(b*log(a))
+            return _mul(node, _add(_mul(db, _call("log", a)), _div(_mul(b, da), a)))
+    if isinstance(node, ast.Call) and node.func.id in _CHAIN_RULES and len(node.args) == 1:
+        u = node.args[0]
+        return _mul(_CHAIN_RULES[node.func.id](u), _diff(u, var))
+    raise ValueError(f"Cannot differentiate '{ast.unparse(node)}' analytically.")
+
+
+def differentiate(expr, variable, variables=("x", "y")):
+    """Return d(expr)/d(variable) as an expression string."""
+    variables = tuple(variables)
+    if variable not in variables:
+        raise ValueError(f"'{variable}' is not one of the variables: {', '.join(variables)}")
+    tree = _parse(expr, variables)
+    return ast.unparse(ast.fix_missing_locations(_diff(tree, variable)))
+
+
+# ---------------------------------------------------------------------------
+# Problem builders
+# ---------------------------------------------------------------------------
+def expression_rhs(expr, variables=("x", "y")):
+    """Build a vectorized scalar right-hand side f(x, y) from an expression string.
+
+    The returned kernel carries ``f.jac(x, y)`` = df/dy (analytic), which can be
+    passed as ``jac`` to the implicit integrators.
+    """
+    variables = tuple(variables)
+    if len(variables) != 2:
+        raise ValueError(f"expression_rhs needs (independent, dependent) variables, got {variables}")
+    f = compile_expression(expr, variables)
+    if not hasattr(f, "jac"):
+        f.jac = compile_expression(differentiate(expr, variables[1], variables), variables)
+    return f
+
+
+def _stack(values, shape):
+    # constant components (e.g. a zero partial) are broadcast to the batch shape
+    return np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in values], axis=-1)
+
+
+def expression_system(exprs, state=("y", "z"), time="x"):
+    """Build a vectorized system F(t, Y) from one expression per component.
+
+    Y may be a single state (N,) or a batch (..., N); component i of the result
+    is exprs[i] evaluated on Y[..., 0], ..., Y[..., N-1].  ``F.jac(t, Y)`` returns
+    the analytic Jacobian dF/dY with shape (N, N) (or (..., N, N) for a batch).
+    """
+    exprs = tuple(str(e).strip() for e in exprs)
+    state = tuple(state)
+    if len(exprs) != len(state):
+        raise ValueError(f"Got {len(exprs)} expressions for {len(state)} state variables.")
+    key = (exprs, state, time)
+    if key in _SYSTEMS:
+        return _SYSTEMS[key]
+
+    variables = state + (time,)
+    components = [compile_expression(e, variables) for e in exprs]
+    partials = [
+        [compile_expression(differentiate(e, s, variables), variables) for s in state]
+        for e in exprs
+    ]
+
+    def F(t, Y):
+        Y = np.asarray(Y, dtype=float)
+        args = [Y[..., i] for i in range(Y.shape[-1])] + [t]
+        return _stack([func(*args) for func in components], Y.shape[:-1])
+
+    def jac(t, Y):
+        Y = np.asarray(Y, dtype=float)
+        args = [Y[..., i] for i in range(Y.shape[-1])] + [t]
+        return np.stack([_stack([d(*args) for d in row], Y.shape[:-1]) for row in partials], axis=-2)
+
+    F.dimension = len(exprs)
+    F.expressions = exprs
+    F.jac = jac
+    _SYSTEMS[key] = F
+    return F
+
+
+# ---------------------------------------------------------------------------
+# math.* -> NumPy rewriting of existing functions
+# ---------------------------------------------------------------------------
+class _MathToNumpy(ast.NodeTransformer):
+    def __init__(self, math_aliases, math_functions):
+        self.math_aliases = math_aliases
+        self.math_functions = math_functions
+
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        if isinstance(node.value, ast.Name) and node.value.id in self.math_aliases:
+            if node.attr in FUNCTIONS:
+                return ast.copy_location(
+                    ast.Attribute(ast.Name("_np", ast.Load()), FUNCTIONS[node.attr], ast.Load()), node
+                )
+        return node
+
+    def visit_Name(self, node):
+        # functions imported with "from math import sin"
+        if isinstance(node.ctx, ast.Load) and node.id in self.math_functions:
+            return ast.copy_location(
+                ast.Attribute(ast.Name("_np", ast.Load()), self.math_functions[node.id], ast.Load()), node
+            )
+        return node
+
+
+def vectorize_math(func):
+    """Return a copy of func whose ``math.*`` calls are replaced by NumPy ufuncs.
+
+    Works for functions defined in a source file (like the problem modules),
+    including closures: the copy shares func's closure cells, so captured
+    parameters (and later nonlocal rebinding) are seen.  Raises ValueError when
+    the source cannot be read.  Cached per function.
+    """
+    if func in _VECTORIZED:
+        return _VECTORIZED[func]
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+    except (OSError, TypeError) as exc:
+        raise ValueError(f"Cannot read the source of {func!r} to vectorize it.") from exc
+
+    tree = ast.parse(source)
+    func_def = tree.body[0]
+    if not isinstance(func_def, ast.FunctionDef):
+        raise ValueError(f"{func!r} is not a plain function definition.")
+    func_def.decorator_list = []
+
+    globals_ = func.__globals__
+    math_aliases = {name for name, value in globals_.items() if value is math}
+    math_functions = {
+        name: FUNCTIONS[value.__name__]
+        for name, value in globals_.items()
+        if callable(value) and getattr(value, "__module__", None) == "math" and value.__name__ in FUNCTIONS
+    }
+    tree = ast.fix_missing_locations(_MathToNumpy(math_aliases, math_functions).visit(tree))
+
+    freevars = func.__code__.co_freevars
+    if freevars:
+        # define the function inside a factory taking the free variables, so its code
+        # object expects closure cells, then bind it to func's own cells
+        factory = ast.parse(f"def _closure_factory({', '.join(freevars)}):\n    pass").body[0]
+        factory.body = [func_def, ast.Return(ast.Name(id=func_def.name, ctx=ast.Load()))]
+        tree = ast.fix_missing_locations(ast.Module(body=[factory], type_ignores=[]))
+
+    namespace = dict(globals_)
+    namespace["_np"] = np
+    exec(compile(tree, inspect.getsourcefile(func) or "<vectorized>", "exec"), namespace)
+    if freevars:
+        code = namespace["_closure_factory"](*freevars).__code__
+        cells = dict(zip(freevars, func.__closure__))
+        vectorized = types.FunctionType(
+            code, namespace, func.__name__, func.__defaults__, tuple(cells[name] for name in code.co_freevars)
+        )
+        vectorized.__kwdefaults__ = func.__kwdefaults__
+    else:
+        vectorized = namespace[func_def.name]
+    vectorized.__wrapped__ = func
+    _VECTORIZED[func] = vectorized
+    return vectorized
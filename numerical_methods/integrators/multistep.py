@@ -0,0 +1,105 @@
+"""Adams-Bashforth and Adams-Bashforth-Moulton multistep integrators.
+
+An order-k Adams method combines the derivatives f_n, f_{n-1}, ..., kept in
+a ring buffer, so each step costs one f evaluation (Adams-Bashforth) or two
+(predict-evaluate-correct-evaluate with an Adams-Moulton corrector) instead
+of the four of RK4:
+
+    abK:  y_{n+1} = y_n + h*sum_j beta_j*f_{n-j}                  (explicit, order K)
+    abmK: predict with abK, evaluate f at the prediction, correct with the
+          order-K Adams-Moulton formula, evaluate again             (order K)
+
+The first K-1 steps are taken with RK4; its first stage is f(t_n, y_n), so
+the bootstrap fills the derivative buffer without extra evaluations.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+
+from numerical_methods.integrators.rk import Step, rk_step
+from numerical_methods.integrators.tableaux import RK4
+
+
+# Adams-Bashforth weights for f_n, f_{n-1}, ..., by order
+ADAMS_BASHFORTH = {
+    2: np.array([3, -1]) / 2,
+    3: np.array([23, -16, 5]) / 12,
+    4: np.array([55, -59, 37, -9]) / 24,
+    5: np.array([1901, -2774, 2616, -1274, 251]) / 720,
+}
+
+# Adams-Moulton weights for f_{n+1}, f_n, f_{n-1}, ..., by order
+ADAMS_MOULTON = {
+    2: np.array([1, 1]) / 2,
+    3: np.array([5, 8, -1]) / 12,
+    4: np.array([9, 19, -5, 1]) / 24,
+    5: np.array([251, 646, -264, 106, -19]) / 720,
+}
+
+MULTISTEP_METHODS = tuple(f"ab{k}" for k in ADAMS_BASHFORTH) + tuple(f"abm{k}" for k in ADAMS_BASHFORTH)
+
+
+def _check_method(method):
+    method = str(method).strip().lower()
+    if method not in MULTISTEP_METHODS:
+        raise ValueError(f"Unknown multistep method '{method}'. Choose one of: {', '.join(MULTISTEP_METHODS)}")
+    corrected = method.startswith("abm")
+    return int(method[3:] if corrected else method[2:]), corrected
+
+
+def _combine(y, h, weights, derivatives):
+    for w, d in zip(weights, derivatives):
+        y = y + (h * w) * d
+    return y
+
+
+def iter_multistep(f, t0, y0, h, num_steps, method="abm4"):
+    """Yield Step(n, t, y, k) for n = 0..num_steps with an Adams method.
+
+    method: 'ab2'..'ab5' (Adams-Bashforth) or 'abm2'..'abm5' (predictor-corrector).
+    """
+    order, corrected = _check_method(method)
+    beta = ADAMS_BASHFORTH[order]
+    alpha = ADAMS_MOULTON[order]
+
+    # history[0] is f_n, history[j] is f_{n-j}; the deque drops f_{n-order} itself
+    history = deque(maxlen=order)
+    y = y0
+    yield Step(0, t0, y, None)
+
+    for n in range(num_steps):
+        t = t0 + n * h
+        t_next = t0 + (n + 1) * h
+        if n < order - 1:
+            # RK4 bootstrap: its first stage is f(t_n, y_n)
+            y, k = rk_step(f, RK4, t, y, h)
+            history.appendleft(k[0])
+            yield Step(n + 1, t_next, y, None)
+            continue
+        if len(history) < order:
+            history.appendleft(f(t, y))
+
+        y_next = _combine(y, h, beta, history)
+        if corrected:
+            f_pred = f(t_next, y_next)
+            y_next = _combine(y, h, alpha[1:], history)
+            y_next = y_next + (h * alpha[0]) * f_pred
+        y = y_next
+        history.appendleft(f(t_next, y))
+        yield Step(n + 1, t_next, y, None)
+
+
+def integrate_multistep(f, t0, y0, h, num_steps, method="abm4"):
+    """Integrate y' = f(t, y) with an Adams multistep method and fixed step h.
+
+    Returns (ts, ys) with the same shapes as ``rk.integrate``.
+    """
+    y_start = np.asarray(y0, dtype=float)
+    ts = t0 + h * np.arange(num_steps + 1)
+    ys = np.empty((num_steps + 1,) + y_start.shape, dtype=float)
+    for step in iter_multistep(f, t0, y_start, h, num_steps, method):
+        ys[step.n] = step.y
+    return ts, ys
@@ -0,0 +1,90 @@
+"""Tableau-driven explicit Runge-Kutta engine.
+
+Every explicit method in the repo (Euler, Heun, Ralston, RK3, RK4) is a
+``ButcherTableau``; this module advances a state with any of them.  States can
+be plain floats or NumPy arrays, so the same kernel serves single IVPs and
+systems written as ``F(t, Y) -> ndarray``.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+
+import numpy as np
+
+from numerical_methods.integrators.tableaux import get_tableau
+
+
+# One integration step: index n, point t_n, state y_n and the stage derivatives
+# k that produced y_n from y_{n-1} (None for the initial state / non-RK methods).
+Step = namedtuple("Step", ["n", "t", "y", "k"])
+
+
+def step_count(t0, tn, h):
+    """Number of fixed steps of size h from t0 to tn (counter-based, no drift)."""
+    return int(round((tn - t0) / h))
+
+
+def rk_step(f, tableau, t, y, h, k1=None):
+    """Advance y by one explicit Runge-Kutta step of size h.
+
+    Returns (y_next, k) where k is the list of stage derivatives
+    k_i = f(t + c_i*h, y + h*sum_j a_ij*k_j).  ``k1`` is f(t, y) when the
+    caller already has it (FSAL stage of the previous step, or a rejected
+    attempt from the same point); it is used instead of calling f again.
+    """
+    k = [] if k1 is None else [k1]
+    for c_i, a_i in zip(tableau.c[len(k):], tableau.a[len(k):]):
+        y_stage = y
+        for a_ij, k_j in zip(a_i, k):
+            if a_ij:
+                y_stage = y_stage + (h * a_ij) * k_j
+        k.append(f(t + c_i * h, y_stage))
+
+    y_next = y
+    for b_i, k_i in zip(tableau.b, k):
+        if b_i:
+            y_next = y_next + (h * b_i) * k_i
+    return y_next, k
+
+
+def rk_error(tableau, k, h):
+    """Local error estimate h*sum_i (b_i - b_hat_i)*k_i of an embedded pair."""
+    err = 0.0
+    for b_i, bh_i, k_i in zip(tableau.b, tableau.b_hat, k):
+        if b_i != bh_i:
+            err = err + (h * (b_i - bh_i)) * k_i
+    return err
+
+
+def iter_steps(f, t0, y0, h, num_steps, method="rk4"):
+    """Yield Step(n, t, y, k) for n = 0..num_steps without storing the trajectory.
+
+    Only the current state is kept, so consumers can stream results, keep a
+    running statistic, or stop early with ``break``.
+    """
+    tableau = get_tableau(method)
+    y = np.asarray(y0, dtype=float)
+    yield Step(0, t0, y, None)
+    k1 = None
+    for n in range(1, num_steps + 1):
+        # counter-based x avoids accumulating h
+        t = t0 + (n - 1) * h
+        y, k = rk_step(f, tableau, t, y, h, k1)
+        t_next = t0 + n * h
+        # FSAL: reuse the last stage only when it was evaluated at exactly t_next
+        k1 = k[-1] if tableau.fsal and t + tableau.c[-1] * h == t_next else None
+        yield Step(n, t_next, y, k)
+
+
+def integrate(f, t0, y0, h, num_steps, method="rk4"):
+    """Integrate y' = f(t, y) for num_steps fixed steps with a registered method.
+
+    Returns (ts, ys) as NumPy arrays; ys has shape (num_steps + 1,) + shape(y0).
+    """
+    y_start = np.asarray(y0, dtype=float)
+    ts = t0 + h * np.arange(num_steps + 1)
+    ys = np.empty((num_steps + 1,) + y_start.shape, dtype=float)
+    for step in iter_steps(f, t0, y_start, h, num_steps, method):
+        ys[step.n] = step.y
+    return ts, ys
@@ -0,0 +1,249 @@
+"""Shooting method for two-point boundary value problems.
+
+The BVP is solved as an IVP with one unknown initial value gamma (a slope or
+a value); gamma is updated until the chosen component of the solution at tn
+equals beta:
+
+    secant: gamma_{k+1} = gamma_k - r_k * (gamma_k - gamma_{k-1}) / (r_k - r_{k-1})
+    newton: gamma_{k+1} = gamma_k - r_k / r'(gamma_k)   (r' by a forward difference)
+
+with r(gamma) = Y(tn; gamma)[target] - beta.  Every trial reuses the same
+in-process integrator, so no module is re-imported between trials.
+
+For linear systems Y(t; gamma) is affine in gamma, so :func:`shoot_linear`
+integrates two trials in one batched pass and combines them exactly:
+
+    Y = Y_a + theta*(Y_b - Y_a),   theta = (beta - Y_a(tn)[target]) / (Y_b(tn)[target] - Y_a(tn)[target])
+
+Multiple shooting (:func:`shoot_multiple`) splits [t0, tn] into M segments
+with unknown start states S_1..S_{M-1} (plus gamma for the first segment) and
+solves the continuity and boundary conditions
+
+    Y(t_{j+1}; S_j) - S_{j+1} = 0   (j = 0..M-2),    Y(tn; S_{M-1})[target] - beta = 0
+
+with Newton.  The segments (and their sensitivity columns) are independent,
+so they are integrated concurrently in a process pool.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from numerical_methods.integrators.dispatch import integrate_fixed
+from numerical_methods.integrators.rk import step_count
+
+
+SHOOTING_SOLVERS = ("secant", "newton")
+
+SHOOT_TOL = 1e-8
+SHOOT_MAX_ITER = 50
+
+
+def shoot(F, t0, tn, h, Y0, unknown, target, beta, gamma1, gamma2=None, method="rk4",
+          solver="secant", tol=SHOOT_TOL, max_iter=SHOOT_MAX_ITER):
+    """Find the initial value Y0[unknown] = gamma for which Y(tn)[target] = beta.
+
+    F: system right-hand side F(t, Y) (e.g. ``component_system(f, g)``)
+    Y0: initial state; entry ``unknown`` is replaced by each trial gamma
+    gamma1, gamma2: starting guesses (gamma2 defaults to gamma1 + 1 for secant)
+    solver: 'secant' (one integration per iteration) or 'newton' (two)
+
+    Returns a dict with gamma, residual, iterations, integrations, history
+    (list of (gamma, Y(tn)[target])) and the final trajectory ts, Ys.
+    Raises RuntimeError when |residual| > tol after max_iter iterations.
+    """
+    solver = str(solver).strip().lower()
+    if solver not in SHOOTING_SOLVERS:
+        raise ValueError(f"Unknown shooting solver '{solver}'. Choose one of: {', '.join(SHOOTING_SOLVERS)}")
+    base = np.array(Y0, dtype=float)
+    num_steps = step_count(t0, tn, h)
+    history = []
+    last = {}
+
+    def residual(gamma):
+        Y_start = base.copy()
+        Y_start[unknown] = gamma
+        ts, Ys = integrate_fixed(F, t0, Y_start, h, num_steps, method)
+        history.append((float(gamma), float(Ys[-1][target])))
+        last.update(gamma=float(gamma), ts=ts, Ys=Ys)
+        return float(Ys[-1][target]) - beta
+
+    gamma = float(gamma1)
+    r = residual(gamma)
+    if solver == "secant":
+        gamma_prev, r_prev = gamma, r
+        gamma = float(gamma1 + 1.0 if gamma2 is None else gamma2)
+        r = residual(gamma)
+
+    iterations = 0
+    while abs(r) > tol:
+        if iterations >= max_iter:
+            raise RuntimeError(
+                f"Shooting did not converge in {max_iter} iterations (gamma={gamma}, residual={r:.3e})."
+            )
+        iterations += 1
+        if solver == "secant":
+            if r == r_prev:
+                raise RuntimeError(f"Secant update stalled: equal residuals at gamma={gamma_prev} and {gamma}.")
+            gamma_prev, gamma = gamma, gamma - r * (gamma - gamma_prev) / (r - r_prev)
+            r_prev = r
+        else:
+            delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(gamma))
+            slope = (residual(gamma + delta) - r) / delta
+            if slope == 0:
+                raise RuntimeError(f"Newton update failed: zero derivative at gamma={gamma}.")
+            gamma = gamma - r / slope
+        r = residual(gamma)
+
+    return {
+        "gamma": last["gamma"],
+        "residual": r,
+        "iterations": iterations,
+        "integrations": len(history),
+        "history": history,
+        "ts": last["ts"],
+        "Ys": last["Ys"],
+        "solver": solver,
+    }
+
+
+def shoot_linear(F, t0, tn, h, Y0, unknown, target, beta, gamma1=0.0, gamma2=1.0, method="rk4"):
+    """Solve a linear shooting problem from two trials integrated as one batch.
+
+    F must accept a batch of states with shape (2, N) (see ``batched_system``).
+    Returns the same dict as :func:`shoot`, with iterations = 0 and
+    integrations = 2 (both trials share a single pass).
+    """
+    if gamma1 == gamma2:
+        raise ValueError("gamma1 and gamma2 must differ for linear shooting.")
+    Y_starts = np.array([Y0, Y0], dtype=float)
+    Y_starts[:, unknown] = (gamma1, gamma2)
+    num_steps = step_count(t0, tn, h)
+    ts, Ys = integrate_fixed(F, t0, Y_starts, h, num_steps, method)
+
+    value_a, value_b = Ys[-1, 0, target], Ys[-1, 1, target]
+    if value_a == value_b:
+        raise ValueError("The boundary value does not depend on gamma; check unknown and target.")
+    theta = (beta - value_a) / (value_b - value_a)
+    Ys_solved = Ys[:, 0] + theta * (Ys[:, 1] - Ys[:, 0])
+
+    return {
+        "gamma": float(gamma1 + theta * (gamma2 - gamma1)),
+        "residual": float(Ys_solved[-1, target] - beta),
+        "iterations": 0,
+        "integrations": 2,
+        "history": [(float(gamma1), float(value_a)), (float(gamma2), float(value_b))],
+        "ts": ts,
+        "Ys": Ys_solved,
+        "solver": "linear",
+    }
+
+
+def _segment(F, t_start, Y_start, h, num_steps, method, directions):
+    # One segment plus forward-difference columns dY_end/dY_start[d] for each direction d
+    ts, Ys = integrate_fixed(F, t_start, Y_start, h, num_steps, method)
+    Y_end = Ys[-1]
+    G = np.empty((Y_end.shape[0], len(directions)))
+    for col, d in enumerate(directions):
+        delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(Y_start[d]))
+        Y_pert = Y_start.copy()
+        Y_pert[d] += delta
+        G[:, col] = (integrate_fixed(F, t_start, Y_pert, h, num_steps, method)[1][-1] - Y_end) / delta
+    return ts, Ys, G
+
+
+def shoot_multiple(F, t0, tn, h, Y0, unknown, target, beta, gamma, segments=4, method="rk4",
+                   tol=SHOOT_TOL, max_iter=SHOOT_MAX_ITER, max_workers=None, guess=None):
+    """Multiple shooting: Newton on the segment continuity + boundary conditions.
+
+    F must be picklable (e.g. ``component_system`` of module-level functions)
+    unless max_workers=1, which integrates the segments serially.
+    guess: optional callable guess(t) -> state for the interior nodes; by
+    default they come from one single-shooting pass with gamma (falling back
+    to Y0 where that pass overflows).
+
+    Returns the same dict as :func:`shoot` plus ``nodes`` (segment start
+    times) and ``segments``; ``integrations`` counts every segment integration.
+    """
+    base = np.array(Y0, dtype=float)
+    dim = base.shape[0]
+    num_steps = step_count(t0, tn, h)
+    if not 1 <= segments <= num_steps:
+        raise ValueError(f"segments must be between 1 and the number of steps ({num_steps}), got {segments}")
+    bounds = [round(j * num_steps / segments) for j in range(segments + 1)]
+    nodes = [t0 + k * h for k in bounds[:-1]]
+
+    # unknowns z = [gamma, S_1, ..., S_{M-1}]
+    z = np.empty(1 + dim * (segments - 1))
+    z[0] = gamma
+    if segments > 1:
+        if guess is None:
+            start = base.copy()
+            start[unknown] = gamma
+            with np.errstate(all="ignore"):
+                _, Ys_guess = integrate_fixed(F, t0, start, h, num_steps, method)
+        for j in range(1, segments):
+            S_j = np.asarray(guess(nodes[j]), dtype=float) if guess is not None else Ys_guess[bounds[j]]
+            z[1 + dim * (j - 1):1 + dim * j] = S_j if np.all(np.isfinite(S_j)) else base
+
+    def starts(z):
+        first = base.copy()
+        first[unknown] = z[0]
+        return [first] + [z[1 + dim * (j - 1):1 + dim * j] for j in range(1, segments)]
+
+    pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers != 1 else None
+    integrations = 0
+    try:
+        for iteration in range(max_iter + 1):
+            S = starts(z)
+            args = [
+                (F, nodes[j], S[j], h, bounds[j + 1] - bounds[j], method, [unknown] if j == 0 else list(range(dim)))
+                for j in range(segments)
+            ]
+            if pool is None:
+                results = [_segment(*a) for a in args]
+            else:
+                results = list(pool.map(_segment, *zip(*args)))
+            integrations += sum(1 + len(a[-1]) for a in args)
+
+            R = np.empty_like(z)
+            J = np.zeros((z.shape[0], z.shape[0]))
+            for j, (_, Ys, G) in enumerate(results):
+                cols = slice(0, 1) if j == 0 else slice(1 + dim * (j - 1), 1 + dim * j)
+                if j < segments - 1:
+                    rows = slice(dim * j, dim * (j + 1))
+                    R[rows] = Ys[-1] - S[j + 1]
+                    J[rows, cols] = G
+                    J[rows, 1 + dim * j:1 + dim * (j + 1)] = -np.eye(dim)
+                else:
+                    R[-1] = Ys[-1][target] - beta
+                    J[-1, cols] = G[target]
+
+            residual = float(np.max(np.abs(R)))
+            if residual <= tol:
+                break
+            if iteration == max_iter:
+                raise RuntimeError(
+                    f"Multiple shooting did not converge in {max_iter} iterations (residual={residual:.3e})."
+                )
+            z = z + np.linalg.solve(J, -R)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    ts = np.concatenate([results[0][0]] + [r[0][1:] for r in results[1:]])
+    Ys = np.concatenate([results[0][1]] + [r[1][1:] for r in results[1:]])
+    return {
+        "gamma": float(z[0]),
+        "residual": residual,
+        "iterations": iteration,
+        "integrations": integrations,
+        "history": [(float(z[0]), float(Ys[-1][target]))],
+        "ts": ts,
+        "Ys": Ys,
+        "nodes": nodes,
+        "segments": segments,
+        "solver": "multiple",
+    }
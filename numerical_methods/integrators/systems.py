@@ -0,0 +1,96 @@
+"""Vector right-hand sides F(t, Y) for systems of first-order IVPs.
+
+Systems of any dimension are integrated as one NumPy state vector, so each RK
+stage is a handful of array operations regardless of the number of equations.
+The two-equation problem modules (``f(x, y, t)``, ``g(x, y, t)``) are adapted
+with :func:`component_system`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from numerical_methods.integrators.rk import integrate
+
+
+class ComponentSystem:
+    """F(t, Y) = [func(*Y, t) for func in components]; picklable for process pools."""
+
+    def __init__(self, components):
+        self.components = components
+        self.dimension = len(components)
+
+    def __call__(self, t, Y):
+        return np.array([func(*Y, t) for func in self.components], dtype=float)
+
+
+def component_system(*components):
+    """Build F(t, Y) from per-component functions written as func(y_1, ..., y_N, t).
+
+    This is the calling convention of problems/ivpsystems.py and ivpshooting.py,
+    e.g. ``component_system(f, g)`` for x' = f(x, y, t), y' = g(x, y, t).
+    """
+    if not components:
+        raise ValueError("component_system needs at least one component function.")
+    return ComponentSystem(components)
+
+
+def batched_system(*components):
+    """Build F(t, Y) for a batch of states Y with shape (..., N).
+
+    Component i is func_i(Y[..., 0], ..., Y[..., N-1], t), so each function is
+    evaluated once on whole arrays; they must not use ``math.*`` on the state.
+    """
+    if not components:
+        raise ValueError("batched_system needs at least one component function.")
+
+    def F(t, Y):
+        columns = [Y[..., i] for i in range(Y.shape[-1])]
+        values = np.broadcast_arrays(*[func(*columns, t) for func in components], columns[0])[:-1]
+        return np.stack(values, axis=-1).astype(float)
+
+    F.dimension = len(components)
+    F.components = components
+    return F
+
+
+def is_affine(F, t0, tn, dimension, samples=4, rtol=1e-9, seed=0):
+    """Check numerically whether F(t, Y) is affine in Y (i.e. the system is linear).
+
+    Compares F at a random combination of two states with the same combination
+    of their F values, at a few random t in [t0, tn].
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(samples):
+        t = t0 + (tn - t0) * rng.random()
+        Y1, Y2 = rng.standard_normal(dimension), rng.standard_normal(dimension)
+        w = rng.random()
+        lhs = np.asarray(F(t, w * Y1 + (1 - w) * Y2), dtype=float)
+        rhs = w * np.asarray(F(t, Y1), dtype=float) + (1 - w) * np.asarray(F(t, Y2), dtype=float)
+        if not np.allclose(lhs, rhs, rtol=rtol, atol=rtol * (1 + np.max(np.abs(rhs)))):
+            return False
+    return True
+
+
+def check_system(F, t0, Y0):
+    """Validate that F(t0, Y0) returns a vector with the same shape as Y0."""
+    Y0 = np.array(Y0, dtype=float)
+    if Y0.ndim != 1:
+        raise ValueError(f"Y0 must be a 1-D state vector, got shape {Y0.shape}")
+    dimension = getattr(F, "dimension", None)
+    if dimension is not None and dimension != Y0.shape[0]:
+        raise ValueError(f"System has {dimension} equations but Y0 has {Y0.shape[0]} entries.")
+    dY = np.asarray(F(t0, Y0))
+    if dY.shape != Y0.shape:
+        raise ValueError(f"F(t, Y) returned shape {dY.shape} for a state of shape {Y0.shape}")
+    return Y0
+
+
+def integrate_system(F, t0, Y0, h, num_steps, method="rk4"):
+    """Integrate Y' = F(t, Y) for an N-dimensional system with fixed steps.
+
+    Returns (ts, Ys) with Ys of shape (num_steps + 1, N); column i is the
+    trajectory of component i.
+    """
+    Y0 = check_system(F, t0, Y0)
+    return integrate(F, t0, Y0, h, num_steps, method)
@@ -0,0 +1,166 @@
+"""Butcher tableaux for the explicit Runge-Kutta methods in this repo."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ButcherTableau:
+    """Coefficients of an explicit s-stage Runge-Kutta method.
+
+    c: stage nodes (length s)
+    a: strictly lower-triangular stage weights; row i holds a_i0 .. a_i(i-1)
+    b: solution weights (length s)
+    b_hat: embedded weights of order ``embedded_order`` for error estimation
+           (None for methods without an embedded pair)
+    """
+
+    name: str
+    label: str
+    order: int
+    c: tuple
+    a: tuple
+    b: tuple
+    b_hat: tuple = None
+    embedded_order: int = None
+
+    @property
+    def stages(self):
+        return len(self.c)
+
+    @property
+    def is_embedded(self):
+        return self.b_hat is not None
+
+    @property
+    def fsal(self):
+        """First same as last: the final stage is f(t + h, y_next), i.e. k1 of the next step."""
+        last = tuple(self.a[-1]) + (0,)
+        return self.stages > 1 and self.c[-1] == 1 and last == tuple(self.b)
+
+
+EULER = ButcherTableau(
+    name="euler",
+    label="Euler",
+    order=1,
+    c=(0.0,),
+    a=((),),
+    b=(1.0,),
+)
+
+HEUN = ButcherTableau(
+    name="heun",
+    label="PC",
+    order=2,
+    c=(0.0, 1.0),
+    a=((), (1.0,)),
+    b=(1 / 2, 1 / 2),
+)
+
+RALSTON = ButcherTableau(
+    name="rk22",
+    label="RK2.2",
+    order=2,
+    c=(0.0, 3 / 4),
+    a=((), (3 / 4,)),
+    b=(1 / 3, 2 / 3),
+)
+
+RK3 = ButcherTableau(
+    name="rk3",
+    label="RK3",
+    order=3,
+    c=(0.0, 1 / 2, 1.0),
+    a=((), (1 / 2,), (-1.0, 2.0)),
+    b=(1 / 6, 4 / 6, 1 / 6),
+)
+
+RK4 = ButcherTableau(
+    name="rk4",
+    label="RK4",
+    order=4,
+    c=(0.0, 1 / 2, 1 / 2, 1.0),
+    a=((), (1 / 2,), (0.0, 1 / 2), (0.0, 0.0, 1.0)),
+    b=(1 / 6, 1 / 3, 1 / 3, 1 / 6),
+)
+
+
+# ---------------------------
+# Embedded pairs (adaptive step-size control)
+# ---------------------------
+HEUN_EULER = ButcherTableau(
+    name="heun_euler",
+    label="Heun-Euler 2(1)",
+    order=2,
+    c=(0.0, 1.0),
+    a=((), (1.0,)),
+    b=(1 / 2, 1 / 2),
+    b_hat=(1.0, 0.0),
+    embedded_order=1,
+)
+
+# Bogacki-Shampine 3(2); the fourth stage is evaluated at the new solution.
+BS32 = ButcherTableau(
+    name="bs32",
+    label="Bogacki-Shampine 3(2)",
+    order=3,
+    c=(0.0, 1 / 2, 3 / 4, 1.0),
+    a=((), (1 / 2,), (0.0, 3 / 4), (2 / 9, 1 / 3, 4 / 9)),
+    b=(2 / 9, 1 / 3, 4 / 9, 0.0),
+    b_hat=(7 / 24, 1 / 4, 1 / 3, 1 / 8),
+    embedded_order=2,
+)
+
+# Dormand-Prince 5(4); the seventh stage is evaluated at the new solution.
+DP54 = ButcherTableau(
+    name="dp54",
+    label="Dormand-Prince 5(4)",
+    order=5,
+    c=(0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0),
+    a=(
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+    ),
+    b=(35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0),
+    b_hat=(5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40),
+    embedded_order=4,
+)
+
+
+# Method keys accepted by the problem configs and drivers.
+# "ral" is the key used by the multi-method drivers for Ralston's RK2.2.
+TABLEAUX = {
+    "euler": EULER,
+    "heun": HEUN,
+    "rk22": RALSTON,
+    "ral": RALSTON,
+    "rk3": RK3,
+    "rk4": RK4,
+    "heun_euler": HEUN_EULER,
+    "bs32": BS32,
+    "dp54": DP54,
+}
+
+
+def register_tableau(tableau, *aliases):
+    """Register a tableau under its name (and any aliases) so drivers can select it."""
+    for key in (tableau.name, *aliases):
+        TABLEAUX[key] = tableau
+    return tableau
+
+
+def get_tableau(method):
+    """Return the registered tableau for a method key or tableau instance."""
+    if isinstance(method, ButcherTableau):
+        return method
+    key = str(method).strip().lower()
+    if key not in TABLEAUX:
+        choices = ", ".join(sorted(TABLEAUX))
+        raise ValueError(f"Unknown method '{method}'. Choose one of: {choices}")
+    return TABLEAUX[key]
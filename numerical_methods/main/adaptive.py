@@ -0,0 +1,49 @@
+"""Compare embedded-pair adaptive integration against fixed-step RK4 on the ivp.py problem."""
+
+import csv
+
+from numerical_methods.fd.FD import compute_adaptive
+from numerical_methods.integrators.rk import integrate, step_count
+from numerical_methods.integrators.tableaux import RK4
+from numerical_methods.paths import csv_path
+from numerical_methods.problems.ivp import adaptive_method, atol, f, h, rtol, x0, xn, y0
+from numerical_methods.utils import print_table
+
+# Choose any subset from: heun_euler, bs32, dp54
+active_pairs = ['heun_euler', 'bs32', 'dp54']
+
+
+def main():
+    pairs = list(active_pairs)
+    if adaptive_method not in pairs:
+        pairs.append(adaptive_method)
+
+    num_steps = step_count(x0, xn, h)
+    _, ys_fixed = integrate(f, x0, y0, h, num_steps, RK4)
+
+    rows = []
+    for pair in pairs:
+        xs, ys, stats = compute_adaptive(pair, rtol=rtol, atol=atol)
+        rows.append((
+            stats['method'], stats['accepted'], stats['rejected'], stats['nfev'],
+            min(b - a for a, b in zip(xs, xs[1:])), max(b - a for a, b in zip(xs, xs[1:])), ys[-1],
+        ))
+    rows.append(("rk4 (fixed h)", num_steps, 0, RK4.stages * num_steps, h, h, float(ys_fixed[-1])))
+
+    headers = ["method", "accepted", "rejected", "f evals", "h min", "h max", f"y({xn})"]
+    print(f"Adaptive step-size control (rtol={rtol:g}, atol={atol:g})")
+    print_table(headers, rows)
+
+    xs, ys, stats = compute_adaptive(adaptive_method, rtol=rtol, atol=atol)
+    out_path = csv_path("output_adaptive.csv")
+    with open(out_path, mode="w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["n", "x", "h", "y"])
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            step = x - xs[i - 1] if i else 0.0
+            writer.writerow([i, f"{x:.6f}", f"{step:.6f}", f"{y:.6f}"])
+    print(f"\nCSV file created: {out_path} ({stats['method']})")
+
+
+if __name__ == "__main__":
+    main()
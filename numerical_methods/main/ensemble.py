@@ -0,0 +1,53 @@
+"""Ensemble sweep: integrate the ivp.py problem for many initial conditions at once."""
+
+import csv
+import time
+
+import numpy as np
+
+from numerical_methods.integrators.ensemble import integrate_ensemble
+from numerical_methods.integrators.rk import integrate, step_count
+from numerical_methods.paths import csv_path
+from numerical_methods.problems.ivp import f, h, method, x0, xn, y0
+from numerical_methods.utils import print_table
+
+# Initial conditions to sweep (y0 from ivp.py is always the first member)
+batch_size = 1000
+y0_values = np.concatenate(([y0], np.linspace(-1.0, 1.0, batch_size - 1)))
+rows_to_print = 10
+compare_with_serial = True  # time the one-at-a-time loop for the same batch
+
+
+def main():
+    num_steps = step_count(x0, xn, h)
+
+    start = time.perf_counter()
+    xs, ys = integrate_ensemble(f, x0, y0_values, h, num_steps, method)
+    batched_time = time.perf_counter() - start
+
+    print(f"Ensemble integration ({method.upper()}): {len(y0_values)} members, {num_steps} steps")
+    print(f"Trajectory array shape: {ys.shape}")
+    print(f"Batched time: {batched_time:.6f} s")
+
+    if compare_with_serial:
+        start = time.perf_counter()
+        for y0_i in y0_values:
+            integrate(f, x0, y0_i, h, num_steps, method)
+        serial_time = time.perf_counter() - start
+        print(f"Serial time:  {serial_time:.6f} s  (speedup x{serial_time / batched_time:.1f})")
+
+    rows = [(i, float(y0_values[i]), float(ys[-1, i])) for i in range(min(rows_to_print, len(y0_values)))]
+    print()
+    print_table(["member", "y0", f"y({xn})"], rows)
+
+    out_path = csv_path("output_ensemble.csv")
+    with open(out_path, mode="w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["member", "y0", "y_final"])
+        for i, (y0_i, y_final) in enumerate(zip(y0_values, ys[-1])):
+            writer.writerow([i, f"{y0_i:.6f}", f"{y_final:.6f}"])
+    print(f"\nCSV file created: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
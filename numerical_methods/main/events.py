@@ -0,0 +1,45 @@
+"""Locate the roots of event(x, y) from ivp.py during fixed-step and adaptive integration."""
+
+import csv
+
+from numerical_methods.integrators.adaptive import integrate_adaptive
+from numerical_methods.integrators.events import integrate_events
+from numerical_methods.integrators.rk import step_count
+from numerical_methods.paths import csv_path
+from numerical_methods.problems.ivp import adaptive_method, atol, event, f, h, jac, method, rtol, x0, xn, y0
+from numerical_methods.utils import print_table
+
+
+def main():
+    num_steps = step_count(x0, xn, h)
+    fixed = integrate_events(f, x0, y0, h, num_steps, event, method, jac=jac)
+    adaptive = integrate_adaptive(f, x0, y0, xn, adaptive_method, rtol=rtol, atol=atol, events=event)
+
+    rows = []
+    for label, result, steps in (
+        (f"{method} (h={h})", fixed, f"{fixed['steps']} / {num_steps}"),
+        (f"{adaptive_method} (rtol={rtol:g})", adaptive, adaptive["accepted"]),
+    ):
+        roots = result["t_events"][0]
+        stopped = "yes" if result["terminated"] is not None else "no"
+        if roots.size:
+            for t_root, y_root in zip(roots, result["y_events"][0]):
+                rows.append((label, f"{t_root:.12f}", f"{float(y_root):.3e}", steps, stopped))
+        else:
+            rows.append((label, "-", "-", steps, stopped))
+
+    print(f"Event roots of event(x, y) on [{x0}, {xn}] (direction={getattr(event, 'direction', 0)}, "
+          f"terminal={getattr(event, 'terminal', False)})")
+    print_table(["method", "x event", "y at event", "steps taken", "stopped"], rows)
+
+    out_path = csv_path("output_events.csv")
+    with open(out_path, mode="w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["n", "x", "y"])
+        for i, (x, y) in enumerate(zip(fixed["ts"], fixed["ys"])):
+            writer.writerow([i, f"{x:.12f}", f"{float(y):.12f}"])
+    print(f"\nCSV file created: {out_path} ({method}, ends at the terminal event)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Richardson and Gragg-Bulirsch-Stoer extrapolation on the ivp.py problem."""
+
+import csv
+
+from numerical_methods.integrators.extrapolation import integrate_gbs, richardson
+from numerical_methods.integrators.rk import step_count
+from numerical_methods.paths import csv_path
+from numerical_methods.problems.ivp import f, h, jac, method, x0, xn, y0
+from numerical_methods.utils import print_table
+
+# Methods to Richardson-extrapolate (any integrate_fixed key)
+richardson_methods = ['euler', 'heun', 'rk4']
+# GBS tolerance per macro step
+gbs_rtol = 1e-10
+gbs_atol = 1e-12
+
+
+def main():
+    num_steps = step_count(x0, xn, h)
+    methods = list(richardson_methods)
+    if method not in methods:
+        methods.append(method)
+
+    rows = []
+    for m in methods:
+        result = richardson(f, x0, y0, h, num_steps, m, jac=jac)
+        rows.append((f"{m} + Richardson", result["order"], float(result["ys_fine"][-1]),
+                     float(result["ys"][-1]), f"{float(result['error'][-1]):.3e}"))
+
+    gbs = integrate_gbs(f, x0, y0, h, num_steps, rtol=gbs_rtol, atol=gbs_atol)
+    rows.append(("GBS (modified midpoint)", f"<= {2 * gbs['rows'].max()}", "-", float(gbs["ys"][-1]),
+                 f"{gbs['error'][-1]:.3e} (scaled)"))
+
+    print(f"Extrapolation with h = {h} ({num_steps} steps); GBS rtol={gbs_rtol:g}, atol={gbs_atol:g}")
+    print_table(["method", "order", f"y({xn}) at h/2", f"y({xn}) extrapolated", "error estimate"], rows)
+    print(f"\nGBS: {gbs['nfev']} f evaluations, rows per step {gbs['rows'][1:].tolist()}, "
+          f"{gbs['unconverged']} step(s) above tolerance")
+
+    out_path = csv_path("output_extrapolation.csv")
+    with open(out_path, mode="w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["n", "x", "y_gbs", "scaled_error", "rows"])
+        for i, (x, y) in enumerate(zip(gbs["ts"], gbs["ys"])):
+            writer.writerow([i, f"{x:.6f}", f"{y:.12f}", f"{gbs['error'][i]:.3e}", gbs["rows"][i]])
+    print(f"\nCSV file created: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,17 @@
 """Build Vandermonde, Lagrange, and Least-Squares polynomial approximations."""
 
-from numerical_methods.fd.FD import compute_euler, compute_heun, compute_rk22, compute_rk4
+from numerical_methods.fd.FD import (
+    compute_ab4,
+    compute_abm4,
+    compute_backward_euler,
+    compute_bdf2,
+    compute_euler,
+    compute_heun,
+    compute_rk22,
+    compute_rk3,
+    compute_rk4,
+    compute_trapezoidal,
+)
 from numerical_methods.fitting.lagrange import solve_lagrange
 from numerical_methods.fitting.leastsquares import solve_least_squares
 from numerical_methods.fitting.vandermonde import build_vandermonde, solve_vandermonde
@@ -13,7 +24,13 @@ METHOD_COMPUTE_MAP = {
     "euler": compute_euler,
     "heun": compute_heun,
     "rk22": compute_rk22,
+    "rk3": compute_rk3,
     "rk4": compute_rk4,
+    "backward_euler": compute_backward_euler,
+    "trapezoidal": compute_trapezoidal,
+    "bdf2": compute_bdf2,
+    "ab4": compute_ab4,
+    "abm4": compute_abm4,
 }
 
 
@@ -77,7 +94,7 @@ def _print_ls_section(method_name, result):
 
 def main():
     if method not in METHOD_COMPUTE_MAP:
-        raise ValueError("Unknown method. Choose euler, heun, rk22, or rk4")
+        raise ValueError(f"Unknown method. Choose one of: {', '.join(METHOD_COMPUTE_MAP)}")
 
     xs, ys = METHOD_COMPUTE_MAP[method]()
 
@@ -0,0 +1,73 @@
+"""Multiple shooting on the ivpshooting.py problem, compared with single shooting.
+
+segments and shoot_workers are set in problems/ivpshooting.py, next to the problem.
+"""
+
+import csv
+import time
+
+from numerical_methods.integrators.shooting import shoot, shoot_multiple
+from numerical_methods.integrators.systems import component_system
+from numerical_methods.paths import csv_path
+from numerical_methods.problems.ivpshooting import (
+    beta,
+    f,
+    g,
+    gamma1,
+    gamma2,
+    h,
+    method,
+    segments,
+    shoot_target,
+    shoot_tol,
+    shoot_unknown,
+    shoot_workers,
+    t0 as x0,
+    tn as xn,
+    x0 as y0,
+    y0 as z0,
+)
+from numerical_methods.utils import print_table
+
+
+def main():
+    state_index = {"y": 0, "z": 1}
+    bad = [v for v in (shoot_unknown, shoot_target) if v not in state_index]
+    if bad:
+        raise ValueError(f"shoot_unknown and shoot_target must be 'y' or 'z', got {bad}")
+    unknown, target = state_index[shoot_unknown], state_index[shoot_target]
+    rhs = component_system(f, g)
+
+    start = time.perf_counter()
+    single = shoot(rhs, x0, xn, h, [y0, z0], unknown, target, beta, gamma1, gamma2,
+                   method=method, tol=shoot_tol)
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multiple = shoot_multiple(rhs, x0, xn, h, [y0, z0], unknown, target, beta, gamma1, segments=segments,
+                              method=method, tol=shoot_tol, max_workers=shoot_workers)
+    multiple_seconds = time.perf_counter() - start
+
+    print(f"Shooting ({method}): {shoot_unknown}(x0) = gamma so that {shoot_target}({xn}) = {beta}")
+    print_table(
+        ["solver", "gamma", "iterations", "integrations", "residual", "time (s)"],
+        [
+            (single["solver"], f"{single['gamma']:.10f}", single["iterations"], single["integrations"],
+             f"{abs(single['residual']):.2e}", f"{single_seconds:.4f}"),
+            (f"multiple ({segments} segments)", f"{multiple['gamma']:.10f}", multiple["iterations"],
+             multiple["integrations"], f"{multiple['residual']:.2e}", f"{multiple_seconds:.4f}"),
+        ],
+    )
+    print(f"\nSegment start points: {[round(x, 10) for x in multiple['nodes']]}")
+
+    out_path = csv_path("output_multiple_shooting.csv")
+    with open(out_path, mode="w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["n", "x", "y", "z"])
+        for i, (x, (y, z)) in enumerate(zip(multiple["ts"], multiple["Ys"])):
+            writer.writerow([i, f"{x:.6f}", f"{y:.12f}", f"{z:.12f}"])
+    print(f"\nCSV file created: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
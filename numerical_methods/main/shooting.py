@@ -1,10 +1,28 @@
 import csv
 
+import numpy as np
+
+from numerical_methods.integrators.dense import HermiteInterpolant
+from numerical_methods.integrators.instrument import COST_HEADERS, CountedFunction, cost_rows
+from numerical_methods.integrators.rk import rk_step, step_count
+from numerical_methods.integrators.shooting import shoot, shoot_linear
+from numerical_methods.integrators.systems import batched_system, component_system, is_affine
+from numerical_methods.integrators.tableaux import EULER, HEUN, RALSTON, RK3, RK4
 from numerical_methods.paths import csv_path
 from numerical_methods.problems.ivpshooting import (
+    auto_shoot,
+    beta,
     f,
     g,
+    gamma1,
+    gamma2,
     h,
+    linear,
+    method,
+    shoot_solver,
+    shoot_target,
+    shoot_tol,
+    shoot_unknown,
     t0 as x0,
     tn as xn,
     x0 as y0,
@@ -21,118 +39,86 @@ except Exception:
     HAS_MATPLOTLIB = False
 
 # Choose any subset from: euler, heun, ral, rk3, rk4
+# Only the selected methods are integrated.
 # active_methods = ['euler', 'heun', 'ral', 'rk3', 'rk4']
 active_methods = ['heun']
 # ---------------------------
 # Time grid
 # ---------------------------
-num_steps = int(round((xn - x0) / h))
-x_vals = [x0]
+num_steps = step_count(x0, xn, h)
+x_vals = x0 + h * np.arange(num_steps + 1)
 
 # ---------------------------
-# Containers (all numerical method steps)
+# Main loop
 # ---------------------------
-euler_y = [y0]
-euler_z = [z0]
-
-heun_y = [y0]
-heun_z = [z0]
-
-ral_y = [y0]
-ral_z = [z0]
-
-rk3_y = [y0]
-rk3_z = [z0]
-
-rk4_y = [y0]
-rk4_z = [z0]
+# F(x, [y, z]) = [f, g] as one vector right-hand side
+rhs = component_system(f, g)
+
+tableaux = {
+    "euler": EULER,
+    "heun": HEUN,
+    "ral": RALSTON,
+    "rk3": RK3,
+    "rk4": RK4,
+}
+unknown = [m for m in active_methods if m not in tableaux]
+if unknown:
+    raise ValueError(f"Unknown method(s) in active_methods: {unknown}. Choose from: {', '.join(tableaux)}")
 
 # ---------------------------
-# Main loop
+# Automatic shooting: iterate on gamma in-process instead of one run per trial
 # ---------------------------
-y_eu = y_he = y_ra = y_rk3 = y_rk4 = y0
-z_eu = z_he = z_ra = z_rk3 = z_rk4 = z0
+if auto_shoot:
+    state_index = {"y": 0, "z": 1}
+    bad = [v for v in (shoot_unknown, shoot_target) if v not in state_index]
+    if bad:
+        raise ValueError(f"shoot_unknown and shoot_target must be 'y' or 'z', got {bad}")
+    shoot_args = (x0, xn, h, [y0, z0], state_index[shoot_unknown], state_index[shoot_target], beta, gamma1, gamma2)
+    if linear is None:
+        linear = is_affine(rhs, x0, xn, 2)
+    if linear:
+        # both trials in one batched pass, combined exactly (no iteration)
+        shot = shoot_linear(batched_system(f, g), *shoot_args, method=method)
+    else:
+        shot = shoot(rhs, *shoot_args, method=method, solver=shoot_solver, tol=shoot_tol)
+    print(f"Shooting ({shot['solver']}, {method}): {shoot_unknown}(x0) = gamma so that {shoot_target}({xn}) = {beta}")
+    print_table(["trial", "gamma", f"{shoot_target}({xn})"], [(i + 1, g_i, v_i) for i, (g_i, v_i) in enumerate(shot["history"])])
+    print(f"gamma = {shot['gamma']:.10f} after {shot['iterations']} iteration(s), "
+          f"{shot['integrations']} integrations (residual {shot['residual']:.2e})\n")
+    y0, z0 = shot["Ys"][0]
+
+# Each method integrates through its own counted copies of f and g
+counters = {m: [CountedFunction(f), CountedFunction(g)] for m in active_methods}
+counted_rhs = {m: component_system(*counters[m]) for m in active_methods}
+
+# Containers (selected numerical methods only): one preallocated (num_steps + 1, 2)
+# float64 buffer per method, columns [y, z]
+trajectories = {m: np.empty((num_steps + 1, 2)) for m in active_methods}
+# F(t_n, Y_n) per step: the first RK stage, kept for dense output
+derivs = {m: np.empty((num_steps + 1, 2)) for m in active_methods}
+for m in active_methods:
+    trajectories[m][0] = (y0, z0)
 
 for step in range(num_steps):
     x = x0 + step * h
-    x_next = x0 + (step + 1) * h
-
-    # Euler
-    kx = h * f(y_eu, z_eu, x)
-    ky = h * g(y_eu, z_eu, x)
-    y_eu = y_eu + kx
-    z_eu = z_eu + ky
-
-    # Heun
-    yp = y_he + h * f(y_he, z_he, x)
-    zp = z_he + h * g(y_he, z_he, x)
-    y_he = y_he + (h / 2) * (f(y_he, z_he, x) + f(yp, zp, x_next))
-    z_he = z_he + (h / 2) * (g(y_he, z_he, x) + g(yp, zp, x_next))
-
-    # Ralston (RK2.2)
-    k1x = h * f(y_ra, z_ra, x)
-    k1y = h * g(y_ra, z_ra, x)
-    k2x = h * f(y_ra + 3 * k1x / 4, z_ra + 3 * k1y / 4, x + 3 * h / 4)
-    k2y = h * g(y_ra + 3 * k1x / 4, z_ra + 3 * k1y / 4, x + 3 * h / 4)
-    y_ra = y_ra + (1 / 3) * k1x + (2 / 3) * k2x
-    z_ra = z_ra + (1 / 3) * k1y + (2 / 3) * k2y
-
-    # RK3 (Kutta's 3rd order)
-    k1x = h * f(y_rk3, z_rk3, x)
-    k1y = h * g(y_rk3, z_rk3, x)
-    k2x = h * f(y_rk3 + k1x / 2, z_rk3 + k1y / 2, x + h / 2)
-    k2y = h * g(y_rk3 + k1x / 2, z_rk3 + k1y / 2, x + h / 2)
-    k3x = h * f(y_rk3 - k1x + 2 * k2x, z_rk3 - k1y + 2 * k2y, x + h)
-    k3y = h * g(y_rk3 - k1x + 2 * k2x, z_rk3 - k1y + 2 * k2y, x + h)
-    y_rk3 = y_rk3 + (1 / 6) * (k1x + 4 * k2x + k3x)
-    z_rk3 = z_rk3 + (1 / 6) * (k1y + 4 * k2y + k3y)
-
-    # RK4
-    k1x = h * f(y_rk4, z_rk4, x)
-    k1y = h * g(y_rk4, z_rk4, x)
-    k2x = h * f(y_rk4 + k1x / 2, z_rk4 + k1y / 2, x + h / 2)
-    k2y = h * g(y_rk4 + k1x / 2, z_rk4 + k1y / 2, x + h / 2)
-    k3x = h * f(y_rk4 + k2x / 2, z_rk4 + k2y / 2, x + h / 2)
-    k3y = h * g(y_rk4 + k2x / 2, z_rk4 + k2y / 2, x + h / 2)
-    k4x = h * f(y_rk4 + k3x, z_rk4 + k3y, x_next)
-    k4y = h * g(y_rk4 + k3x, z_rk4 + k3y, x_next)
-    y_rk4 = y_rk4 + (1 / 6) * (k1x + 2 * k2x + 2 * k3x + k4x)
-    z_rk4 = z_rk4 + (1 / 6) * (k1y + 2 * k2y + 2 * k3y + k4y)
-
-    x_vals.append(x_next)
-    euler_y.append(y_eu)
-    euler_z.append(z_eu)
-    heun_y.append(y_he)
-    heun_z.append(z_he)
-    ral_y.append(y_ra)
-    ral_z.append(z_ra)
-    rk3_y.append(y_rk3)
-    rk3_z.append(z_rk3)
-    rk4_y.append(y_rk4)
-    rk4_z.append(z_rk4)
 
+    for m, traj in trajectories.items():
+        traj[step + 1], k = rk_step(counted_rhs[m], tableaux[m], x, traj[step], h)
+        derivs[m][step] = k[0]
 
-def pct_err(actual, approx):
-    if actual == 0:
-        return 0.0
-    return abs((actual - approx) / actual * 100)
+for m in active_methods:
+    derivs[m][-1] = rhs(x_vals[-1], trajectories[m][-1])
 
 
-series_y = {
-    "euler": euler_y,
-    "heun": heun_y,
-    "ral": ral_y,
-    "rk3": rk3_y,
-    "rk4": rk4_y,
-}
+def pct_err(actual, approx):
+    actual = np.asarray(actual, dtype=float)
+    approx = np.asarray(approx, dtype=float)
+    safe_actual = np.where(actual == 0, 1.0, actual)
+    return np.where(actual == 0, 0.0, np.abs((actual - approx) / safe_actual * 100))
 
-series_z = {
-    "euler": euler_z,
-    "heun": heun_z,
-    "ral": ral_z,
-    "rk3": rk3_z,
-    "rk4": rk4_z,
-}
+
+series_y = {m: traj[:, 0] for m, traj in trajectories.items()}
+series_z = {m: traj[:, 1] for m, traj in trajectories.items()}
 
 method_labels = {
     "euler": "Euler",
@@ -155,12 +141,20 @@ has_actual = (
 if has_actual:
     n_actual = len(y_actual)
     actual_spacing = (xn - x0) / (n_actual - 1)
-    actual_stride = max(1, round(actual_spacing / h))
     x_check = [x0 + i * actual_spacing for i in range(n_actual)]
-    indices = [i * actual_stride for i in range(n_actual)]
+
+    # Dense output: each method's solution at the checkpoints, interpolated from
+    # its trajectory so h does not have to divide the checkpoint spacing
+    check_y = {}
+    check_z = {}
+    for m in active_methods:
+        at_check = HermiteInterpolant(x_vals, trajectories[m], derivs[m])(x_check)
+        check_y[m] = at_check[:, 0]
+        check_z[m] = at_check[:, 1]
 else:
     x_check = x_vals
-    indices = list(range(len(x_vals)))
+    check_y = series_y
+    check_z = series_z
 
 # Step: validate whether actual arrays are truly usable for plotting.
 show_actual_in_plots = (
@@ -177,14 +171,14 @@ show_actual_in_plots = (
 if has_actual:
     rows_y = []
     rows_z = []
-    for i, idx in enumerate(indices):
+    err_y = {m: pct_err(y_actual, check_y[m]) for m in active_methods}
+    err_z = {m: pct_err(z_actual, check_z[m]) for m in active_methods}
+    for i in range(len(x_check)):
         row_y = [i, x_check[i], y_actual[i]]
         row_z = [i, x_check[i], z_actual[i]]
         for m in active_methods:
-            approx_y = series_y[m][idx]
-            approx_z = series_z[m][idx]
-            row_y.extend([approx_y, f"{pct_err(y_actual[i], approx_y):.5f}%"])
-            row_z.extend([approx_z, f"{pct_err(z_actual[i], approx_z):.5f}%"])
+            row_y.extend([check_y[m][i], f"{err_y[m][i]:.5f}%"])
+            row_z.extend([check_z[m][i], f"{err_z[m][i]:.5f}%"])
         rows_y.append(tuple(row_y))
         rows_z.append(tuple(row_z))
 
@@ -231,6 +225,9 @@ else:
     print_table(headers, rows)
     print_table_csv(headers, rows)
 
+print("\nCost per method (f and g evaluations during integration)")
+print_table(COST_HEADERS, cost_rows({method_labels[m]: counters[m] for m in active_methods}, num_steps))
+
 
 if HAS_MATPLOTLIB:
     # ---------------------------
@@ -311,7 +308,7 @@ if HAS_MATPLOTLIB:
     if show_actual_in_plots:
         plt.figure(figsize=(10, 6))
         for m in active_methods:
-            errs_y = [pct_err(y_actual[i], series_y[m][idx]) for i, idx in enumerate(indices)]
+            errs_y = pct_err(y_actual, check_y[m])
             marker = styles[m][0][0]
             color = styles[m][1]
             plt.scatter(x_check, errs_y, marker=marker, label=method_labels[m], color=color, zorder=5)
@@ -324,7 +321,7 @@ if HAS_MATPLOTLIB:
 
         plt.figure(figsize=(10, 6))
         for m in active_methods:
-            errs_z = [pct_err(z_actual[i], series_z[m][idx]) for i, idx in enumerate(indices)]
+            errs_z = pct_err(z_actual, check_z[m])
             marker = styles[m][0][0]
             color = styles[m][1]
             plt.scatter(x_check, errs_z, marker=marker, label=method_labels[m], color=color, zorder=5)
@@ -1,72 +1,91 @@
 import csv
 
 import matplotlib.pyplot as plt
+import numpy as np
 
+from numerical_methods.integrators.dense import HermiteInterpolant
+from numerical_methods.integrators.dispatch import integrate_fixed
+from numerical_methods.integrators.instrument import COST_HEADERS, CountedFunction, cost_rows
+from numerical_methods.integrators.rk import rk_step, step_count
+from numerical_methods.integrators.tableaux import EULER, HEUN, RALSTON, RK3, RK4
 from numerical_methods.paths import csv_path
-from numerical_methods.problems.ivp import f, h, x0, xn, y0, y_actual
+from numerical_methods.problems.ivp import backend, f, h, x0, xn, y0, y_actual
 from numerical_methods.utils import print_table, print_table_csv
 
-num_steps = int(round((xn - x0) / h))
+# Choose any subset from: euler, heun, ral, rk3, rk4
+# Only the selected methods are integrated.
+active_methods = ['euler', 'heun', 'ral', 'rk3', 'rk4']
+# Methods drawn in the figures (subset of active_methods)
+plot_methods = ['euler', 'heun']
+
+tableaux = {
+    "euler": EULER,
+    "heun": HEUN,
+    "ral": RALSTON,
+    "rk3": RK3,
+    "rk4": RK4,
+}
+
+table_labels = {
+    "euler": "Euler",
+    "heun": "Heun/PC",
+    "ral": "RK2.2",
+    "rk3": "RK3",
+    "rk4": "RK4",
+}
+
+unknown = [m for m in active_methods if m not in tableaux]
+if unknown:
+    raise ValueError(f"Unknown method(s) in active_methods: {unknown}. Choose from: {', '.join(tableaux)}")
+
+num_steps = step_count(x0, xn, h)
+# backend from problems/ivp.py: 'python' steps all methods together with counted f calls
+compiled = str(backend).strip().lower() != 'python'
 
 # ---------------------------
-# Containers (all numerical method steps)
+# Containers (selected numerical methods), preallocated float64 buffers
 # ---------------------------
-x_vals = [x0]
+x_vals = x0 + h * np.arange(num_steps + 1)
 
-euler_y = [y0]
-heun_y  = [y0]
-ral_y  = [y0]
-rk3_y  = [y0]
-rk4_y  = [y0]
+series_y = {m: np.empty(num_steps + 1) for m in active_methods}
+for m in active_methods:
+    series_y[m][0] = y0
+
+# Each method calls its own counted copy of f
+counters = {m: CountedFunction(f) for m in active_methods}
+# f(x_n, y_n) per step: the first RK stage, kept for dense output
+derivs = {m: np.empty(num_steps + 1) for m in active_methods}
 
 # ---------------------------
 # Main loop: runs for a fixed number of steps up to xn
 # ---------------------------
-y_eu = y_he = y_ra = y_rk3 = y_rk = y0
-
-for step in range(num_steps):
-    x = x0 + step * h
-    x_next = x0 + (step + 1) * h
-
-    # Euler
-    y_eu = y_eu + h * f(x, y_eu)
-
-    # Heun
-    yp = y_he + h * f(x, y_he)
-    y_he = y_he + (h / 2) * (f(x, y_he) + f(x_next, yp))
-
-    # Ralston
-    k1 = h * f(x, y_ra)
-    k2 = h * f(x + 3*h/4, y_ra + 3*k1/4)
-    y_ra = y_ra + (1/3)*k1 + (2/3)*k2
-
-    # RK3 (Kutta's 3rd order)
-    k1 = h * f(x, y_rk3)
-    k2 = h * f(x + h/2, y_rk3 + k1/2)
-    k3 = h * f(x + h, y_rk3 - k1 + 2*k2)
-    y_rk3 = y_rk3 + (1/6)*(k1 + 4*k2 + k3)
-
-    # RK4
-    k1 = h * f(x, y_rk)
-    k2 = h * f(x + h/2, y_rk + k1/2)
-    k3 = h * f(x + h/2, y_rk + k2/2)
-    k4 = h * f(x + h,   y_rk + k3)
-    y_rk = y_rk + (1/6)*(k1 + 2*k2 + 2*k3 + k4)
-
-    x_vals.append(x_next)
-    euler_y.append(y_eu)
-    heun_y.append(y_he)
-    ral_y.append(y_ra)
-    rk3_y.append(y_rk3)
-    rk4_y.append(y_rk)
+if not compiled:
+    for step in range(num_steps):
+        x = x0 + step * h
+
+        # Each method is one Butcher tableau driven by the shared RK kernel
+        for m in active_methods:
+            y_m = series_y[m]
+            y_m[step + 1], k = rk_step(counters[m], tableaux[m], x, y_m[step], h)
+            derivs[m][step] = k[0]
+
+    for m in active_methods:
+        derivs[m][-1] = f(x_vals[-1], series_y[m][-1])
+else:
+    # Compiled backend: each method integrates its whole trajectory in one call, and
+    # the slopes for dense output are evaluated afterwards
+    for m in active_methods:
+        _, series_y[m][:] = integrate_fixed(f, x0, y0, h, num_steps, m, backend=backend)
+        derivs[m][:] = [f(x, y) for x, y in zip(x_vals, series_y[m])]
 
 # ---------------------------
 # Compute percent errors at checkpoints only
 # ---------------------------
 def pct_err(actual, approx):
-    if actual == 0:
-        return 0.0
-    return abs((actual - approx) / actual * 100)
+    actual = np.asarray(actual, dtype=float)
+    approx = np.asarray(approx, dtype=float)
+    safe_actual = np.where(actual == 0, 1.0, actual)
+    return np.where(actual == 0, 0.0, np.abs((actual - approx) / safe_actual * 100))
 
 has_actual = (
     isinstance(y_actual, list)
@@ -77,55 +96,41 @@ has_actual = (
 if has_actual:
     n_actual = len(y_actual)
     actual_spacing = (xn - x0) / (n_actual - 1)
-    actual_stride = max(1, round(actual_spacing / h))
     x_actual = [x0 + i * actual_spacing for i in range(n_actual)]
-    checkpoint_indices = [min(i * actual_stride, num_steps) for i in range(n_actual)]
-
-    euler_at_actual = [euler_y[idx] for idx in checkpoint_indices]
-    heun_at_actual = [heun_y[idx] for idx in checkpoint_indices]
-    ral_at_actual = [ral_y[idx] for idx in checkpoint_indices]
-    rk3_at_actual = [rk3_y[idx] for idx in checkpoint_indices]
-    rk4_at_actual = [rk4_y[idx] for idx in checkpoint_indices]
 
-    euler_e = [pct_err(y_actual[i], euler_at_actual[i]) for i in range(n_actual)]
-    heun_e = [pct_err(y_actual[i], heun_at_actual[i]) for i in range(n_actual)]
-    ral_e = [pct_err(y_actual[i], ral_at_actual[i]) for i in range(n_actual)]
-    rk3_e = [pct_err(y_actual[i], rk3_at_actual[i]) for i in range(n_actual)]
-    rk4_e = [pct_err(y_actual[i], rk4_at_actual[i]) for i in range(n_actual)]
+    # Dense output: interpolate each trajectory at the checkpoints, so h does
+    # not have to divide the checkpoint spacing (slopes reuse the first stages)
+    at_actual = {m: HermiteInterpolant(x_vals, series_y[m], derivs[m])(x_actual) for m in active_methods}
+    errors = {m: pct_err(y_actual, at_actual[m]) for m in active_methods}
 
     rows = []
     for i in range(n_actual):
-        rows.append((
-            i, x_actual[i], y_actual[i],
-            euler_at_actual[i], f"{euler_e[i]:.5f}%",
-            heun_at_actual[i], f"{heun_e[i]:.5f}%",
-            ral_at_actual[i], f"{ral_e[i]:.5f}%",
-            rk3_at_actual[i], f"{rk3_e[i]:.5f}%",
-            rk4_at_actual[i], f"{rk4_e[i]:.5f}%"
-        ))
-
-    headers = [
-        "n", "x", "y (actual)",
-        "Euler (y)", "Euler (error)",
-        "Heun/PC (y)", "Heun/PC (error)",
-        "RK2.2 (y)", "RK2.2 (error)",
-        "RK3 (y)", "RK3 (error)",
-        "RK4 (y)", "RK4 (error)"
-    ]
+        row = [i, x_actual[i], y_actual[i]]
+        for m in active_methods:
+            row.extend([at_actual[m][i], f"{errors[m][i]:.5f}%"])
+        rows.append(tuple(row))
+
+    headers = ["n", "x", "y (actual)"]
+    for m in active_methods:
+        headers.extend([f"{table_labels[m]} (y)", f"{table_labels[m]} (error)"])
 else:
     x_actual = None
     rows = []
     for i, x in enumerate(x_vals):
-        rows.append((
-            i, x, euler_y[i], heun_y[i], ral_y[i], rk3_y[i], rk4_y[i]
-        ))
-    headers = ["n", "x", "Euler (y)", "Heun/PC (y)", "RK2.2 (y)", "RK3 (y)", "RK4 (y)"]
+        rows.append(tuple([i, x] + [series_y[m][i] for m in active_methods]))
+    headers = ["n", "x"] + [f"{table_labels[m]} (y)" for m in active_methods]
 
 # Print console table
 print("Comparison of Numerical Methods")
 print_table(headers, rows)
 print_table_csv(headers, rows)
 
+if not compiled:
+    print("\nCost per method (f evaluations during integration)")
+    print_table(COST_HEADERS, cost_rows({table_labels[m]: counters[m] for m in active_methods}, num_steps))
+else:
+    print(f"\nIntegrated with backend '{backend}': f runs inside compiled code, so its calls are not counted.")
+
 # Write CSV file
 output_path = csv_path("output.csv")
 with open(output_path, mode="w", newline="") as f:
@@ -147,13 +152,15 @@ print(f"CSV file created: {output_path}")
 # Figure 1: y-values (all numerical steps + y_actual separately)
 # ---------------------------
 plt.figure(figsize=(10,6))
-methods = [
-    ("Euler",   euler_y, 'o-', 'blue'),
-    ("PC", heun_y,  's-', 'green'),
-    # ("RK2.2", ral_y,  '^-', 'orange'),
-    # ("RK3",   rk3_y,  'p-', 'purple'),
-    # ("RK4",   rk4_y,  'd-', 'red')
-]
+styles = {
+    "euler": ("Euler", 'o-', 'blue'),
+    "heun": ("PC", 's-', 'green'),
+    "ral": ("RK2.2", '^-', 'orange'),
+    "rk3": ("RK3", 'p-', 'purple'),
+    "rk4": ("RK4", 'd-', 'red'),
+}
+shown = [m for m in plot_methods if m in series_y]
+methods = [(styles[m][0], series_y[m], styles[m][1], styles[m][2]) for m in shown]
 
 for name, y_vals, style, color in methods:
     plt.plot(x_vals, y_vals, style, label=name, color=color, linewidth=0.8,
@@ -176,13 +183,7 @@ plt.show()
 # ---------------------------
 if has_actual:
     plt.figure(figsize=(10,6))
-    error_methods = [
-        ("Euler", euler_e, 'o', 'blue'),
-        ("PC", heun_e, 's', 'green'),
-        #("RK2.2", ral_e, '^', 'orange'),
-        #("RK3", rk3_e, 'p', 'purple'),
-        #("RK4", rk4_e, 'd', 'red')
-    ]
+    error_methods = [(styles[m][0], errors[m], styles[m][1][0], styles[m][2]) for m in shown]
 
     for name, e_vals, marker, color in error_methods:
         plt.scatter(x_actual, e_vals, marker=marker, label=name, color=color, zorder=5)
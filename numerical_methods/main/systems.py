@@ -1,5 +1,12 @@
 import csv
 
+import numpy as np
+
+from numerical_methods.integrators.dense import HermiteInterpolant
+from numerical_methods.integrators.instrument import COST_HEADERS, CountedFunction, cost_rows
+from numerical_methods.integrators.rk import rk_step, step_count
+from numerical_methods.integrators.systems import component_system
+from numerical_methods.integrators.tableaux import EULER, HEUN, RALSTON, RK3, RK4
 from numerical_methods.paths import csv_path
 from numerical_methods.problems.ivpsystems import f, g, h, t0, tn, x0, x_actual, y0, y_actual
 from numerical_methods.utils import print_table, print_table_csv
@@ -11,118 +18,64 @@ except Exception:
     HAS_MATPLOTLIB = False
 
 # Choose any subset from: euler, heun, ral, rk3, rk4
+# Only the selected methods are integrated.
 # active_methods = ['euler', 'heun', 'ral', 'rk3', 'rk4']
 active_methods = ['rk4']
 # ---------------------------
 # Time grid
 # ---------------------------
-num_steps = int(round((tn - t0) / h))
-t_vals = [t0]
-
-# ---------------------------
-# Containers (all numerical method steps)
-# ---------------------------
-euler_x = [x0]
-euler_y = [y0]
-
-heun_x = [x0]
-heun_y = [y0]
-
-ral_x = [x0]
-ral_y = [y0]
-
-rk3_x = [x0]
-rk3_y = [y0]
-
-rk4_x = [x0]
-rk4_y = [y0]
+num_steps = step_count(t0, tn, h)
+t_vals = t0 + h * np.arange(num_steps + 1)
 
 # ---------------------------
 # Main loop
 # ---------------------------
-x_eu = x_he = x_ra = x_rk3 = x_rk4 = x0
-y_eu = y_he = y_ra = y_rk3 = y_rk4 = y0
+# F(t, [x, y]) = [f, g] as one vector right-hand side
+rhs = component_system(f, g)
+
+tableaux = {
+    "euler": EULER,
+    "heun": HEUN,
+    "ral": RALSTON,
+    "rk3": RK3,
+    "rk4": RK4,
+}
+unknown = [m for m in active_methods if m not in tableaux]
+if unknown:
+    raise ValueError(f"Unknown method(s) in active_methods: {unknown}. Choose from: {', '.join(tableaux)}")
+
+# Each method integrates through its own counted copies of f and g
+counters = {m: [CountedFunction(f), CountedFunction(g)] for m in active_methods}
+counted_rhs = {m: component_system(*counters[m]) for m in active_methods}
+
+# Containers (selected numerical methods only): one preallocated (num_steps + 1, 2)
+# float64 buffer per method, columns [x, y]
+trajectories = {m: np.empty((num_steps + 1, 2)) for m in active_methods}
+# F(t_n, Y_n) per step: the first RK stage, kept for dense output
+derivs = {m: np.empty((num_steps + 1, 2)) for m in active_methods}
+for m in active_methods:
+    trajectories[m][0] = (x0, y0)
 
 for step in range(num_steps):
     t = t0 + step * h
-    t_next = t0 + (step + 1) * h
-
-    # Euler
-    kx = h * f(x_eu, y_eu, t)
-    ky = h * g(x_eu, y_eu, t)
-    x_eu = x_eu + kx
-    y_eu = y_eu + ky
-
-    # Heun
-    xp = x_he + h * f(x_he, y_he, t)
-    yp = y_he + h * g(x_he, y_he, t)
-    x_he = x_he + (h / 2) * (f(x_he, y_he, t) + f(xp, yp, t_next))
-    y_he = y_he + (h / 2) * (g(x_he, y_he, t) + g(xp, yp, t_next))
-
-    # Ralston (RK2.2)
-    k1x = h * f(x_ra, y_ra, t)
-    k1y = h * g(x_ra, y_ra, t)
-    k2x = h * f(x_ra + 3 * k1x / 4, y_ra + 3 * k1y / 4, t + 3 * h / 4)
-    k2y = h * g(x_ra + 3 * k1x / 4, y_ra + 3 * k1y / 4, t + 3 * h / 4)
-    x_ra = x_ra + (1 / 3) * k1x + (2 / 3) * k2x
-    y_ra = y_ra + (1 / 3) * k1y + (2 / 3) * k2y
-
-    # RK3 (Kutta's 3rd order)
-    k1x = h * f(x_rk3, y_rk3, t)
-    k1y = h * g(x_rk3, y_rk3, t)
-    k2x = h * f(x_rk3 + k1x / 2, y_rk3 + k1y / 2, t + h / 2)
-    k2y = h * g(x_rk3 + k1x / 2, y_rk3 + k1y / 2, t + h / 2)
-    k3x = h * f(x_rk3 - k1x + 2 * k2x, y_rk3 - k1y + 2 * k2y, t + h)
-    k3y = h * g(x_rk3 - k1x + 2 * k2x, y_rk3 - k1y + 2 * k2y, t + h)
-    x_rk3 = x_rk3 + (1 / 6) * (k1x + 4 * k2x + k3x)
-    y_rk3 = y_rk3 + (1 / 6) * (k1y + 4 * k2y + k3y)
-
-    # RK4
-    k1x = h * f(x_rk4, y_rk4, t)
-    k1y = h * g(x_rk4, y_rk4, t)
-    k2x = h * f(x_rk4 + k1x / 2, y_rk4 + k1y / 2, t + h / 2)
-    k2y = h * g(x_rk4 + k1x / 2, y_rk4 + k1y / 2, t + h / 2)
-    k3x = h * f(x_rk4 + k2x / 2, y_rk4 + k2y / 2, t + h / 2)
-    k3y = h * g(x_rk4 + k2x / 2, y_rk4 + k2y / 2, t + h / 2)
-    k4x = h * f(x_rk4 + k3x, y_rk4 + k3y, t_next)
-    k4y = h * g(x_rk4 + k3x, y_rk4 + k3y, t_next)
-    x_rk4 = x_rk4 + (1 / 6) * (k1x + 2 * k2x + 2 * k3x + k4x)
-    y_rk4 = y_rk4 + (1 / 6) * (k1y + 2 * k2y + 2 * k3y + k4y)
-
-    t_vals.append(t_next)
-    euler_x.append(x_eu)
-    euler_y.append(y_eu)
-    heun_x.append(x_he)
-    heun_y.append(y_he)
-    ral_x.append(x_ra)
-    ral_y.append(y_ra)
-    rk3_x.append(x_rk3)
-    rk3_y.append(y_rk3)
-    rk4_x.append(x_rk4)
-    rk4_y.append(y_rk4)
 
+    for m, traj in trajectories.items():
+        traj[step + 1], k = rk_step(counted_rhs[m], tableaux[m], t, traj[step], h)
+        derivs[m][step] = k[0]
 
-def pct_err(actual, approx):
-    if actual == 0:
-        return 0.0
-    return abs((actual - approx) / actual * 100)
+for m in active_methods:
+    derivs[m][-1] = rhs(t_vals[-1], trajectories[m][-1])
 
 
-series_x = {
-    "euler": euler_x,
-    "heun": heun_x,
-    "ral": ral_x,
-    "rk3": rk3_x,
-    "rk4": rk4_x,
-}
+def pct_err(actual, approx):
+    actual = np.asarray(actual, dtype=float)
+    approx = np.asarray(approx, dtype=float)
+    safe_actual = np.where(actual == 0, 1.0, actual)
+    return np.where(actual == 0, 0.0, np.abs((actual - approx) / safe_actual * 100))
 
-series_y = {
-    "euler": euler_y,
-    "heun": heun_y,
-    "ral": ral_y,
-    "rk3": rk3_y,
-    "rk4": rk4_y,
-}
+
+series_x = {m: traj[:, 0] for m, traj in trajectories.items()}
+series_y = {m: traj[:, 1] for m, traj in trajectories.items()}
 
 method_labels = {
     "euler": "Euler",
@@ -145,12 +98,20 @@ has_actual = (
 if has_actual:
     n_actual = len(x_actual)
     actual_spacing = (tn - t0) / (n_actual - 1)
-    actual_stride = max(1, round(actual_spacing / h))
     t_check = [t0 + i * actual_spacing for i in range(n_actual)]
-    indices = [i * actual_stride for i in range(n_actual)]
+
+    # Dense output: each method's solution at the checkpoints, interpolated from
+    # its trajectory so h does not have to divide the checkpoint spacing
+    check_x = {}
+    check_y = {}
+    for m in active_methods:
+        at_check = HermiteInterpolant(t_vals, trajectories[m], derivs[m])(t_check)
+        check_x[m] = at_check[:, 0]
+        check_y[m] = at_check[:, 1]
 else:
     t_check = t_vals
-    indices = list(range(len(t_vals)))
+    check_x = series_x
+    check_y = series_y
 
 # Step: validate whether actual arrays are truly usable for plotting.
 show_actual_in_plots = (
@@ -167,14 +128,14 @@ show_actual_in_plots = (
 if has_actual:
     rows_x = []
     rows_y = []
-    for i, idx in enumerate(indices):
+    err_x = {m: pct_err(x_actual, check_x[m]) for m in active_methods}
+    err_y = {m: pct_err(y_actual, check_y[m]) for m in active_methods}
+    for i in range(len(t_check)):
         row_x = [i, t_check[i], x_actual[i]]
         row_y = [i, t_check[i], y_actual[i]]
         for m in active_methods:
-            approx_x = series_x[m][idx]
-            approx_y = series_y[m][idx]
-            row_x.extend([approx_x, f"{pct_err(x_actual[i], approx_x):.5f}%"])
-            row_y.extend([approx_y, f"{pct_err(y_actual[i], approx_y):.5f}%"])
+            row_x.extend([check_x[m][i], f"{err_x[m][i]:.5f}%"])
+            row_y.extend([check_y[m][i], f"{err_y[m][i]:.5f}%"])
         rows_x.append(tuple(row_x))
         rows_y.append(tuple(row_y))
 
@@ -221,6 +182,9 @@ else:
     print_table(headers, rows)
     print_table_csv(headers, rows)
 
+print("\nCost per method (f and g evaluations during integration)")
+print_table(COST_HEADERS, cost_rows({method_labels[m]: counters[m] for m in active_methods}, num_steps))
+
 
 if HAS_MATPLOTLIB:
     # ---------------------------
@@ -301,7 +265,7 @@ if HAS_MATPLOTLIB:
     if show_actual_in_plots:
         plt.figure(figsize=(10, 6))
         for m in active_methods:
-            errs_x = [pct_err(x_actual[i], series_x[m][idx]) for i, idx in enumerate(indices)]
+            errs_x = pct_err(x_actual, check_x[m])
             marker = styles[m][0][0]
             color = styles[m][1]
             plt.scatter(t_check, errs_x, marker=marker, label=method_labels[m], color=color, zorder=5)
@@ -314,7 +278,7 @@ if HAS_MATPLOTLIB:
 
         plt.figure(figsize=(10, 6))
         for m in active_methods:
-            errs_y = [pct_err(y_actual[i], series_y[m][idx]) for i, idx in enumerate(indices)]
+            errs_y = pct_err(y_actual, check_y[m])
             marker = styles[m][0][0]
             color = styles[m][1]
             plt.scatter(t_check, errs_y, marker=marker, label=method_labels[m], color=color, zorder=5)
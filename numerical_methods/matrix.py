@@ -1,24 +1,487 @@
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
+
+STRUCTURES = ("auto", "general", "banded", "spd", "lower", "upper")
+# auto-detection picks the banded path while lower + upper < BANDED_FRACTION * n
+BANDED_FRACTION = 0.25
+# below this size the dense LAPACK solve is faster than any structured path
+SMALL_N = 16
 
-def matrixsolver(A, C):
+
+def matrixsolver(A, C, structure="auto", bands=None, cache=None):
     """
     Solves the linear system [A]{y} = {C} for the coefficient vector {y}.
 
     Parameters:
-        A : array-like, shape (n, n) — coefficient matrix
-        C : array-like, shape (n,)   — right-hand side vector
+        A         : array-like, shape (n, n) — coefficient matrix, or its band
+                    storage (see solve_banded) when structure='banded' and bands is given
+        C         : array-like, shape (n,)   — right-hand side vector
+        structure : 'auto' (detect), 'general' (LU), 'banded', 'spd' (Cholesky
+                    when factorized for reuse), 'lower' or 'upper' (triangular substitution)
+        bands     : (lower, upper) bandwidths for structure='banded'; detected when None
+        cache     : optional FactorizationCache; A is factorized only on a cache miss
+
+    Detection (structure='auto') checks for a narrow band (O(n*l*u) solve) and then
+    a triangular matrix (O(n^2)); anything else gets the dense LAPACK solve.  A
+    one-shot solve of an SPD matrix also goes to LAPACK, which is faster here than
+    np.linalg.cholesky plus two substitutions; Cholesky pays off once the factor
+    is reused (factorize(), cache).  Systems smaller than SMALL_N always use the
+    dense solve.
 
     Returns:
         y : numpy array of solution coefficients
+
+    Raises np.linalg.LinAlgError for a singular A, whichever path solves it.
     """
-    A = np.array(A, dtype=float)
-    C = np.array(C, dtype=float)
+    if cache is not None:
+        return cache.solve(A, C, structure, bands)
+    structure = _check_structure(structure)
+    A = np.asarray(A, dtype=float)
+    C = np.asarray(C, dtype=float)
+    if structure == "banded" and bands is not None:
+        return factorize(A, structure, bands).solve(C)
+    _check_square(A, C)
+
+    if structure == "auto":
+        # the symmetry test costs O(n^2) and only matters for factorizations kept for reuse
+        structure, bands = detect_structure(A, check_spd=False)
+    if structure not in ("general", "spd"):
+        return _factorize_square(A, structure, bands).solve(C)
+    # one-shot dense solve: LAPACK gesv beats factorize() + solve()
+    y = np.linalg.solve(A, C)
+    return y
+
+
+def _check_structure(structure):
+    structure = str(structure).strip().lower()
+    if structure not in STRUCTURES:
+        raise ValueError(f"Unknown structure '{structure}'. Choose one of: {', '.join(STRUCTURES)}")
+    return structure
+
 
+def _check_square(A, C=None):
     if A.ndim != 2 or A.shape[0] != A.shape[1]:
         raise ValueError(f"A must be a square matrix, got shape {A.shape}")
-    if C.ndim != 1 or C.shape[0] != A.shape[0]:
+    if C is not None and (C.ndim != 1 or C.shape[0] != A.shape[0]):
         raise ValueError(f"C must be a vector of length {A.shape[0]}, got shape {C.shape}")
 
-    y = np.linalg.solve(A, C)
-    return y
\ No newline at end of file
+
+def bandwidths(A):
+    """Number of nonzero sub- and super-diagonals (lower, upper) of a square matrix."""
+    nonzero = np.asarray(A) != 0
+    n = nonzero.shape[0]
+    rows = np.arange(n)
+    filled = nonzero.any(axis=1)
+    first = np.argmax(nonzero, axis=1)
+    last = n - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+    lower = int(np.max(rows - first, where=filled, initial=0))
+    upper = int(np.max(last - rows, where=filled, initial=0))
+    return lower, upper
+
+
+def detect_structure(A, check_spd=True):
+    """
+    Structure key factorize(structure='auto') uses for a square matrix A.
+
+    Returns (structure, bands) with bands = (lower, upper) for 'banded', else None.
+    check_spd=False skips the symmetry test and reports 'general' instead of
+    'spd' (matrixsolver does this for one-shot solves).
+    A zero on the diagonal (which includes any zero row or column, and every
+    singular triangular matrix) selects 'general', so degenerate matrices get
+    the pivoting LAPACK solve and its LinAlgError.
+    """
+    n = A.shape[0]
+    if n < SMALL_N or np.any(np.diagonal(A) == 0):
+        return "general", None
+    lower, upper = bandwidths(A)
+    if lower + upper < BANDED_FRACTION * n:
+        return "banded", (lower, upper)
+    if upper == 0:
+        return "lower", None
+    if lower == 0:
+        return "upper", None
+    if check_spd and np.allclose(A, A.T, rtol=1e-12, atol=0.0) and np.all(np.diagonal(A) > 0):
+        return "spd", None
+    return "general", None
+
+
+def to_banded(A, lower, upper):
+    """LAPACK band storage of a square matrix: ab[upper + i - j, j] = A[i, j].
+
+    Bandwidths of n or more are allowed; the diagonals beyond the matrix stay zero.
+    """
+    n = A.shape[0]
+    ab = np.zeros((lower + upper + 1, n))
+    for d in range(-min(lower, n - 1), min(upper, n - 1) + 1):
+        ab[upper - d, max(0, d):n + min(0, d)] = np.diagonal(A, d)
+    return ab
+
+
+def solve_triangular(T, C, lower=True, unit_diagonal=False):
+    """
+    Solves [T]{y} = {C} for a lower or upper triangular T by substitution in O(n^2).
+    Entries on the other side of the diagonal are ignored (and the diagonal too
+    when unit_diagonal=True, as for the L factor of an LU factorization).
+    C may hold several right-hand sides as columns.  The loops are JIT-compiled
+    with Numba when it is installed.
+    """
+    T = np.asarray(T, dtype=float)
+    C = np.asarray(C, dtype=float)
+    n = T.shape[0]
+    if not unit_diagonal and np.any(np.diagonal(T) == 0):
+        raise np.linalg.LinAlgError("Triangular matrix has a zero on the diagonal; the system is singular.")
+    b = C.reshape(n, -1).copy()
+    _dense_kernels()[0](T, b, lower, unit_diagonal)
+    return b.reshape(C.shape)
+
+
+def _triangular_solve(T, b, lower, unit_diagonal):
+    # Forward (lower) or back (upper) substitution, in place on b (shape (n, nrhs)).
+    # Reads T along its rows, so pass a C-contiguous T for speed.
+    n = T.shape[0]
+    for step in range(n):
+        i = step if lower else n - 1 - step
+        start = 0 if lower else i + 1
+        stop = i if lower else n
+        for r in range(b.shape[1]):
+            total = b[i, r]
+            for j in range(start, stop):
+                total -= T[i, j] * b[j, r]
+            b[i, r] = total if unit_diagonal else total / T[i, i]
+
+
+def _triangular_solve_rows(T, b, lower, unit_diagonal):
+    # NumPy fallback of _triangular_solve: one vectorized row product per step
+    n = T.shape[0]
+    order = range(n) if lower else range(n - 1, -1, -1)
+    for i in order:
+        known = slice(0, i) if lower else slice(i + 1, n)
+        total = b[i] - T[i, known] @ b[known]
+        b[i] = total if unit_diagonal else total / T[i, i]
+
+
+LU_BLOCK = 64  # panel width of the blocked dense LU
+
+
+def _lu_factor(A):
+    # Blocked dense LU with partial pivoting, P A = L U; L (unit diagonal) and U share one
+    # array and perm[i] is the row of A now at row i.  Each panel of LU_BLOCK columns is
+    # factorized by the compiled kernel, then the rest of the matrix is updated with one
+    # triangular solve and one matrix product, so most of the work runs in BLAS.
+    LU = np.array(A, dtype=float)
+    n = LU.shape[0]
+    perm = np.arange(n)
+    lu_panel = _dense_kernels()[1]
+    for k0 in range(0, n, LU_BLOCK):
+        k1 = min(k0 + LU_BLOCK, n)
+        singular_at = lu_panel(LU, perm, k0, k1)
+        if singular_at >= 0:
+            raise np.linalg.LinAlgError(f"Matrix is singular: zero pivot in column {singular_at}.")
+        if k1 < n:
+            LU[k0:k1, k1:] = solve_triangular(LU[k0:k1, k0:k1], LU[k0:k1, k1:], lower=True, unit_diagonal=True)
+            LU[k1:, k1:] -= LU[k1:, k0:k1] @ LU[k0:k1, k1:]
+    return LU, perm
+
+
+def _lu_panel(LU, perm, k0, k1):
+    # Partial-pivot LU of columns k0:k1 over all rows from k0 down, in place; row swaps
+    # move whole rows (and perm).  Returns the column of a zero pivot or -1.
+    n = LU.shape[0]
+    for k in range(k0, k1):
+        p = k
+        big = abs(LU[k, k])
+        for i in range(k + 1, n):
+            if abs(LU[i, k]) > big:
+                big = abs(LU[i, k])
+                p = i
+        if big == 0.0:
+            return k
+        if p != k:
+            for c in range(n):
+                tmp = LU[k, c]
+                LU[k, c] = LU[p, c]
+                LU[p, c] = tmp
+            tmp = perm[k]
+            perm[k] = perm[p]
+            perm[p] = tmp
+        pivot = LU[k, k]
+        for i in range(k + 1, n):
+            factor = LU[i, k] / pivot
+            LU[i, k] = factor
+            if factor != 0.0:
+                for c in range(k + 1, k1):
+                    LU[i, c] -= factor * LU[k, c]
+    return -1
+
+
+def _lu_panel_rows(LU, perm, k0, k1):
+    # NumPy fallback of _lu_panel: one rank-1 update of the panel per column
+    for k in range(k0, k1):
+        p = k + int(np.argmax(np.abs(LU[k:, k])))
+        if LU[p, k] == 0:
+            return k
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:k1] -= np.outer(LU[k + 1:, k], LU[k, k + 1:k1])
+    return -1
+
+
+def _banded_factor(abx, pivots, lower, upper):
+    # LU with partial pivoting in LAPACK gbtrf storage, A[i, j] = abx[lower + upper + i - j, j]
+    # (the first `lower` rows hold fill-in from row swaps).  Works in place: U ends up in
+    # rows 0..lower+upper, the multipliers of L below them, and pivots[j] is the row offset
+    # swapped with row j.  Returns the column of a zero pivot or -1.  Lower-triangular
+    # bands (upper = 0) are not pivoted, so they factorize as plain forward substitution.
+    n = abx.shape[1]
+    kv = lower + upper
+    for j in range(n):
+        km = min(lower, n - 1 - j)
+        p = 0
+        big = abs(abx[kv, j])
+        for i in range(1, km + 1 if upper > 0 else 1):
+            if abs(abx[kv + i, j]) > big:
+                big = abs(abx[kv + i, j])
+                p = i
+        pivots[j] = p
+        if big == 0.0:
+            return j
+        last = min(j + kv, n - 1)
+        if p:
+            for c in range(j, last + 1):
+                tmp = abx[kv + j - c, c]
+                abx[kv + j - c, c] = abx[kv + j + p - c, c]
+                abx[kv + j + p - c, c] = tmp
+        pivot = abx[kv, j]
+        for i in range(j + 1, j + km + 1):
+            factor = abx[kv + i - j, j] / pivot
+            abx[kv + i - j, j] = factor
+            if factor != 0.0:
+                for c in range(j + 1, last + 1):
+                    abx[kv + i - c, c] -= factor * abx[kv + j - c, c]
+    return -1
+
+
+def _banded_solve(abx, pivots, b, lower, upper):
+    # Solve with the output of _banded_factor, in place on b (shape (n, nrhs)).
+    n = abx.shape[1]
+    kv = lower + upper
+    for j in range(n):
+        p = pivots[j]
+        if p:
+            for r in range(b.shape[1]):
+                tmp = b[j, r]
+                b[j, r] = b[j + p, r]
+                b[j + p, r] = tmp
+        for i in range(j + 1, min(j + lower, n - 1) + 1):
+            factor = abx[kv + i - j, j]
+            if factor != 0.0:
+                for r in range(b.shape[1]):
+                    b[i, r] -= factor * b[j, r]
+    for k in range(n - 1, -1, -1):
+        for r in range(b.shape[1]):
+            total = b[k, r]
+            for c in range(k + 1, min(k + kv, n - 1) + 1):
+                total -= abx[kv + k - c, c] * b[c, r]
+            b[k, r] = total / abx[kv, k]
+
+
+_KERNELS = {}
+
+
+def _banded_kernels():
+    # Compiled on first use so importing this module never pays the Numba start-up cost.
+    if "banded" not in _KERNELS:
+        kernels = (_banded_factor, _banded_solve)
+        _KERNELS["banded"] = tuple(numba.njit(k) for k in kernels) if HAS_NUMBA else kernels
+    return _KERNELS["banded"]
+
+
+def _dense_kernels():
+    # As _banded_kernels; without Numba the O(n^2) loops fall back to NumPy row operations.
+    if "dense" not in _KERNELS:
+        if HAS_NUMBA:
+            _KERNELS["dense"] = (numba.njit(_triangular_solve), numba.njit(_lu_panel))
+        else:
+            _KERNELS["dense"] = (_triangular_solve_rows, _lu_panel_rows)
+    return _KERNELS["dense"]
+
+
+class Factorization:
+    """
+    A matrix factorized once, then reused to solve [A]{y} = {C} for many C.
+
+    kind: 'lu' (dense, partial pivoting), 'cholesky', 'banded' (band LU with
+    partial pivoting) or 'lower'/'upper' (triangular, kept as is).  Each solve
+    costs O(n^2) for the dense kinds and O(n * bandwidth) for 'banded'.
+    Build it with factorize().
+    """
+
+    def __init__(self, kind, factors, n):
+        self.kind = kind
+        self.factors = factors
+        self.n = n
+
+    def solve(self, C):
+        C = np.asarray(C, dtype=float)
+        if C.ndim not in (1, 2) or C.shape[0] != self.n:
+            raise ValueError(f"C must have {self.n} rows, got shape {C.shape}")
+        if self.kind == "lu":
+            LU, perm = self.factors
+            z = solve_triangular(LU, C[perm], lower=True, unit_diagonal=True)
+            return solve_triangular(LU, z, lower=False)
+        if self.kind == "cholesky":
+            L, U = self.factors
+            return solve_triangular(U, solve_triangular(L, C, lower=True), lower=False)
+        if self.kind == "banded":
+            abx, pivots, lower, upper = self.factors
+            b = C.reshape(self.n, -1).copy()
+            _banded_kernels()[1](abx, pivots, b, lower, upper)
+            return b.reshape(C.shape)
+        return solve_triangular(self.factors, C, lower=self.kind == "lower")
+
+
+def _factor_banded(ab, lower, upper):
+    if ab.ndim != 2 or ab.shape[0] != lower + upper + 1:
+        raise ValueError(f"ab must have shape ({lower + upper + 1}, n) for lower={lower}, upper={upper}, got {ab.shape}")
+    n = ab.shape[1]
+    abx = np.zeros((2 * lower + upper + 1, n))
+    abx[lower:] = ab
+    pivots = np.zeros(n, dtype=np.int64)
+    singular_at = _banded_kernels()[0](abx, pivots, lower, upper)
+    if singular_at >= 0:
+        raise np.linalg.LinAlgError(f"Banded matrix is singular: zero pivot in column {singular_at}.")
+    return Factorization("banded", (abx, pivots, lower, upper), n)
+
+
+def factorize(A, structure="auto", bands=None):
+    """
+    Factorizes A once for repeated solves; returns a Factorization.
+
+    structure and bands are as for matrixsolver: 'banded' gives a band LU,
+    'spd' a Cholesky factor (LU if A is not positive definite), 'lower'/'upper'
+    keep the triangle and 'general' a dense LU; 'auto' detects the structure.
+    Hints are trusted: 'spd' and 'lower'/'upper' only read one triangle of A.
+    """
+    structure = _check_structure(structure)
+    A = np.asarray(A, dtype=float)
+    if structure == "banded" and bands is not None:
+        lower, upper = bands
+        return _factor_banded(A, lower, upper)
+    _check_square(A)
+    if structure == "auto":
+        structure, bands = detect_structure(A)
+    return _factorize_square(A, structure, bands)
+
+
+def _factorize_square(A, structure, bands):
+    # A is a square matrix; bands, if given, are its bandwidths
+    if structure == "banded":
+        lower, upper = bandwidths(A) if bands is None else bands
+        return _factor_banded(to_banded(A, lower, upper), lower, upper)
+    if structure in ("lower", "upper"):
+        return Factorization(structure, A, A.shape[0])
+    if structure == "spd":
+        try:
+            L = np.linalg.cholesky(A)
+            # both triangles C-contiguous, so each substitution reads rows
+            return Factorization("cholesky", (L, np.ascontiguousarray(L.T)), A.shape[0])
+        except np.linalg.LinAlgError:
+            # symmetric but not positive definite
+            pass
+    # NumPy exposes no LU factors to reuse, so the blocked LU above computes them once
+    return Factorization("lu", _lu_factor(A), A.shape[0])
+
+
+class FactorizationCache:
+    """
+    Least-recently-used cache of factorizations for repeated solves with the same matrix.
+
+    key='identity' reuses a factorization while the same array object is passed
+    (do not modify it in place); key='content' hashes the matrix bytes, so equal
+    matrices built separately share one factorization.  At most maxsize
+    factorizations are kept; the least recently used one is evicted first.
+    hits, misses and evictions count the lookups.
+    """
+
+    KEYS = ("identity", "content")
+
+    def __init__(self, maxsize=8, key="identity"):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        key = str(key).strip().lower()
+        if key not in self.KEYS:
+            raise ValueError(f"Unknown cache key '{key}'. Choose one of: {', '.join(self.KEYS)}")
+        self.maxsize = maxsize
+        self.key = key
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _key(self, A, structure, bands):
+        options = (_check_structure(structure), None if bands is None else tuple(bands))
+        if self.key == "identity":
+            return (id(A),) + options
+        data = np.ascontiguousarray(A, dtype=float)
+        digest = hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+        return (data.shape, digest) + options
+
+    def get(self, A, structure="auto", bands=None):
+        """Factorization of A, computed on a miss and reused on later hits."""
+        key = self._key(A, structure, bands)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        factorization = factorize(A, structure, bands)
+        # identity keys hold on to A so its id cannot be reused by another array
+        self._entries[key] = (A if self.key == "identity" else None, factorization)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return factorization
+
+    def solve(self, A, C, structure="auto", bands=None):
+        return self.get(A, structure, bands).solve(C)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def solve_banded(ab, lower, upper, C):
+    """
+    Solves [A]{y} = {C} for a banded matrix A in O(n * lower * (lower + upper)) time.
+
+    Parameters:
+        ab    : array-like, shape (lower + upper + 1, n) — A in LAPACK band storage,
+                ab[upper + i - j, j] = A[i, j] (row ``upper`` is the main diagonal)
+        lower : number of sub-diagonals; upper : number of super-diagonals
+        C     : array-like, shape (n,) or (n, k) — right-hand side(s)
+
+    Like LAPACK gbsv, the LU factorization uses partial pivoting and keeps the
+    fill-in in ``lower`` extra rows.  For lower = upper = 1 on a diagonally
+    dominant matrix this is the Thomas algorithm.  The loops are JIT-compiled
+    with Numba when it is installed.  Use factorize(ab, 'banded', (lower, upper))
+    to keep the factors for further right-hand sides.
+
+    Returns:
+        y : numpy array with the shape of C
+    """
+    return _factor_banded(np.asarray(ab, dtype=float), lower, upper).solve(C)
@@ -1,3 +1,5 @@
+from numerical_methods.integrators.rk import iter_steps, step_count
+from numerical_methods.integrators.tableaux import EULER
 from numerical_methods.problems.ivp import f, h, x0, xn, y0  # , y_actual
 from numerical_methods.utils import print_table
 
@@ -7,11 +9,10 @@ y = y0
 rows =[]
 rows.append((0, x, y, 0))
 
-n = 0
-num_steps = int(round((xn - x0) / h))
-for n in range(1, num_steps + 1):
-    y = y + h * f(x, y)
-    x = x0 + n * h  # Recalculate x from x0 to avoid accumulation errors
+num_steps = step_count(x0, xn, h)
+for n, x, y, _ in iter_steps(f, x0, y0, h, num_steps, EULER):
+    if n == 0:
+        continue
     # True percent relative error
     #et = abs((y_actual[n] - y) / y_actual[n] * 100)
     #et_str = f"{et:.5f}"+"%" #just to make it 5 decimal places
@@ -1,3 +1,5 @@
+from numerical_methods.integrators.rk import rk_step, step_count
+from numerical_methods.integrators.tableaux import HEUN
 from numerical_methods.problems.ivp import f, h, x0, xn, y0  # , y_actual
 from numerical_methods.utils import print_table
 
@@ -13,17 +15,15 @@ area = w_t * yc
 area_total += area
 rows.append((0, x, "-", yc, w_t, area))
 #this includes a numerical method (trapezoidal rule) to calculate the area under the curve, which is an approximation of the integral of the function. The weight w_t is used to determine how much each point contributes to the total area, with the last point having a weight of 1 and all other points having a weight of 2.
-num_steps = int(round((xn - x0) / h))
+num_steps = step_count(x0, xn, h)
 for n in range(1, num_steps + 1):
-    # Predictor (Euler)
-    yp = yc + h * f(x, yc)
+    # Predictor (Euler) and corrector (Heun) share the stage k1 = f(x, yc)
+    yc_next, k = rk_step(f, HEUN, x, yc, h)
+    yp = yc + h * k[0]
 
     # Advance x
     x_next = x0 + n * h
 
-    # Corrector (Heun)
-    yc_next = yc + (h / 2) * (f(x, yc) + f(x_next, yp))
-
     x = x_next
     yc = yc_next
 
@@ -1,3 +1,8 @@
+import numpy as np
+
+from numerical_methods.integrators.rk import rk_step, step_count
+from numerical_methods.integrators.systems import component_system
+from numerical_methods.integrators.tableaux import HEUN
 from numerical_methods.problems.ivpshooting import f, g, h, t0, tn, x0, x_actual, y0, y_actual
 from numerical_methods.utils import print_table
 
@@ -7,7 +12,8 @@ yc = y0
 
 rows = []
 error_rows = []
-num_steps = int(round((tn - t0) / h))
+num_steps = step_count(t0, tn, h)
+F = component_system(f, g)
 has_actual = (
     isinstance(x_actual, list)
     and isinstance(y_actual, list)
@@ -31,16 +37,16 @@ else:
     rows.append((0, t, "-", "-", xc, yc))
 
 for n in range(1, num_steps + 1):
-    # Predictor (Euler)
-    xp = xc + h * f(xc, yc, t)
-    yp = yc + h * g(xc, yc, t)
+    # Predictor (Euler) and corrector (PC) on the state vector [x, y];
+    # both reuse the stage k1 = F(t, [xc, yc])
+    Yc = np.array([xc, yc])
+    Y_next, k = rk_step(F, HEUN, t, Yc, h)
+    xp, yp = Yc + h * k[0]
 
     # Advance t
     t_next = t0 + n * h
 
-    # Corrector PC
-    xc_next = xc + (h / 2) * (f(xc, yc, t) + f(xp, yp, t_next)) #xp is xc+hf
-    yc_next = yc + (h / 2) * (g(xc, yc, t) + g(xp, yp, t_next)) #xp is xc+hf
+    xc_next, yc_next = Y_next
 
     t = t_next
     xc = xc_next
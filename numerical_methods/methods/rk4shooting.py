@@ -1,3 +1,8 @@
+import numpy as np
+
+from numerical_methods.integrators.rk import rk_step
+from numerical_methods.integrators.systems import component_system
+from numerical_methods.integrators.tableaux import RK4
 from numerical_methods.problems.ivpshooting import f, g, h, t0, tn, x0, x_actual, y0, y_actual
 from numerical_methods.utils import print_table
 
@@ -33,26 +38,16 @@ if has_actual:
 else:
     rows.append((0, t0, 0, 0, 0, 0, 0, 0, 0, 0, x0, y0))
 
+F = component_system(f, g)
 x = x0
 y = y0
 for n in range(1, num_steps + 1):
     t = t0 + n*h
     t_prev = t0 + (n - 1)*h
 
-    k1x = h * f(x, y, t_prev)
-    k1y = h * g(x, y, t_prev)
-
-    k2x = h * f(x + 0.5*k1x, y + 0.5*k1y, t_prev + 0.5*h)
-    k2y = h * g(x + 0.5*k1x, y + 0.5*k1y, t_prev + 0.5*h)
-
-    k3x = h * f(x + 0.5*k2x, y + 0.5*k2y, t_prev + 0.5*h)
-    k3y = h * g(x + 0.5*k2x, y + 0.5*k2y, t_prev + 0.5*h)
-
-    k4x = h * f(x + k3x, y + k3y, t)
-    k4y = h * g(x + k3x, y + k3y, t)
-
-    x = x + (1 / 6) * (k1x + 2*k2x + 2*k3x + k4x)
-    y = y + (1 / 6) * (k1y + 2*k2y + 2*k3y + k4y)
+    # One RK4 step on the state vector [x, y]; k_i holds both components of stage i
+    (x, y), k = rk_step(F, RK4, t_prev, np.array([x, y]), h)
+    (k1x, k1y), (k2x, k2y), (k3x, k3y), (k4x, k4y) = (h * k_i for k_i in k)
 
     if has_actual:
         ex = pct_err(x_actual[n], x)
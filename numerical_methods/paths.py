@@ -19,3 +19,8 @@ def csv_path(filename: str) -> Path:
     CSV_DIR.mkdir(parents=True, exist_ok=True)
     return CSV_DIR / filename
 
+
+
+def report_path(filename: str) -> Path:
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    return REPORTS_DIR / filename
@@ -3,6 +3,11 @@ import math
 def f(x,y):
     return math.sqrt(x) * math.sin(2*x) - 5*y
 
+# Alternative: define f as an expression string. It is compiled to a NumPy kernel that
+# accepts arrays, and f.jac (df/dy) is derived analytically for the implicit methods.
+# from numerical_methods.integrators.kernels import expression_rhs
+# f = expression_rhs("sqrt(x) * sin(2*x) - 5*y")
+
 #initial conditions
 x0 = 0
 y0 = 0
@@ -18,10 +23,30 @@ h=0.3/(2**m) #m-refinement
 
 
 # Numerical method and polynomial degree for approximation
-method = 'heun'  # Choose: euler, heun, rk22, rk3, rk4
+method = 'heun'  # Choose: euler, heun, rk22, rk3, rk4 (explicit), backward_euler, trapezoidal, bdf2 (implicit) or ab2-ab5, abm2-abm5 (multistep)
 p = 10  # Polynomial degree for Vandermonde and Lagrange fits
 ls_methods = ['euler', 'heun']  # Methods to compare in least-squares fitting
 
+# Adaptive step-size control (used by compute_adaptive and main/adaptive.py)
+adaptive_method = 'dp54'  # Choose: heun_euler, bs32, dp54
+rtol = 1e-6
+atol = 1e-9
+
+# Event for main/events.py: integration stops at the first root of event(x, y)
+def event(x, y):
+    return y  # y crosses zero
+event.direction = -1  # 1: only upward crossings, -1: only downward, 0: both
+event.terminal = True  # False: record every root and integrate to xn
+
+# Integration backend for the explicit methods: 'python' or 'numba'
+# ('numba' JIT-compiles f and the step loop; falls back to 'python' if Numba is missing or f does not compile)
+backend = 'python'
+
+# Optional Jacobian df/dy for the implicit methods (finite differences are used when None)
+# def jac(x, y):
+#     return -5
+jac = getattr(f, "jac", None)  # analytic df/dy when f comes from expression_rhs
+
 #actual solution to calculate error
 
 def y_actual_func(x):
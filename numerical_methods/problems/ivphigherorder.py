@@ -42,6 +42,15 @@ h = 0.3
 n = 5  # change this for n-refinement
 h = (xn / (n - 1))  # n-refinement
 
+# Boundary options for fd/FDMhigherorder.py (any number of grid points n).
+# Each end takes None, one condition, or a list of two (same format as bvpfea1d.py):
+#   {"type": "dirichlet", "value": ...}              y at that end
+#   {"type": "neumann", "value": ..., "option": 3}   y' at that end, discretized with
+#       option 1: (y1 - y0)/h,  2: central difference with a ghost node,  3: (-3y0 + 4y1 - y2)/(2h)
+# One condition per end is a two-point BVP (tridiagonal system); both at one end marches it as an IVP.
+left_bc = [{"type": "dirichlet", "value": y0}, {"type": "neumann", "value": dy0, "option": 3}]
+right_bc = None
+
 # approximating
 method = 'fdm' #fdm, reduction
 
@@ -48,6 +48,18 @@ y0 = gamma1 #edit this per trial
 # gamma3 = 3.4774259999999995
 
 
+# Automatic shooting (main/shooting.py): solves for gamma instead of the manual trials above.
+# The unknown initial value and the component that must equal beta at xn, each 'y' or 'z'.
+auto_shoot = False
+shoot_unknown = 'y'  # gamma is y(x0) here; use 'z' when gamma is the initial slope y'(x0)
+shoot_target = 'y'   # y(xn) = beta
+shoot_solver = 'secant'  # secant or newton (nonlinear problems)
+linear = None  # True: superpose two trials (exact for linear ODEs), False: iterate, None: detect
+shoot_tol = 1e-8  # |value at xn - beta|; trials start from gamma1 and gamma2, integrated with `method`
+# Multiple shooting (main/multiple_shooting.py): [x0, xn] split into segments integrated in parallel
+segments = 4
+shoot_workers = None  # process-pool size (None: one per CPU, 1: serial)
+
 # Normalizing:
 t0 = x0
 tn = xn
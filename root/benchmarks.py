@@ -0,0 +1,10 @@
+"""Wrapper entrypoint for the microbenchmark suite.
+
+Prefer: python -m numerical_methods.benchmarks.run [quick|full] [group ...]
+"""
+
+from _root_bootstrap import run
+
+
+if __name__ == "__main__":
+    run("numerical_methods.benchmarks.run")
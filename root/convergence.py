@@ -0,0 +1,10 @@
+"""Wrapper entrypoint for the convergence-order study.
+
+Prefer: python -m numerical_methods.experiments.convergence
+"""
+
+from _root_bootstrap import run
+
+
+if __name__ == "__main__":
+    run("numerical_methods.experiments.convergence")
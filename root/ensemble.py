@@ -0,0 +1,10 @@
+"""Wrapper entrypoint for the batched initial-condition sweep.
+
+Prefer: python -m numerical_methods.main.ensemble
+"""
+
+from _root_bootstrap import run
+
+
+if __name__ == "__main__":
+    run("numerical_methods.main.ensemble")
@@ -0,0 +1,10 @@
+"""Wrapper entrypoint for the event-detection driver.
+
+Prefer: python -m numerical_methods.main.events
+"""
+
+from _root_bootstrap import run
+
+
+if __name__ == "__main__":
+    run("numerical_methods.main.events")
@@ -0,0 +1,10 @@
+"""Wrapper entrypoint for the extrapolation driver.
+
+Prefer: python -m numerical_methods.main.extrapolation
+"""
+
+from _root_bootstrap import run
+
+
+if __name__ == "__main__":
+    run("numerical_methods.main.extrapolation")
@@ -0,0 +1,10 @@
+"""Wrapper entrypoint for the JIT backend benchmark.
+
+Prefer: python -m numerical_methods.experiments.jit_benchmark
+"""
+
+from _root_bootstrap import run
+
+
+if __name__ == "__main__":
+    run("numerical_methods.experiments.jit_benchmark")
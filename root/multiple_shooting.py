@@ -0,0 +1,10 @@
+"""Wrapper entrypoint for the multiple shooting driver.
+
+Prefer: python -m numerical_methods.main.multiple_shooting
+"""
+
+from _root_bootstrap import run
+
+
+if __name__ == "__main__":
+    run("numerical_methods.main.multiple_shooting")
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from numerical_methods.fea import fea1d
+from numerical_methods.fea.fea1d import BoundaryCondition
+
+
+@pytest.mark.parametrize(
+    "left_bc, right_bc",
+    [
+        (BoundaryCondition("dirichlet", 1.0), BoundaryCondition("dirichlet", -2.0)),
+        (BoundaryCondition("neumann", 0.5), BoundaryCondition("dirichlet", 2.0)),
+        (BoundaryCondition("dirichlet", 1.0), BoundaryCondition("neumann", -0.3)),
+    ],
+)
+def test_banded_solve_matches_dense(left_bc, right_bc):
+    nodes = np.sort(np.r_[0.0, np.random.default_rng(0).random(30), 1.0])
+    K, F, _ = fea1d._assemble_system(nodes, None)
+    Kb, Fb, _ = fea1d._assemble_system(nodes, None, banded=True)
+    F = fea1d._apply_neumann_bc(F, left_bc, right_bc)
+    Fb = fea1d._apply_neumann_bc(Fb, left_bc, right_bc)
+
+    dense = fea1d._reduce_and_solve(K, F, left_bc, right_bc)
+    band = fea1d._reduce_and_solve(Kb, Fb, left_bc, right_bc, banded=True)
+
+    np.testing.assert_allclose(band["solution"], dense["solution"], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(
+        fea1d._compute_reactions(Kb, Fb, band["solution"], banded=True),
+        fea1d._compute_reactions(K, F, dense["solution"]),
+        atol=1e-9,
+    )
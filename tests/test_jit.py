@@ -0,0 +1,25 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from numerical_methods.integrators.jit import integrate_backend
+from numerical_methods.integrators.rk import integrate
+
+
+def _decay_with_local_import(t, y):
+    # the local import is bytecode Numba rejects (UnsupportedBytecodeError, not a NumbaError)
+    import random
+
+    return -y + 0.0 * random.random()
+
+
+def test_uncompilable_f_falls_back_to_python():
+    with pytest.warns(RuntimeWarning, match="Could not JIT-compile f"):
+        ts, ys = integrate_backend(_decay_with_local_import, 0.0, 1.0, 0.1, 10, "rk4", "numba")
+    ts_ref, ys_ref = integrate(_decay_with_local_import, 0.0, 1.0, 0.1, 10, "rk4")
+    np.testing.assert_allclose(ts, ts_ref)
+    np.testing.assert_allclose(ys, ys_ref)
+    assert ys[-1] == pytest.approx(math.exp(-1.0), rel=1e-5)
@@ -0,0 +1,39 @@
+import math
+
+import numpy as np
+
+from numerical_methods.integrators.ensemble import integrate_ensemble
+from numerical_methods.integrators.kernels import vectorize_math
+from numerical_methods.integrators.rk import integrate
+
+
+def _make_rhs(rate, amp):
+    def f(t, y):
+        return amp * math.sin(t) - rate * y
+
+    return f
+
+
+def test_vectorize_math_keeps_closure_variables():
+    f = _make_rhs(5.0, 2.0)
+    y = np.array([1.0, 2.0])
+    np.testing.assert_allclose(vectorize_math(f)(0.3, y), [f(0.3, value) for value in y])
+
+
+def test_vectorize_math_sees_nonlocal_rebinding():
+    scale = 1.0
+
+    def f(t, y):
+        return -scale * math.exp(t) * y
+
+    vectorized = vectorize_math(f)
+    scale = 3.0
+    np.testing.assert_allclose(vectorized(0.0, np.array([1.0])), [-3.0])
+
+
+def test_ensemble_falls_back_for_closure_rhs():
+    f = _make_rhs(5.0, 2.0)
+    _, ys = integrate_ensemble(f, 0.0, [0.0, 1.0], 0.1, 10, "rk4")
+    for member, y0 in enumerate([0.0, 1.0]):
+        _, ys_ref = integrate(f, 0.0, y0, 0.1, 10, "rk4")
+        np.testing.assert_allclose(ys[:, member], ys_ref)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from numerical_methods.matrix import FactorizationCache, detect_structure, factorize, matrixsolver, solve_banded, to_banded
+
+
+N = 40
+
+
+def test_degenerate_matrices_are_detected_as_general():
+    assert detect_structure(np.zeros((N, N))) == ("general", None)
+    lower = np.tril(np.ones((N, N)))
+    lower[5, 5] = 0.0
+    assert detect_structure(lower) == ("general", None)
+
+
+def test_singular_systems_raise_linalg_error():
+    with pytest.raises(np.linalg.LinAlgError):
+        matrixsolver(np.zeros((N, N)), np.ones(N))
+    with pytest.raises(np.linalg.LinAlgError):
+        solve_banded(np.zeros((3, N)), 1, 1, np.ones(N))
+    lower = np.tril(np.ones((N, N)))
+    lower[5, 5] = 0.0
+    with pytest.raises(np.linalg.LinAlgError):
+        factorize(lower, "lower").solve(np.ones(N))
+
+
+def test_triangular_and_cholesky_solves_match_numpy():
+    rng = np.random.default_rng(1)
+    M = rng.random((N, N))
+    spd = M @ M.T + N * np.eye(N)
+    C = rng.random((N, 3))
+    factorization = factorize(spd)
+    assert factorization.kind == "cholesky"
+    np.testing.assert_allclose(factorization.solve(C), np.linalg.solve(spd, C), rtol=1e-10)
+    np.testing.assert_allclose(matrixsolver(spd, C[:, 0]), np.linalg.solve(spd, C[:, 0]), rtol=1e-10)
+
+    lower = np.tril(M) + N * np.eye(N)
+    np.testing.assert_allclose(factorize(lower, "lower").solve(C), np.linalg.solve(lower, C), rtol=1e-10)
+
+
+def test_general_factorization_is_reused():
+    rng = np.random.default_rng(2)
+    n = 3 * N
+    A = rng.random((n, n))
+    C = rng.random((n, 2))
+    factorization = factorize(A)
+    assert factorization.kind == "lu"
+    np.testing.assert_allclose(factorization.solve(C), np.linalg.solve(A, C), rtol=1e-9)
+
+    cache = FactorizationCache()
+    for _ in range(3):
+        np.testing.assert_allclose(matrixsolver(A, C[:, 0], cache=cache), np.linalg.solve(A, C[:, 0]), rtol=1e-9)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_bandwidths_beyond_the_matrix_size():
+    rng = np.random.default_rng(3)
+    A = rng.random((5, 5)) + 5 * np.eye(5)
+    C = rng.random(5)
+    ab = to_banded(A, 6, 7)
+    assert ab.shape == (14, 5)
+    np.testing.assert_allclose(solve_banded(ab, 6, 7, C), np.linalg.solve(A, C), rtol=1e-12)
+    np.testing.assert_allclose(matrixsolver(ab, C, structure="banded", bands=(6, 7)), np.linalg.solve(A, C), rtol=1e-12)